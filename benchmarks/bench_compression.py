@@ -0,0 +1,62 @@
+"""Load time of PokemonDatabase against on-disk size of plain and
+compressed (gzip, bz2, xz) pokemon.json files in v1 and v2 formats.
+
+Run from repository root: python -m benchmarks.bench_compression
+"""
+import argparse
+import json
+import os
+import tempfile
+from time import perf_counter
+from database import PokemonDatabase
+from model_io import (
+    open_json_file,
+    read_from_json,
+    write_to_json_v2,
+    COMPRESSED_FILE_OPENERS
+)
+
+
+def measure_load(path: str, repeats: int) -> float:
+    best_time = None
+    for _ in range(repeats):
+        start = perf_counter()
+        PokemonDatabase(path, use_snapshot=False)
+        elapsed = perf_counter() - start
+        best_time = elapsed if best_time is None else min(best_time, elapsed)
+    return best_time
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split('\n')[0])
+    parser.add_argument('--path', default='pokemon.json')
+    parser.add_argument('--copies', type=int, default=10,
+                        help='how many times rows of given file are repeated')
+    parser.add_argument('--repeats', type=int, default=3)
+    args = parser.parse_args()
+
+    with open(args.path, 'r') as file_hantle:
+        rows = json.load(file_hantle) * args.copies
+    with open(args.path, 'r') as file_hantle:
+        pokemons = read_from_json(file_hantle) * args.copies
+    print('rows: {}'.format(len(rows)))
+    print('{:<22} {:>12} {:>12}'.format('file', 'size [kB]', 'load [ms]'))
+    with tempfile.TemporaryDirectory() as directory:
+        for extension in ('',) + tuple(COMPRESSED_FILE_OPENERS):
+            for name, write in (
+                        ('pokemon.json', lambda f: json.dump(rows, f)),
+                        ('pokemon_v2.json',
+                         lambda f: write_to_json_v2(pokemons, f))
+                    ):
+                path = os.path.join(directory, name + extension)
+                with open_json_file(path, 'w') as file_hantle:
+                    write(file_hantle)
+                print('{:<22} {:>12.1f} {:>12.1f}'.format(
+                    name + extension,
+                    os.path.getsize(path) / 1024,
+                    measure_load(path, args.repeats) * 1000
+                    ))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,103 @@
+"""Rows per second and peak memory of reference csv conversion: old
+pipeline of reference/database_convertion.py (reformatted csv, cleaned
+csv, then pokemon.json) against streaming single-pass convert_reference_csv
+in every output format, on reference csv with rows repeated under new
+pokedex numbers.
+
+Run from repository root: python -m benchmarks.bench_conversion
+"""
+import argparse
+import csv
+import io
+import os
+import tempfile
+import tracemalloc
+from time import perf_counter
+from model_csv import _quote_abilities_column
+from reference.database_convertion import (
+    convert_reference_csv,
+    read_from_csv,
+    reformat_csv,
+    write_from_csv_to_json,
+    write_to_csv,
+    OUTPUT_FORMATS
+)
+
+
+def write_large_csv(source_path: str, target_path: str, copies: int) -> int:
+    """ Writes rows of given reference csv file copies times, with pokedex
+    numbers continued after last row, in reference csv layout (bracketed
+    abilities column is not quoted).
+    """
+    with open(source_path, 'r', encoding='utf-8-sig', newline='') as file:
+        header, *lines = file.read().splitlines(keepends=True)
+    number_column = header.rstrip('\r\n').split(',').index('pokedex_number')
+    rows = []
+    for line in lines:
+        abilities, rest = _quote_abilities_column(line).split('",', 1)
+        rows.append((abilities[1:], next(csv.reader([rest]))))
+    with open(target_path, 'w', encoding='utf-8-sig', newline='') as file:
+        file.write(header)
+        number = 0
+        for _ in range(copies):
+            for abilities, fields in rows:
+                number += 1
+                fields[number_column - 1] = str(number)
+                rest = io.StringIO()
+                csv.writer(rest, lineterminator='\r\n').writerow(fields)
+                file.write(abilities + ',' + rest.getvalue())
+    return number
+
+
+def convert_legacy(source_path: str, target_path: str) -> None:
+    directory = os.path.dirname(target_path)
+    reformatted = os.path.join(directory, 'reformatted.csv')
+    cleaned = os.path.join(directory, 'cleaned.csv')
+    reformat_csv(source_path, reformatted)
+    write_to_csv(cleaned, read_from_csv(reformatted))
+    write_from_csv_to_json(target_path, cleaned)
+
+
+def measure(function) -> tuple[float, int]:
+    # Time and peak memory are measured in separate runs, as tracemalloc
+    # slows conversion down several times.
+    start = perf_counter()
+    function()
+    elapsed = perf_counter() - start
+    tracemalloc.start()
+    function()
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return elapsed, peak
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split('\n')[0])
+    parser.add_argument('--path', default='reference/pokemon.csv')
+    parser.add_argument('--copies', type=int, default=125,
+                        help='how many times rows of given file are repeated')
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as directory:
+        source = os.path.join(directory, 'large.csv')
+        rows = write_large_csv(args.path, source, args.copies)
+        size = os.path.getsize(source) / 2 ** 20
+        print('rows: {}, csv: {:.1f} MiB'.format(rows, size))
+        target = os.path.join(directory, 'target')
+        cases = [('old pipeline (v1)',
+                  lambda: convert_legacy(source, target))]
+        cases.extend(
+            ('streaming ({})'.format(output_format),
+             lambda output_format=output_format: convert_reference_csv(
+                 source, target, output_format))
+            for output_format in OUTPUT_FORMATS
+            )
+        for name, function in cases:
+            elapsed, peak = measure(function)
+            print('{:<20} {:>9.0f} rows/s {:>7.1f} MiB/s  peak {:>7.1f} '
+                  'MiB'.format(name, rows / elapsed, size / elapsed,
+                               peak / 2 ** 20))
+
+
+if __name__ == '__main__':
+    main()
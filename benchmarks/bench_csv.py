@@ -0,0 +1,69 @@
+"""Rows per second of reference csv ingest: columnar conversion
+(model_csv.read_from_reference_csv) against checking csv rows one at
+a time and against the old csv -> pokemon.json -> read_from_json pipeline.
+
+Run from repository root: python -m benchmarks.bench_csv
+"""
+import argparse
+import io
+import json
+from time import perf_counter
+from model_csv import (
+    iter_reference_csv_rows,
+    read_from_reference_csv,
+    _read_reference_csv_table,
+    _read_pokemons_by_rows
+)
+from model_io import read_from_json
+
+
+def read_by_rows(content: str) -> None:
+    _read_pokemons_by_rows(
+        *_read_reference_csv_table(io.StringIO(content, newline=''))
+        )
+
+
+def read_through_json(content: str) -> None:
+    rows = list(iter_reference_csv_rows(io.StringIO(content, newline='')))
+    read_from_json(io.StringIO(json.dumps(rows)))
+
+
+def read_columnar(content: str) -> None:
+    read_from_reference_csv(io.StringIO(content, newline=''))
+
+
+def measure_rows_per_second(read, content: str, rows: int,
+                            repeats: int) -> float:
+    best_time = None
+    for _ in range(repeats):
+        start = perf_counter()
+        read(content)
+        elapsed = perf_counter() - start
+        best_time = elapsed if best_time is None else min(best_time, elapsed)
+    return rows / best_time
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split('\n')[0])
+    parser.add_argument('--path', default='reference/pokemon.csv')
+    parser.add_argument('--copies', type=int, default=10,
+                        help='how many times rows of given file are repeated')
+    parser.add_argument('--repeats', type=int, default=5)
+    args = parser.parse_args()
+
+    with open(args.path, 'r', encoding='utf-8-sig', newline='') as file:
+        header, *lines = file.read().splitlines(keepends=True)
+    content = header + ''.join(lines * args.copies)
+    rows = len(lines) * args.copies
+    print('rows: {}'.format(rows))
+    for name, read in (('csv -> json -> read_from_json', read_through_json),
+                       ('csv rows one at a time', read_by_rows),
+                       ('columnar csv', read_columnar)):
+        print('{:<30} {:>10.0f} rows/s'.format(
+            name,
+            measure_rows_per_second(read, content, rows, args.repeats)
+            ))
+
+
+if __name__ == '__main__':
+    main()
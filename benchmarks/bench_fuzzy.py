@@ -0,0 +1,124 @@
+"""Latency of fuzzy name search: BK-tree of names (see database_index)
+against computing edit distance to every name, with dynamic programming
+table and with bit vectors used by the tree, on real dex and on
+synthetic names (see model_synthetic). Queries are names with one or
+two random typos.
+
+Run from repository root: python -m benchmarks.bench_fuzzy
+"""
+import argparse
+import random
+import string
+from time import perf_counter
+from database import PokemonDatabase
+from database_index import (
+    FUZZY_MAX_DISTANCE,
+    FUZZY_RESULT_COUNT,
+    NameBKTree,
+    fold_name,
+    get_edit_distance
+)
+from model_synthetic import iter_synthetic_names
+
+
+def get_table_edit_distance(text: str, other_text: str) -> int:
+    previous_row = list(range(len(other_text) + 1))
+    for row, char in enumerate(text, 1):
+        current_row = [row]
+        for column, other_char in enumerate(other_text, 1):
+            current_row.append(min(
+                previous_row[column] + 1,
+                current_row[column - 1] + 1,
+                previous_row[column - 1] + (char != other_char)
+                ))
+        previous_row = current_row
+    return previous_row[-1]
+
+
+def scan_names(names: list[str], name: str,
+               edit_distance=get_edit_distance) -> list[int]:
+    name = fold_name(name)
+    distances = sorted(
+        (distance, position)
+        for position, distance in enumerate(
+            edit_distance(name, other) for other in names
+            )
+        if distance <= FUZZY_MAX_DISTANCE
+    )
+    return [position for distance, position in distances[
+        :FUZZY_RESULT_COUNT]]
+
+
+def get_misspelled_queries(names: list[str], count: int, seed: int
+                           ) -> list[str]:
+    rng = random.Random(seed)
+    queries = []
+    for name in rng.sample(names, count):
+        for _ in range(rng.randint(1, 2)):
+            position = rng.randrange(len(name))
+            edit = rng.choice(('insert', 'delete', 'replace'))
+            char = rng.choice(string.ascii_lowercase)
+            if edit == 'insert':
+                name = name[:position] + char + name[position:]
+            elif edit == 'delete' and len(name) > 1:
+                name = name[:position] + name[position + 1:]
+            else:
+                name = name[:position] + char + name[position + 1:]
+        queries.append(name)
+    return queries
+
+
+def measure_latencies(search, queries: list[str]) -> tuple[float, float]:
+    latencies = []
+    for query in queries:
+        start = perf_counter()
+        search(query)
+        latencies.append(perf_counter() - start)
+    latencies.sort()
+    return latencies[len(latencies) // 2], latencies[-1]
+
+
+def report(label: str, search, queries: list[str]) -> None:
+    median, worst = measure_latencies(search, queries)
+    print('  {:<24} median {:>9.3f} ms, max {:>9.3f} ms'.format(
+        label, median * 1000, worst * 1000))
+
+
+def compare(label: str, names: list[str], queries: list[str]) -> None:
+    names = [fold_name(name) for name in names]
+    start = perf_counter()
+    tree = NameBKTree(names)
+    build_time = perf_counter() - start
+    print('{} ({} names, {} queries), tree built in {:.2f} s'.format(
+        label, len(names), len(queries), build_time))
+    report('table scan', lambda query: scan_names(
+        names, query, get_table_edit_distance), queries[:5])
+    report('bit vector scan',
+           lambda query: scan_names(names, query), queries[:20])
+    report('BK-tree', tree.search, queries)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split('\n')[0])
+    parser.add_argument('--path', default='pokemon.json')
+    parser.add_argument('--synthetic', type=int, default=100000,
+                        help='number of synthetic names')
+    parser.add_argument('--queries', type=int, default=200)
+    parser.add_argument('--seed', type=int, default=0)
+    args = parser.parse_args()
+
+    database = PokemonDatabase(args.path)
+    names = [pokemon.get_name()
+             for pokemon in database.get_pokemon_database_list()]
+    compare(args.path, names,
+            get_misspelled_queries(names, args.queries, args.seed))
+
+    synthetic_names = list(iter_synthetic_names(
+        names, args.synthetic, args.seed
+        ))
+    compare('synthetic', synthetic_names,
+            get_misspelled_queries(synthetic_names, args.queries, args.seed))
+
+
+if __name__ == '__main__':
+    main()
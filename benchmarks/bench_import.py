@@ -0,0 +1,47 @@
+"""Import time of data layer (database, model_io, classes) in fresh
+interpreter, compared with import of pygame_objects, which database
+imported at module level before.
+
+Run from repository root: python -m benchmarks.bench_import
+"""
+import argparse
+import subprocess
+import sys
+
+
+_MEASURE_CODE = '''
+from time import perf_counter
+start = perf_counter()
+import {}
+elapsed = perf_counter() - start
+import sys
+print(elapsed, 'pygame' in sys.modules)
+'''
+
+
+def measure_import(modules: str, repeats: int) -> tuple[float, bool]:
+    best_time = None
+    for _ in range(repeats):
+        output = subprocess.run(
+            [sys.executable, '-c', _MEASURE_CODE.format(modules)],
+            capture_output=True, text=True, check=True
+            ).stdout.split()
+        elapsed = float(output[-2])
+        best_time = elapsed if best_time is None else min(best_time, elapsed)
+    return best_time, output[-1] == 'True'
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split('\n')[0])
+    parser.add_argument('--repeats', type=int, default=5)
+    args = parser.parse_args()
+
+    for modules in ('classes, model_io', 'database',
+                    'database, pygame_objects'):
+        elapsed, uses_pygame = measure_import(modules, args.repeats)
+        print('import {:<26} {:>8.1f} ms  (pygame loaded: {})'.format(
+            modules, elapsed * 1000, uses_pygame))
+
+
+if __name__ == '__main__':
+    main()
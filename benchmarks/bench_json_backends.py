@@ -0,0 +1,75 @@
+"""Parse and load times of pokemon.json with every installed json backend
+(orjson, ujson, stdlib json), on real dex and on synthetic dex (see
+model_synthetic).
+
+Run from repository root: python -m benchmarks.bench_json_backends
+"""
+import argparse
+import json
+import os
+import tempfile
+from time import perf_counter
+from model_io import read_from_json
+from model_json import get_available_json_backends
+from model_synthetic import write_synthetic_database
+
+
+def measure(function, repeats: int) -> float:
+    best_time = None
+    for _ in range(repeats):
+        start = perf_counter()
+        function()
+        elapsed = perf_counter() - start
+        best_time = elapsed if best_time is None else min(best_time, elapsed)
+    return best_time
+
+
+def read_text(path: str):
+    with open(path, 'r', encoding='utf-8') as file_hantle:
+        return json.load(file_hantle)
+
+
+def parse_file(path: str, backend):
+    with open(path, 'r', encoding='utf-8') as file_hantle:
+        return backend.load(file_hantle)
+
+
+def load_file(path: str, backend):
+    with open(path, 'r', encoding='utf-8') as file_hantle:
+        return read_from_json(file_hantle, json_backend=backend)
+
+
+def compare_backends(path: str, repeats: int) -> None:
+    print('{} ({:.1f} kB)'.format(path, os.path.getsize(path) / 1024))
+    print('  {:<26} {:>10.2f} ms'.format(
+        'json.load (text decode)',
+        measure(lambda: read_text(path), repeats) * 1000
+        ))
+    for backend in get_available_json_backends():
+        parse_time = measure(lambda: parse_file(path, backend), repeats)
+        load_time = measure(lambda: load_file(path, backend), repeats)
+        print('  {:<26} {:>10.2f} ms   read_from_json {:>10.2f} ms'.format(
+            backend.get_name() + ' (bytes)',
+            parse_time * 1000, load_time * 1000
+            ))
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split('\n')[0])
+    parser.add_argument('--path', default='pokemon.json')
+    parser.add_argument('--synthetic', type=int, default=100000,
+                        help='number of pokemons in synthetic dex')
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--repeats', type=int, default=5)
+    args = parser.parse_args()
+
+    compare_backends(args.path, args.repeats)
+    with tempfile.TemporaryDirectory() as directory:
+        synthetic_path = os.path.join(directory, 'synthetic.json')
+        write_synthetic_database(synthetic_path, args.synthetic, args.seed,
+                                 reference_path=args.path)
+        compare_backends(synthetic_path, max(1, args.repeats // 2))
+
+
+if __name__ == '__main__':
+    main()
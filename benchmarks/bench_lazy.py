@@ -0,0 +1,72 @@
+"""Time of loading PokemonDatabase and getting pokemons for one bot match
+(12 random pokemons) in eager and lazy mode, and of explicit full
+validation of lazy database, on real and synthetic dex (see
+model_synthetic).
+
+Run from repository root: python -m benchmarks.bench_lazy
+"""
+import argparse
+import os
+import random
+import tempfile
+from time import perf_counter
+from database import PokemonDatabase
+from model_synthetic import write_synthetic_database
+
+
+def measure(function, repeats: int) -> float:
+    best_time = None
+    for _ in range(repeats):
+        start = perf_counter()
+        function()
+        elapsed = perf_counter() - start
+        best_time = elapsed if best_time is None else min(best_time, elapsed)
+    return best_time
+
+
+def load_match(path: str, numbers: list[int], lazy: bool) -> None:
+    database = PokemonDatabase(path, use_snapshot=False, lazy=lazy)
+    for number in numbers:
+        database.get_pokemon_using_pokedex_number(number)
+
+
+def validate_lazy(path: str, parallel: bool) -> None:
+    PokemonDatabase(path, lazy=True).validate_all(parallel=parallel)
+
+
+def compare(name: str, path: str, count: int, repeats: int,
+            seed: int) -> None:
+    numbers = random.Random(seed).sample(range(1, count + 1), 12)
+    print('{} ({} pokemons)'.format(name, count))
+    for label, function in (
+                ('eager load + match', lambda: load_match(path, numbers,
+                                                          False)),
+                ('lazy load + match', lambda: load_match(path, numbers,
+                                                         True)),
+                ('lazy + validate_all', lambda: validate_lazy(path, False)),
+                ('lazy + parallel validate_all',
+                 lambda: validate_lazy(path, True)),
+            ):
+        print('  {:<30} {:>10.1f} ms'.format(
+            label, measure(function, repeats) * 1000))
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split('\n')[0])
+    parser.add_argument('--path', default='pokemon.json')
+    parser.add_argument('--synthetic', type=int, default=100000,
+                        help='number of pokemons in synthetic dex')
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--repeats', type=int, default=3)
+    args = parser.parse_args()
+
+    compare(args.path, args.path, 801, args.repeats, args.seed)
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, 'synthetic.json')
+        write_synthetic_database(path, args.synthetic, args.seed,
+                                 reference_path=args.path)
+        compare('synthetic', path, args.synthetic, 1, args.seed)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,50 @@
+"""Time of read_from_json with serial and parallel validation for growing
+numbers of rows, to find where process pool starts to pay off (see
+model_io.PARALLEL_ROWS_THRESHOLD). Parallel mode is forced with
+parallel_threshold=0, workers default to number of CPUs.
+
+Run from repository root: python -m benchmarks.bench_parallel
+"""
+import argparse
+import json
+from io import StringIO
+from time import perf_counter
+from model_io import get_worker_count, read_from_json
+
+
+def measure_seconds(content: str, repeats: int, **options) -> float:
+    best_time = None
+    for _ in range(repeats):
+        start = perf_counter()
+        read_from_json(StringIO(content), **options)
+        elapsed = perf_counter() - start
+        best_time = elapsed if best_time is None else min(best_time, elapsed)
+    return best_time
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split('\n')[0])
+    parser.add_argument('--path', default='pokemon.json')
+    parser.add_argument('--rows', type=int, nargs='+',
+                        default=[1000, 2500, 5000, 10000, 20000, 50000])
+    parser.add_argument('--workers', type=int, default=None)
+    parser.add_argument('--repeats', type=int, default=3)
+    args = parser.parse_args()
+
+    with open(args.path, 'r') as file_hantle:
+        rows = json.load(file_hantle)
+    workers = get_worker_count(args.workers)
+    print('workers: {}'.format(workers))
+    for count in args.rows:
+        content = json.dumps((rows * (count // len(rows) + 1))[:count])
+        serial = measure_seconds(content, args.repeats)
+        parallel = measure_seconds(
+            content, args.repeats, parallel=True, workers=workers,
+            parallel_threshold=0
+            )
+        print('{:>8} rows: serial {:>8.3f} s, parallel {:>8.3f} s, '
+              '{:>5.2f}x'.format(count, serial, parallel, serial / parallel))
+
+
+if __name__ == '__main__':
+    main()
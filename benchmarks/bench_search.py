@@ -0,0 +1,102 @@
+"""Latency of name substring search: trigram index (see database_index)
+against regular expression scan of every name used before, on real dex
+and on synthetic names (see model_synthetic). Also reports time of
+building PokemonIndex (paid on every load and reload) and of the first
+name and number searches, which build the trigram and digit indexes.
+
+Run from repository root: python -m benchmarks.bench_search
+"""
+import argparse
+import random
+import re
+from time import perf_counter
+from database import PokemonDatabase
+from database_index import NameSubstringIndex, NGRAM_SIZE, PokemonIndex
+from model_synthetic import iter_synthetic_names
+
+
+def scan_names(names: list[str], substring: str) -> list[int]:
+    return [
+        position for position, name in enumerate(names)
+        if re.search(substring, name, re.IGNORECASE)
+    ]
+
+
+def get_queries(names: list[str], count: int, seed: int) -> list[str]:
+    """ Returns substrings of random names, NGRAM_SIZE to 6 characters
+    long, and one query without matches.
+    """
+    rng = random.Random(seed)
+    queries = ['zzzq']
+    for name in rng.sample(names, count):
+        length = rng.randint(NGRAM_SIZE, min(6, len(name)))
+        start = rng.randint(0, len(name) - length)
+        queries.append(re.escape(name[start:start + length]))
+    return queries
+
+
+def measure_latencies(search, queries: list[str]) -> tuple[float, float]:
+    latencies = []
+    for query in queries:
+        start = perf_counter()
+        search(query)
+        latencies.append(perf_counter() - start)
+    latencies.sort()
+    return latencies[len(latencies) // 2], latencies[-1]
+
+
+def report(label: str, search, queries: list[str]) -> None:
+    median, worst = measure_latencies(search, queries)
+    print('  {:<24} median {:>9.3f} ms, max {:>9.3f} ms'.format(
+        label, median * 1000, worst * 1000))
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split('\n')[0])
+    parser.add_argument('--path', default='pokemon.json')
+    parser.add_argument('--synthetic', type=int, default=1000000,
+                        help='number of synthetic names')
+    parser.add_argument('--queries', type=int, default=200)
+    parser.add_argument('--seed', type=int, default=0)
+    args = parser.parse_args()
+
+    database = PokemonDatabase(args.path)
+    pokemons = database.get_pokemon_database_list()
+    names = [pokemon.get_name() for pokemon in pokemons]
+    start = perf_counter()
+    pokemon_index = PokemonIndex(pokemons)
+    load_time = perf_counter() - start
+    start = perf_counter()
+    pokemon_index.search_name(names[0])
+    first_search_time = perf_counter() - start
+    start = perf_counter()
+    pokemon_index.search_pokedex_number(pokemons[0].get_pokedex_number())
+    first_number_search_time = perf_counter() - start
+    print('{} index built in {:.3f} s, first name search in {:.3f} s, '
+          'first number search in {:.3f} s'.format(
+              args.path, load_time, first_search_time,
+              first_number_search_time))
+    queries = get_queries(names, args.queries, args.seed)
+    print('{} ({} names, {} queries)'.format(
+        args.path, len(names), len(queries)))
+    report('regex scan', lambda query: scan_names(names, query), queries)
+    report('trigram index', database._search_name,
+           [re.sub(r'\\(.)', r'\1', query) for query in queries])
+
+    synthetic_names = list(iter_synthetic_names(
+        names, args.synthetic, args.seed
+        ))
+    start = perf_counter()
+    index = NameSubstringIndex(synthetic_names)
+    build_time = perf_counter() - start
+    queries = get_queries(synthetic_names, args.queries, args.seed)
+    print('synthetic ({} names, {} queries), index built in {:.1f} s'.format(
+        len(synthetic_names), len(queries), build_time))
+    report('regex scan',
+           lambda query: scan_names(synthetic_names, query), queries[:10])
+    report('trigram index', index.search,
+           [re.sub(r'\\(.)', r'\1', query) for query in queries])
+
+
+if __name__ == '__main__':
+    main()
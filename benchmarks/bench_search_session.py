@@ -0,0 +1,77 @@
+"""Latency of search as user types: PokemonDatabase.search_database
+called for every prefix of query against PokemonSearchSession, which
+filters previous result when query is extended. With --lazy database
+is read lazily, so every new search scans all rows.
+
+Run from repository root: python -m benchmarks.bench_search_session
+"""
+import argparse
+import random
+from time import perf_counter
+from database import PokemonDatabase
+
+
+def get_typed_queries(names: list[str], count: int, seed: int
+                      ) -> list[list[str]]:
+    """ Returns prefixes of random name fragments, as typed by user, and
+    the same for random pokedex numbers.
+    """
+    rng = random.Random(seed)
+    typed_queries = []
+    for name in rng.sample(names, count):
+        start = rng.randint(0, max(len(name) - 4, 0))
+        query = name[start:start + 8]
+        typed_queries.append([
+            query[:end] for end in range(1, len(query) + 1)
+        ])
+    for _ in range(count):
+        query = str(rng.randint(1, len(names)))
+        typed_queries.append([
+            query[:end] for end in range(1, len(query) + 1)
+        ])
+    return typed_queries
+
+
+def measure_keystrokes(search, typed_queries: list[list[str]]
+                       ) -> tuple[float, float]:
+    latencies = []
+    for queries in typed_queries:
+        for query in queries:
+            start = perf_counter()
+            search(query)
+            latencies.append(perf_counter() - start)
+    latencies.sort()
+    return latencies[len(latencies) // 2], latencies[-1]
+
+
+def report(label: str, search, typed_queries: list[list[str]]) -> None:
+    median, worst = measure_keystrokes(search, typed_queries)
+    print('  {:<24} median {:>9.3f} ms, max {:>9.3f} ms'.format(
+        label, median * 1000, worst * 1000))
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split('\n')[0])
+    parser.add_argument('--path', default='pokemon.json')
+    parser.add_argument('--queries', type=int, default=50)
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--lazy', action='store_true')
+    args = parser.parse_args()
+
+    start = perf_counter()
+    database = PokemonDatabase(args.path, use_snapshot=False)
+    names = [pokemon.get_name()
+             for pokemon in database.get_pokemon_database_list()]
+    if args.lazy:
+        database = PokemonDatabase(args.path, lazy=True)
+    typed_queries = get_typed_queries(names, args.queries, args.seed)
+    print('{} ({} pokemons, loaded in {:.1f} s, {} keystrokes)'.format(
+        args.path, len(names), perf_counter() - start,
+        sum(len(queries) for queries in typed_queries)))
+    report('search_database', database.search_database, typed_queries)
+    session = database.create_search_session()
+    report('search session', session.search, typed_queries)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,90 @@
+"""Time and private memory of process pool workers preparing one bot match
+(12 random pokemons), when every worker loads pokemon.json itself and
+when it attaches to database published in shared memory (see
+model_shared), on real and synthetic dex (see model_synthetic).
+
+Run from repository root: python -m benchmarks.bench_shared
+"""
+import argparse
+import os
+import random
+import tempfile
+from multiprocessing import get_context
+from time import perf_counter
+from database import PokemonDatabase
+from model_synthetic import write_synthetic_database
+
+
+def get_private_rss() -> int:
+    # Private (anonymous) resident memory of process in KiB, Linux only.
+    # Pages of shared memory segment are counted as RssShmem instead.
+    with open('/proc/self/status') as file_hantle:
+        for line in file_hantle:
+            if line.startswith('RssAnon:'):
+                return int(line.split()[1])
+    return 0
+
+
+def load_match(args: tuple[str, list[int]]) -> tuple[float, int]:
+    path, numbers = args
+    start = perf_counter()
+    database = PokemonDatabase(path, use_snapshot=False)
+    for number in numbers:
+        database.get_pokemon_using_pokedex_number(number)
+    elapsed = perf_counter() - start
+    return elapsed, get_private_rss()
+
+
+def run_workers(path: str, numbers: list[int],
+                workers: int) -> tuple[float, float, int]:
+    # Workers are spawned, so they do not inherit parent's database.
+    with get_context('spawn').Pool(workers) as pool:
+        start = perf_counter()
+        results = pool.map(load_match, [(path, numbers)] * workers)
+        elapsed = perf_counter() - start
+    load_time = max(result[0] for result in results)
+    private_rss = max(result[1] for result in results)
+    return elapsed, load_time, private_rss
+
+
+def compare(name: str, path: str, count: int, workers: int,
+            seed: int) -> None:
+    numbers = random.Random(seed).sample(range(1, count + 1), 12)
+    print('{} ({} pokemons, {} workers)'.format(name, count, workers))
+    start = perf_counter()
+    database = PokemonDatabase(path, use_snapshot=False)
+    shared = database.publish_to_shared_memory()
+    publish_time = perf_counter() - start
+    print('  load + publish: {:.1f} ms, segment {:.1f} MiB'.format(
+        publish_time * 1000, shared.get_size() / 2 ** 20))
+    with shared:
+        for label, worker_path in (('json per worker', path),
+                                   ('shared memory', shared.get_path())):
+            elapsed, load_time, private_rss = run_workers(
+                worker_path, numbers, workers
+                )
+            print('  {:<16} pool.map {:>9.1f} ms, worker load {:>9.1f} ms,'
+                  ' worker private rss {:>7.1f} MiB'.format(
+                      label, elapsed * 1000, load_time * 1000,
+                      private_rss / 1024))
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split('\n')[0])
+    parser.add_argument('--path', default='pokemon.json')
+    parser.add_argument('--synthetic', type=int, default=100000,
+                        help='number of pokemons in synthetic dex')
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--workers', type=int, default=4)
+    args = parser.parse_args()
+
+    compare(args.path, args.path, 801, args.workers, args.seed)
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, 'synthetic.json')
+        write_synthetic_database(path, args.synthetic, args.seed,
+                                 reference_path=args.path)
+        compare('synthetic', path, args.synthetic, args.workers, args.seed)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,81 @@
+"""Time of building two teams of game pokemons and fighting battle between
+them until one team is knocked out, with teams drawn from real dex or
+from synthetic dex (see model_synthetic).
+
+Run from repository root: python -m benchmarks.bench_simulation
+"""
+import argparse
+import io
+import random
+from time import perf_counter
+from classes import BasePokemon, GamePokemon
+from model_io import read_from_json, write_rows_to_json, JSON_FORMAT_V2
+from model_synthetic import read_reference_rows, iter_synthetic_rows
+
+
+def build_team(pokemons: list[BasePokemon], size: int,
+               rng: random.Random) -> list[GamePokemon]:
+    return [GamePokemon(rng.choice(pokemons)) for _ in range(size)]
+
+
+def attack(attacker: GamePokemon, defender: GamePokemon) -> None:
+    if attacker.get_special_type_multiplier(defender, 0) > 0:
+        attacker.attack_special(defender, 0)
+    else:
+        attacker.attack_basic(defender)
+
+
+def fight(first_team: list[GamePokemon],
+          second_team: list[GamePokemon]) -> int:
+    teams = [list(reversed(first_team)), list(reversed(second_team))]
+    turns = 0
+    while teams[0] and teams[1]:
+        attacker, defender = teams[turns % 2][-1], teams[1 - turns % 2][-1]
+        attack(attacker, defender)
+        if defender.get_hp() == 0:
+            teams[1 - turns % 2].pop()
+        turns += 1
+    return turns
+
+
+def run(name: str, pokemons: list[BasePokemon], team_size: int,
+        seed: int) -> None:
+    rng = random.Random(seed)
+    random.seed(seed)
+    start = perf_counter()
+    first_team = build_team(pokemons, team_size, rng)
+    second_team = build_team(pokemons, team_size, rng)
+    build_time = perf_counter() - start
+    start = perf_counter()
+    turns = fight(first_team, second_team)
+    fight_time = perf_counter() - start
+    print('{} ({} pokemons), teams of {}'.format(
+        name, len(pokemons), team_size))
+    print('  build teams:    {:>10.1f} ms'.format(build_time * 1000))
+    print('  fight:          {:>10.1f} ms ({} turns, {:.2f} us per turn)'
+          .format(fight_time * 1000, turns, fight_time / turns * 10 ** 6))
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split('\n')[0])
+    parser.add_argument('--path', default='pokemon.json')
+    parser.add_argument('--team-size', type=int, default=10000)
+    parser.add_argument('--synthetic', type=int, default=100000,
+                        help='number of pokemons in synthetic dex')
+    parser.add_argument('--seed', type=int, default=0)
+    args = parser.parse_args()
+
+    with open(args.path, 'r') as file_hantle:
+        pokemons = read_from_json(file_hantle)
+    run(args.path, pokemons, args.team_size, args.seed)
+    file_hantle = io.StringIO()
+    write_rows_to_json(iter_synthetic_rows(
+        read_reference_rows(args.path), args.synthetic, args.seed,
+        format_version=JSON_FORMAT_V2
+        ), file_hantle)
+    file_hantle.seek(0)
+    run('synthetic', read_from_json(file_hantle), args.team_size, args.seed)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,81 @@
+"""Cold start and lookup times of PokemonDatabase loaded from pokemon.json
+against PokemonDatabase opened from indexed SQLite database.
+
+Run from repository root: python -m benchmarks.bench_sqlite
+(--synthetic N runs it on synthetic dex of N pokemons, see model_synthetic)
+"""
+import argparse
+import os
+import tempfile
+from time import perf_counter
+from database import PokemonDatabase
+from model_io import read_from_json
+from model_sqlite import write_sqlite_file
+from model_synthetic import write_synthetic_database
+
+
+def measure(function, repeats: int) -> float:
+    best_time = None
+    for _ in range(repeats):
+        start = perf_counter()
+        function()
+        elapsed = perf_counter() - start
+        best_time = elapsed if best_time is None else min(best_time, elapsed)
+    return best_time
+
+
+def run_lookups(database: PokemonDatabase, number: int, name: str) -> None:
+    database.get_pokemon_using_pokedex_number(number)
+    database.get_pokemon_using_name(name)
+    database.search_database('cha')
+    database.get_pokemons_using_type('dragon')
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split('\n')[0])
+    parser.add_argument('--path', default='pokemon.json')
+    parser.add_argument('--repeats', type=int, default=5)
+    parser.add_argument('--synthetic', type=int, default=0,
+                        help='number of pokemons in synthetic dex used '
+                             'instead of given file')
+    parser.add_argument('--seed', type=int, default=0)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as directory:
+        if args.synthetic:
+            args.path = os.path.join(directory, 'synthetic.json')
+            write_synthetic_database(args.path, args.synthetic, args.seed)
+        with open(args.path, 'r') as file_hantle:
+            pokemons = read_from_json(file_hantle)
+        lookup = pokemons[len(pokemons) * 3 // 4]
+        number, name = lookup.get_pokedex_number(), lookup.get_name()
+        sqlite_path = os.path.join(directory, 'pokemon.sqlite')
+        import_time = measure(
+            lambda: write_sqlite_file(pokemons, sqlite_path), 1
+            )
+        json_start = measure(
+            lambda: PokemonDatabase(args.path, use_snapshot=False),
+            args.repeats
+            )
+        sqlite_start = measure(
+            lambda: PokemonDatabase(sqlite_path), args.repeats
+            )
+        json_database = PokemonDatabase(args.path, use_snapshot=False)
+        sqlite_database = PokemonDatabase(sqlite_path)
+        json_lookups = measure(
+            lambda: run_lookups(json_database, number, name), args.repeats
+            )
+        sqlite_lookups = measure(
+            lambda: run_lookups(sqlite_database, number, name), args.repeats
+            )
+        sqlite_database._get_pokemon_source().close()
+    print('pokemons: {}'.format(len(pokemons)))
+    print('sqlite bulk import:   {:>10.2f} ms'.format(import_time * 1000))
+    print('json cold start:      {:>10.2f} ms'.format(json_start * 1000))
+    print('sqlite cold start:    {:>10.2f} ms'.format(sqlite_start * 1000))
+    print('json lookups:         {:>10.2f} ms'.format(json_lookups * 1000))
+    print('sqlite lookups:       {:>10.2f} ms'.format(sqlite_lookups * 1000))
+
+
+if __name__ == '__main__':
+    main()
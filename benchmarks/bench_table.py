@@ -0,0 +1,84 @@
+"""Time of building PokemonTable and of batch queries done with Python
+loops over BasePokemon objects against the same queries on PokemonTable
+arrays, on real and synthetic dex (see model_synthetic). Requires numpy.
+
+Run from repository root: python -m benchmarks.bench_table
+"""
+import argparse
+import io
+from time import perf_counter
+from classes import BasePokemon
+from model_io import read_from_json, write_rows_to_json, JSON_FORMAT_V2
+from model_synthetic import read_reference_rows, iter_synthetic_rows
+from model_table import PokemonTable, TYPE_CODES
+
+
+def measure(function, repeats: int) -> float:
+    best_time = None
+    for _ in range(repeats):
+        start = perf_counter()
+        function()
+        elapsed = perf_counter() - start
+        best_time = elapsed if best_time is None else min(best_time, elapsed)
+    return best_time
+
+
+def query_objects(pokemons: list[BasePokemon]) -> tuple:
+    dragons = [
+        pokemon.get_base_attack() for pokemon in pokemons
+        if 'dragon' in pokemon.get_types()
+    ]
+    weak_to_fire = sum(
+        pokemon.get_special_strength_value('fire') > 1
+        for pokemon in pokemons
+    )
+    best_multipliers = [
+        max(pokemon.get_special_strength_value(attack_type)
+            for attack_type in ('water', 'ice'))
+        for pokemon in pokemons
+    ]
+    return sum(dragons) / len(dragons), weak_to_fire, best_multipliers
+
+
+def query_table(table: PokemonTable) -> tuple:
+    dragons = table.attack[table.get_type_mask('dragon')]
+    weak_to_fire = int((table.get_weakness_column('fire') > 1).sum())
+    best_multipliers = table.weakness[
+        :, [TYPE_CODES['water'], TYPE_CODES['ice']]
+        ].max(axis=1)
+    return dragons.mean(), weak_to_fire, best_multipliers
+
+
+def compare(name: str, pokemons: list[BasePokemon], repeats: int) -> None:
+    table = PokemonTable(pokemons)
+    print('{} ({} pokemons)'.format(name, len(pokemons)))
+    print('  build table:     {:>10.2f} ms'.format(
+        measure(lambda: PokemonTable(pokemons), repeats) * 1000))
+    print('  object queries:  {:>10.2f} ms'.format(
+        measure(lambda: query_objects(pokemons), repeats) * 1000))
+    print('  table queries:   {:>10.2f} ms'.format(
+        measure(lambda: query_table(table), repeats) * 1000))
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split('\n')[0])
+    parser.add_argument('--path', default='pokemon.json')
+    parser.add_argument('--synthetic', type=int, default=100000,
+                        help='number of pokemons in synthetic dex')
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--repeats', type=int, default=5)
+    args = parser.parse_args()
+
+    with open(args.path, 'r') as file_hantle:
+        compare(args.path, read_from_json(file_hantle), args.repeats)
+    file_hantle = io.StringIO()
+    write_rows_to_json(iter_synthetic_rows(
+        read_reference_rows(args.path), args.synthetic, args.seed,
+        format_version=JSON_FORMAT_V2
+        ), file_hantle)
+    file_hantle.seek(0)
+    compare('synthetic', read_from_json(file_hantle), 1)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,78 @@
+"""Rows per second of pokemon row validation: io_return_valid_* function
+chain (used by read_from_json before model_schema) against validator
+compiled from model_schema.POKEMON_SCHEMA. Both are run in turns, with
+garbage collector disabled, and median of repeats is reported, as
+single runs on shared machine vary by more than the difference.
+
+Run from repository root: python -m benchmarks.bench_validation
+"""
+import argparse
+import copy
+import gc
+import json
+import statistics
+from time import perf_counter
+from classes import BasePokemon
+from model_io import (
+    io_convert_to_int,
+    io_return_if_positive,
+    io_return_if_valid_string,
+    io_return_if_valid_abilities_as_list,
+    io_return_valid_stats_dict,
+    io_return_valid_special_strength_dict,
+    io_return_valid_other_dict,
+    io_return_valid_pokemon
+)
+
+
+def validate_with_io_functions(item: dict, row: int) -> BasePokemon:
+    return BasePokemon(
+        io_return_if_positive(io_convert_to_int(item['pokedex_number'])),
+        io_return_if_valid_string(item['name']),
+        io_return_if_valid_abilities_as_list(item['abilities']),
+        io_return_valid_stats_dict(item['stats']),
+        io_return_valid_special_strength_dict(item['special_strength']),
+        io_return_valid_other_dict(item['other'])
+    )
+
+
+def measure_rows_per_second(validate, rows: list[dict]) -> float:
+    data = copy.deepcopy(rows)
+    gc.disable()
+    try:
+        start = perf_counter()
+        for idx, item in enumerate(data):
+            validate(item, idx + 1)
+        elapsed = perf_counter() - start
+    finally:
+        gc.enable()
+    return len(rows) / elapsed
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split('\n')[0])
+    parser.add_argument('--path', default='pokemon.json')
+    parser.add_argument('--copies', type=int, default=10,
+                        help='how many times rows of given file are repeated')
+    parser.add_argument('--repeats', type=int, default=9)
+    args = parser.parse_args()
+
+    with open(args.path, 'r') as file_hantle:
+        rows = json.load(file_hantle) * args.copies
+    before = []
+    after = []
+    for _ in range(args.repeats):
+        before.append(
+            measure_rows_per_second(validate_with_io_functions, rows)
+            )
+        after.append(measure_rows_per_second(io_return_valid_pokemon, rows))
+    before = statistics.median(before)
+    after = statistics.median(after)
+    print('rows: {}'.format(len(rows)))
+    print('io_* function chain:  {:>10.0f} rows/s'.format(before))
+    print('compiled schema:      {:>10.0f} rows/s'.format(after))
+    print('speedup:              {:>10.2f}x'.format(after / before))
+
+
+if __name__ == '__main__':
+    main()
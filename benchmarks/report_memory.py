@@ -0,0 +1,62 @@
+"""tracemalloc report of memory used by loaded pokemons, with every
+pokemon keeping it's own strings and special strength dict against
+repeated values shared between pokemons (BasePokemon.share_values).
+
+Run from repository root: python -m benchmarks.report_memory
+"""
+import argparse
+import json
+import tracemalloc
+from classes import SharedPokemonValues
+from model_io import io_return_valid_pokemon
+from model_synthetic import read_reference_rows, iter_synthetic_rows
+
+
+def measure_memory(rows: list[dict], share: bool) -> int:
+    # Rows are parsed again for every measurement, so loaded pokemons do
+    # not reuse strings of rows parsed before.
+    rows = json.loads(json.dumps(rows))
+    tracemalloc.start()
+    start = tracemalloc.get_traced_memory()[0]
+    shared_values = SharedPokemonValues()
+    pokemons = []
+    for idx, item in enumerate(rows):
+        pokemon = io_return_valid_pokemon(item, idx + 1)
+        if share:
+            pokemon.share_values(shared_values)
+        pokemons.append(pokemon)
+    del rows
+    used = tracemalloc.get_traced_memory()[0] - start
+    tracemalloc.stop()
+    return used
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split('\n')[0])
+    parser.add_argument('--path', default='pokemon.json')
+    parser.add_argument('--synthetic', type=int, default=100000,
+                        help='number of pokemons in synthetic dex')
+    parser.add_argument('--seed', type=int, default=0)
+    args = parser.parse_args()
+
+    reference = read_reference_rows(args.path)
+    synthetic_rows = list(
+        iter_synthetic_rows(reference, args.synthetic, args.seed)
+        )
+    for name, dex_rows in (
+                (args.path, reference[0]),
+                ('synthetic', synthetic_rows)
+            ):
+        separate = measure_memory(dex_rows, share=False)
+        shared = measure_memory(dex_rows, share=True)
+        print('{} ({} pokemons)'.format(name, len(dex_rows)))
+        print('  own values:     {:>10.1f} kB ({:.0f} B per pokemon)'.format(
+            separate / 1024, separate / len(dex_rows)))
+        print('  shared values:  {:>10.1f} kB ({:.0f} B per pokemon)'.format(
+            shared / 1024, shared / len(dex_rows)))
+        print('  saved:          {:>10.1f} %'.format(
+            100 * (separate - shared) / separate))
+
+
+if __name__ == '__main__':
+    main()
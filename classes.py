@@ -1,4 +1,5 @@
 import copy
+import sys
 from random import randint
 from math import ceil
 from typing import Literal
@@ -71,6 +72,69 @@ class NotANumberError(ValueError):
     pass
 
 
+class ReadOnlyDict(dict):
+    """ Dict which cannot be modified after creation, so one object can be
+    safely shared by many pokemons. Copies return the same object.
+    """
+    def _read_only(self, *args, **kwargs):
+        raise TypeError('ReadOnlyDict cannot be modified')
+
+    __setitem__ = _read_only
+    __delitem__ = _read_only
+    __ior__ = _read_only
+    clear = _read_only
+    pop = _read_only
+    popitem = _read_only
+    setdefault = _read_only
+    update = _read_only
+
+    def __copy__(self) -> 'ReadOnlyDict':
+        return self
+
+    def __deepcopy__(self, memo: dict) -> 'ReadOnlyDict':
+        return self
+
+    def __reduce__(self) -> tuple:
+        return ReadOnlyDict, (dict(self),)
+
+
+class SharedPokemonValues:
+    """ Cache of values repeated between pokemons of one database: strings
+    (types, classfications, abilities), ability tuples and special strength
+    tables, which are shared as read-only dicts.
+    """
+    def __init__(self) -> None:
+        self._abilities = {}
+        self._special_strength_tables = {}
+
+    def get_string(self, value: (str | None)) -> (str | None):
+        """ Returns interned given string (or None).
+        """
+        return None if value is None else sys.intern(value)
+
+    def get_abilities(self, abilities: tuple[str]) -> tuple[str]:
+        """ Returns shared tuple equal to given abilities tuple.
+        """
+        shared = self._abilities.get(abilities)
+        if shared is None:
+            shared = tuple(sys.intern(ability) for ability in abilities)
+            self._abilities[shared] = shared
+        return shared
+
+    def get_special_strength(self, special_strength: dict) -> ReadOnlyDict:
+        """ Returns shared read-only dict equal to given special strength
+        dict (with the same order of keys).
+        """
+        key = tuple(special_strength.items())
+        shared = self._special_strength_tables.get(key)
+        if shared is None:
+            shared = ReadOnlyDict(
+                (sys.intern(name), value) for name, value in key
+                )
+            self._special_strength_tables[key] = shared
+        return shared
+
+
 class BasePokemon:
     """ Creates base pokemon for creating other pokemons from it's values.
         Values inside this class cannot be modified.
@@ -371,6 +435,22 @@ class BasePokemon:
         """
         return (self._type1, self._type2)
 
+    def get_classfication(self) -> str:
+        """ Gets private value of pokemon's classfication and returns it.
+
+        Returns:
+           str : Pokemon's classfication (ex. 'Seed Pokémon').
+        """
+        return self._classfication
+
+    def get_experience_growth(self) -> int:
+        """ Gets private value of pokemon's experience growth and returns it.
+
+        Returns:
+           int : Value of pokemon's experience growth.
+        """
+        return self._experience_growth
+
     def get_special_strength_dict(self) -> dict:
         """ Gets entire pokemon's special strength dictionary and returns it.
 
@@ -452,6 +532,25 @@ class BasePokemon:
                 'Given key does not exist'
             )
 
+# Shared values
+
+    def share_values(self, shared_values: SharedPokemonValues) -> None:
+        """ Replaces repeated values (type, classfication and ability
+        strings, special strength dict) with equal ones shared by other
+        pokemons of database. Special strength dict becomes read-only.
+
+        Args:
+            shared_values (SharedPokemonValues): Cache of database's
+            shared values.
+        """
+        self._type1 = shared_values.get_string(self._type1)
+        self._type2 = shared_values.get_string(self._type2)
+        self._classfication = shared_values.get_string(self._classfication)
+        self._abilities = shared_values.get_abilities(self._abilities)
+        self._special_strength = shared_values.get_special_strength(
+            self._special_strength
+            )
+
 
 class GamePokemon(BasePokemon):
     """ Creates game pokemon with every needed method to make it playable.
@@ -1,39 +1,172 @@
-from model_io import read_from_json, io_convert_to_int
-import re
+from model_io import (
+    read_from_json,
+    read_changed_from_json,
+    io_convert_to_int,
+    io_read_format_rows,
+    io_return_row_hash,
+    open_json_file
+)
+import os
+import threading
 from classes import (
     PokemonDataDoesNotExistError,
     BadConversionError,
     DataDoesNotExistError,
     BasePokemon,
+    SharedPokemonValues,
     NotANumberError,
     RedundantKeyError
 )
-from pygame_objects import (
-    Button,
-    PokemonList,
-    PokemonBalls,
-    PokemonFrame,
-    SpecialList,
-    GamePokemonList
-)
 from model_io import check_if_valid_key
+from model_snapshot import (
+    get_snapshot_path,
+    get_source_file_key,
+    read_snapshot,
+    write_snapshot
+)
+from database_sources import (
+    PokemonSource,
+    StreamingPokemonSource,
+    LazyRowsPokemonSource,
+    RecordFilePokemonSource,
+    SharedMemoryPokemonSource,
+    SqlitePokemonSource,
+    ShardedPokemonSource
+)
+from model_records import RECORD_FILE_SUFFIX
+from model_sqlite import SQLITE_FILE_SUFFIX
+from model_shards import MANIFEST_FILE_SUFFIX
+from model_csv import read_from_reference_csv, REFERENCE_CSV_SUFFIX
+from model_json import JsonBackend, get_json_backend
+from model_overlay import read_overlay, apply_overlay
+from model_table import PokemonTable, TABLE_AVAILABLE
+from database_index import (
+    FUZZY_MAX_DISTANCE,
+    FUZZY_RESULT_COUNT,
+    PokemonIndex,
+    fold_name
+)
+from model_shared import (
+    SharedPokemonDatabase,
+    get_shared_memory_name,
+    is_shared_memory_path
+)
+from typing import Iterator
 from copy import copy
 
 
+# Pokedex numbers outside these bounds are never searched for.
+MIN_SEARCHED_POKEDEX_NUMBER = 1
+MAX_SEARCHED_POKEDEX_NUMBER = 65535
+
+
+class PokemonBaseSnapshot:
+    """Read-only state of database's pokemons: list of pokemons, it's
+       lookup indexes (see database_index) and it's columnar view (see
+       model_table), which is built on first use. Database replaces whole
+       snapshot with one attribute assignment, so list and indexes taken
+       from one snapshot always come from the same load.
+    """
+    def __init__(self, pokemon_list: list[BasePokemon] = None) -> None:
+        """Builds lookup indexes of given list of pokemons.
+
+        Args:
+            pokemon_list (list, optional): List of BasePokemon objects.
+            Defaults to None (empty list).
+        """
+        pokemon_list = [] if pokemon_list is None else pokemon_list
+        self._pokemon_list = pokemon_list
+        self._pokemon_index = PokemonIndex(pokemon_list)
+        self._pokemon_table = None
+
+    def get_pokemon_list(self) -> list[BasePokemon]:
+        """ Returns list of pokemons of snapshot.
+
+        Returns:
+           list : List of BasePokemon objects.
+        """
+        return self._pokemon_list
+
+    def get_index(self) -> PokemonIndex:
+        """ Returns lookup indexes of snapshot's list.
+
+        Returns:
+           PokemonIndex : Indexes of list.
+        """
+        return self._pokemon_index
+
+    def get_table(self) -> PokemonTable:
+        """ Returns columnar view of snapshot's list, built on first call.
+
+        Raises:
+            ImportError: numpy is not installed.
+
+        Returns:
+            PokemonTable: Columnar view of list.
+        """
+        if self._pokemon_table is None:
+            self._pokemon_table = PokemonTable(self._pokemon_list)
+        return self._pokemon_table
+
+
 class PokemonDatabase:
     """Creating pokemon database as list with BasePokemon objects
-       Given database cannot be modified/updated after creation
+       Given database cannot be modified/updated after creation, it can
+       only be reloaded from changed file (see reload_if_changed)
     """
-    def __init__(self, file_path: str) -> None:
+    def __init__(self,
+                 file_path: str,
+                 use_snapshot: bool = True,
+                 streaming: bool = False,
+                 parallel: bool = False,
+                 json_backend: (str | None) = None,
+                 lazy: bool = False) -> None:
         """Creates pokemon database from JSON file given in file_path.\n
-        Throws exception if given file is malformed, invalid or missing.
+        Throws exception if given file is malformed, invalid or missing.\n
+        After first successful load validated database is saved as binary
+        snapshot next to given file, which is used on later loads until
+        given file changes.\n
+        File with RECORD_FILE_SUFFIX extension is opened as memory-mapped
+        record file (see model_records) and file with SQLITE_FILE_SUFFIX
+        extension as indexed SQLite database (see model_sqlite). File with
+        MANIFEST_FILE_SUFFIX extension is opened as generation-sharded
+        database (see model_shards). Path returned by
+        SharedPokemonDatabase.get_path (see publish_to_shared_memory)
+        attaches to database published by other process. Each of them is
+        read lazily.\n
+        JSON file can be compressed (ex. pokemon.json.gz, see
+        model_io.COMPRESSED_FILE_OPENERS), it's decompressed while parsed.\n
+        Original reference csv file (REFERENCE_CSV_SUFFIX extension) is read
+        directly, column by column (see model_csv.read_from_reference_csv),
+        always at once.\n
+        JSON file is parsed by the fastest installed json backend (orjson,
+        ujson or stdlib json, see model_json), unless json_backend is given.
 
         Args:
             file_path (str): path to given JSON pokemon database
+            use_snapshot (bool, optional): Reads and writes binary snapshot
+            of validated database. Defaults to True.
+            streaming (bool, optional): Reads pokemons from file one row
+            at a time, only when they are needed by lookups or searches,
+            instead of loading whole file at once. Snapshot is not used
+            in this mode. Defaults to False.
+            parallel (bool, optional): Validates rows of large files in
+            worker processes (see model_io.read_from_json).
+            Defaults to False.
+            json_backend (str | None, optional): Name of json backend
+            (see model_json.JSON_BACKEND_NAMES). Defaults to None
+            (the fastest installed backend).
+            lazy (bool, optional): Parses whole JSON file, but checks rows
+            and creates pokemons only when lookups or searches need them
+            (see database_sources.LazyRowsPokemonSource). Snapshot is not
+            used in this mode, every row can still be checked at once
+            with validate_all. Defaults to False.
 
         Raises:
             BadConversionError: Given file_path is not a string.
             DataDoesNotExistError: Given file_path is empty.
+            RedundantKeyError: Given json backend is not supported.
+            ImportError: Given json backend is not installed.
             FileNotFoundError: Given file does not exist.
             PermissionError: Given file cannot be accessed.
             IsADirectoryError: Given path is a directory.
@@ -45,17 +178,172 @@ class PokemonDatabase:
             raise BadConversionError('Given path is not a string value')
         if not file_path:
             raise DataDoesNotExistError('Given path value is empty')
-        self._pokemon_base = []
+        self._pokemon_snapshot = PokemonBaseSnapshot()
+        self._pokemon_source = None
         self._base_file_path = file_path
-        self._load_from_json()
+        self._use_snapshot = use_snapshot and not streaming and not lazy
+        self._parallel = parallel
+        self._streaming = streaming
+        self._lazy = lazy
+        self._file_state = None
+        self._known_rows = None
+        self._reload_lock = threading.Lock()
+        self._reload_error = None
+        self._watcher = None
+        self._watcher_stop = None
+        self._shared_values = SharedPokemonValues()
+        self._json_backend = get_json_backend(json_backend)
+        self._overlay_paths = []
+        self._load_from_file()
 
     def get_pokemon_database_list(self) -> list[BasePokemon]:
         """ Gets private value of pokemon's database and returns it.
+        If database uses lazy source, every pokemon is loaded from it first.
 
         Returns:
            list : List of BasePokemon objects.
         """
-        return self._pokemon_base
+        return self._get_full_snapshot().get_pokemon_list()
+
+    def apply_overlays(self, overlay_paths: list[str]) -> 'PokemonDatabase':
+        """ Returns new database with given overlay files (see
+        model_overlay) applied in given order, later overlays patch
+        pokemons of earlier ones.\n
+        Only patched and added pokemons are checked, every other pokemon
+        is shared with this database, which is not modified.
+        Overlays can be applied to returned database again.
+
+        Args:
+            overlay_paths (list[str]): Paths to overlay files.
+
+        Raises:
+            FileNotFoundError: Given overlay file does not exist.
+            MalformedPokemonDataError: returns type of data corruption
+            from overlay file and row where it was found.
+
+        Returns:
+            PokemonDatabase: Database with overlays applied.
+        """
+        pokemon_list = self.get_pokemon_database_list()
+        for overlay_path in overlay_paths:
+            with open_json_file(overlay_path) as file_hantle:
+                rows = read_overlay(file_hantle, self._get_json_backend())
+            pokemon_list = apply_overlay(
+                pokemon_list, rows, self._shared_values
+                )
+        database = copy(self)
+        database._pokemon_source = None
+        database._use_snapshot = False
+        database._known_rows = None
+        database._reload_lock = threading.Lock()
+        database._reload_error = None
+        database._watcher = None
+        database._watcher_stop = None
+        database._overlay_paths = self._overlay_paths + list(overlay_paths)
+        database._set_pokemon_base_list(pokemon_list)
+        return database
+
+    def get_overlay_paths(self) -> list[str]:
+        """ Returns paths of overlay files applied to database, in order
+        they were applied.
+
+        Returns:
+           list : Paths of overlay files.
+        """
+        return list(self._overlay_paths)
+
+    def get_json_backend_name(self) -> str:
+        """ Returns name of json backend used to parse given file
+        (ex. 'orjson').
+
+        Returns:
+           str : Name of json backend.
+        """
+        return self._get_json_backend().get_name()
+
+    def _get_json_backend(self) -> JsonBackend:
+        """ Gets private json backend and returns it.
+
+        Returns:
+           JsonBackend : Json backend used to parse given file.
+        """
+        return self._json_backend
+
+    def get_pokemon_table(self) -> PokemonTable:
+        """ Returns columnar view of database (see model_table), with
+        arrays of stats, type codes and weakness matrix of every pokemon,
+        in database order. Table is built on first call after list of
+        pokemons is set (on load, reload or when lazy source is loaded
+        into list), so it always matches get_pokemon_database_list.
+
+        Raises:
+            ImportError: numpy is not installed.
+
+        Returns:
+            PokemonTable: Columnar view of database.
+        """
+        if not TABLE_AVAILABLE:
+            raise ImportError('Pokemon table requires numpy')
+        return self._get_full_snapshot().get_table()
+
+    def _get_pokemon_source(self) -> (PokemonSource | None):
+        """ Gets private lazy source of pokemons and returns it.
+
+        Returns:
+           PokemonSource | None : Lazy source or None if every pokemon
+           is already loaded into list.
+        """
+        return self._pokemon_source
+
+    def _get_pokemon_snapshot(self) -> PokemonBaseSnapshot:
+        """ Gets private snapshot of pokemon list and returns it. Callers
+        take it once per call, so reload in other thread cannot mix old
+        and new list.
+
+        Returns:
+           PokemonBaseSnapshot : Current snapshot.
+        """
+        return self._pokemon_snapshot
+
+    def _get_loaded_snapshot(self) -> (PokemonBaseSnapshot | None):
+        """ Returns current snapshot or None if pokemons are not loaded
+        from lazy source into list yet, lazy source answers lookups then.
+
+        Returns:
+           PokemonBaseSnapshot | None : Current snapshot or None.
+        """
+        snapshot = self._get_pokemon_snapshot()
+        if self._get_pokemon_source() is not None and (
+                    not snapshot.get_pokemon_list()
+                ):
+            return None
+        return snapshot
+
+    def _get_full_snapshot(self) -> PokemonBaseSnapshot:
+        """ Returns current snapshot, loading every pokemon from lazy
+        source into list first.
+
+        Returns:
+           PokemonBaseSnapshot : Current snapshot.
+        """
+        snapshot = self._get_loaded_snapshot()
+        if snapshot is None:
+            snapshot = self._set_pokemon_base_list(
+                list(self._get_pokemon_source())
+                )
+        return snapshot
+
+    def _iter_pokemon_base(self) -> Iterator[BasePokemon]:
+        """ Yields every pokemon in database order. Pokemons from lazy
+        source are loaded only when iteration reaches them.
+
+        Yields:
+            BasePokemon: Every pokemon in database.
+        """
+        snapshot = self._get_loaded_snapshot()
+        if snapshot is None:
+            return iter(self._get_pokemon_source())
+        return iter(snapshot.get_pokemon_list())
 
     def _get_base_file_path(self) -> str:
         """ Gets private value of file path and returns it.
@@ -67,17 +355,26 @@ class PokemonDatabase:
 
     def _set_pokemon_base_list(self,
                                pokemon_base_list: list[BasePokemon]
-                               ) -> None:
-        """Sets private value of pokemon's database as new database.\n
+                               ) -> PokemonBaseSnapshot:
+        """Sets private value of pokemon's database as new database,
+        together with it's lookup indexes, as one new snapshot (see
+        PokemonBaseSnapshot). Columnar view (see get_pokemon_table) is
+        built later, on first use.\n
         Function won't throw exceptio due to parent's function check.
 
         Args:
             pokemon_base_list (list): list of BasePokemon objects.
+
+        Returns:
+            PokemonBaseSnapshot: New snapshot.
         """
-        self._pokemon_base = pokemon_base_list
+        snapshot = PokemonBaseSnapshot(pokemon_base_list)
+        self._pokemon_snapshot = snapshot
+        return snapshot
 
-    def _load_from_json(self) -> None:
-        """Loads JSON file from given path in __init__.\n
+    def _load_from_file(self) -> None:
+        """Loads database from given path in __init__ using loader chosen
+        by file extension and mode.\n
         Throws exception if given file is malformed, invalid or missing.
 
         Raises:
@@ -85,12 +382,25 @@ class PokemonDatabase:
             PermissionError: Given file cannot be accessed.
             IsADirectoryError: Given path is a directory.
             MalformedPokemonDataError: returns type of data corruption
-            from JSON file and row where it was found.
+            from given file and row where it was found.
 
         """
+        file_path = self._get_base_file_path()
         try:
-            with open(self._get_base_file_path(), 'r') as file_hantle:
-                self._set_pokemon_base_list(read_from_json(file_hantle))
+            if is_shared_memory_path(file_path):
+                self._load_from_shared_memory()
+            elif file_path.lower().endswith(RECORD_FILE_SUFFIX):
+                self._load_from_record_file()
+            elif file_path.lower().endswith(SQLITE_FILE_SUFFIX):
+                self._load_from_sqlite()
+            elif file_path.lower().endswith(MANIFEST_FILE_SUFFIX):
+                self._load_from_shards()
+            elif self._streaming and not self._is_reference_csv():
+                self._load_streaming_from_json()
+            elif self._lazy and not self._is_reference_csv():
+                self._load_lazily_from_json()
+            else:
+                self._load_from_json()
         except FileNotFoundError:
             raise FileNotFoundError("Could not open person database.")
         except PermissionError:
@@ -100,9 +410,352 @@ class PokemonDatabase:
         except IsADirectoryError:
             raise IsADirectoryError("Provided path is a directory.")
 
+    def _load_from_json(self) -> None:
+        """Loads JSON (or reference csv) file from given path in __init__.\n
+        Uses binary snapshot instead if it matches given file's size,
+        modification time and content hash.
+
+        Raises:
+            MalformedPokemonDataError: returns type of data corruption
+            from JSON file and row where it was found.
+
+        """
+        file_path = self._get_base_file_path()
+        self._file_state = self._get_file_state()
+        if self._use_snapshot:
+            source_key = get_source_file_key(file_path)
+            snapshot_path = get_snapshot_path(file_path)
+            pokemon_list = read_snapshot(snapshot_path, source_key)
+            if pokemon_list is not None:
+                self._set_pokemon_base_list(pokemon_list)
+                return
+        self._set_pokemon_base_list(self._read_pokemon_list())
+        if self._use_snapshot:
+            write_snapshot(
+                snapshot_path, source_key, self.get_pokemon_database_list()
+                )
+
+    def _is_reference_csv(self) -> bool:
+        """Checks if given file is reference csv file (see model_csv).
+        """
+        return self._get_base_file_path().lower().endswith(
+            REFERENCE_CSV_SUFFIX
+            )
+
+    def _read_pokemon_list(self) -> list[BasePokemon]:
+        """Reads and validates every pokemon from given JSON or reference
+        csv file.
+
+        Raises:
+            MalformedPokemonDataError: returns type of data corruption
+            from given file and row where it was found.
+
+        Returns:
+            list: List of BasePokemon objects.
+        """
+        file_path = self._get_base_file_path()
+        if self._is_reference_csv():
+            with open(file_path, 'r', encoding='utf-8-sig',
+                      newline='') as file_hantle:
+                return read_from_reference_csv(
+                    file_hantle, shared_values=self._shared_values
+                    )
+        with open_json_file(file_path) as file_hantle:
+            return read_from_json(file_hantle, parallel=self._parallel,
+                                  shared_values=self._shared_values,
+                                  json_backend=self._get_json_backend())
+
+    def _get_file_state(self) -> tuple[int, int]:
+        """Returns size and modification time of given file, used to check
+        if it was changed since it was read.
+
+        Returns:
+            tuple(int, int): File size and mtime in nanoseconds.
+        """
+        file_stat = os.stat(self._get_base_file_path())
+        return file_stat.st_size, file_stat.st_mtime_ns
+
+    def _remember_row_hashes(self) -> None:
+        """Saves hash of every row of given file with pokemon created from it,
+        so later reloads check only changed rows. Nothing is saved if file
+        was changed since it was loaded.\n
+        Hashes are saved only when reloads are expected (see start_watching
+        and reload_if_changed), so loads which are never reloaded do not
+        pay for hashing every row.
+        """
+        if self._known_rows is not None or self._is_reference_csv():
+            return
+        with open_json_file(self._get_base_file_path()) as file_hantle:
+            format_version, data = io_read_format_rows(
+                file_hantle, self._get_json_backend()
+                )
+        pokemon_list = self._get_pokemon_snapshot().get_pokemon_list()
+        if self._get_file_state() != self._file_state or (
+                    len(data) != len(pokemon_list)
+                ):
+            return
+        self._known_rows = {
+            io_return_row_hash(
+                item, format_version, self._get_json_backend()
+                ): pokemon
+            for item, pokemon in zip(data, pokemon_list)
+        }
+
+    def reload_if_changed(self) -> bool:
+        """Reloads database if given JSON file was changed since it was read.
+        Only changed rows are checked again, pokemons of unchanged rows are
+        reused (reference csv file is read again whole). Hashes of rows
+        are saved by the first call which finds file unchanged (or by
+        start_watching), file changed before that is checked whole.\n
+        New list of pokemons replaces old one at once, so searches that
+        already started finish using old list. Old list is never modified.\n
+        Throws exception if changed file is malformed, old list is kept then.
+
+        Raises:
+            NotImplementedError: Database uses lazy source or overlays.
+            FileNotFoundError: Given file does not exist.
+            MalformedPokemonDataError: returns type of data corruption
+            from JSON file and row where it was found.
+
+        Returns:
+            bool: True if database was reloaded.
+        """
+        if self._get_pokemon_source() is not None:
+            raise NotImplementedError(
+                'Only databases loaded from JSON file can be reloaded'
+                )
+        if self._overlay_paths:
+            raise NotImplementedError(
+                'Databases with overlays cannot be reloaded, apply overlays '
+                'to reloaded base database instead'
+                )
+        with self._reload_lock:
+            file_state = self._get_file_state()
+            if file_state == self._file_state:
+                self._remember_row_hashes()
+                return False
+            if self._is_reference_csv():
+                pokemon_list = self._read_pokemon_list()
+            else:
+                with open_json_file(self._get_base_file_path()) as (
+                            file_hantle
+                        ):
+                    pokemon_list, self._known_rows, _ = (
+                        read_changed_from_json(
+                            file_hantle, self._known_rows,
+                            self._shared_values, self._get_json_backend()
+                            )
+                        )
+            self._file_state = file_state
+            self._set_pokemon_base_list(pokemon_list)
+            if self._use_snapshot:
+                file_path = self._get_base_file_path()
+                write_snapshot(get_snapshot_path(file_path),
+                               get_source_file_key(file_path), pokemon_list)
+            return True
+
+    def _watch_file(self, interval: float) -> None:
+        """Checks given file every interval seconds and reloads database
+        when it changes, until watching is stopped.\n
+        Every error is saved (see get_reload_error), so half-saved or
+        malformed file does not stop watching.
+
+        Args:
+            interval (float): Seconds between checks.
+        """
+        while not self._watcher_stop.wait(interval):
+            try:
+                if self.reload_if_changed():
+                    self._reload_error = None
+            except Exception as e:
+                self._reload_error = e
+
+    def start_watching(self, interval: float = 1.0) -> None:
+        """Starts background thread reloading database every time given
+        JSON file changes (see reload_if_changed).
+
+        Args:
+            interval (float, optional): Seconds between checks of file.
+            Defaults to 1.0.
+
+        Raises:
+            NotImplementedError: Database uses lazy source.
+        """
+        if self._get_pokemon_source() is not None:
+            raise NotImplementedError(
+                'Only databases loaded from JSON file can be watched'
+                )
+        if self._watcher is not None:
+            return
+        with self._reload_lock:
+            try:
+                self._remember_row_hashes()
+            except Exception:
+                pass
+        self._watcher_stop = threading.Event()
+        self._watcher = threading.Thread(
+            target=self._watch_file, args=(interval,), daemon=True
+            )
+        self._watcher.start()
+
+    def stop_watching(self) -> None:
+        """Stops background thread started by start_watching.
+        """
+        if self._watcher is None:
+            return
+        self._watcher_stop.set()
+        self._watcher.join()
+        self._watcher = None
+
+    def close(self) -> None:
+        """Stops watching file (see start_watching) and releases resources
+        of lazy source (ex. open JSON file of streaming mode or mapped
+        record file). Pokemons already loaded into list stay available.
+        """
+        self.stop_watching()
+        source = self._get_pokemon_source()
+        if source is not None:
+            source.close()
+
+    def __enter__(self) -> 'PokemonDatabase':
+        return self
+
+    def __exit__(self, *args) -> None:
+        self.close()
+
+    def get_reload_error(self) -> (Exception | None):
+        """Returns error of last failed reload done by watching thread.
+
+        Returns:
+            Exception | None: Error or None if last reload was successful.
+        """
+        return self._reload_error
+
+    def _load_streaming_from_json(self) -> None:
+        """Opens JSON file from given path in __init__ and sets it as lazy
+        source, which reads pokemons one row at a time.\n
+        Malformed rows throw exception only when they are reached.
+        """
+        file_hantle = open_json_file(self._get_base_file_path())
+        self._pokemon_source = StreamingPokemonSource(file_hantle)
+
+    def _load_lazily_from_json(self) -> None:
+        """Parses JSON file from given path in __init__ and sets it's raw
+        rows as lazy source, which checks and converts them on first access.
+
+        Raises:
+            MalformedPokemonDataError: Format of given file is not
+            supported.
+
+        """
+        with open_json_file(self._get_base_file_path()) as file_hantle:
+            format_version, data = io_read_format_rows(
+                file_hantle, self._get_json_backend()
+                )
+        self._pokemon_source = LazyRowsPokemonSource(
+            data, format_version, self._shared_values
+            )
+
+    def validate_all(self, parallel: (bool | None) = None,
+                     workers: (int | None) = None) -> None:
+        """Checks every pokemon of database at once, for deployments which
+        must not start with malformed file. Does nothing if every pokemon
+        is already loaded into list.\n
+        Throws exception if any pokemon is malformed.
+
+        Args:
+            parallel (bool | None, optional): Checks rows in worker
+            processes (see model_io.read_from_json). Defaults to None
+            (parallel mode given in __init__).
+            workers (int | None, optional): Number of worker processes in
+            parallel mode. Defaults to None (number of CPUs).
+
+        Raises:
+            MalformedPokemonDataError: returns type of data corruption
+            from given file and row where it was found.
+        """
+        if self._get_loaded_snapshot() is not None:
+            return
+        if parallel is None:
+            parallel = self._parallel
+        self._set_pokemon_base_list(
+            self._get_pokemon_source().validate_all(parallel, workers)
+            )
+
+    def _load_from_record_file(self) -> None:
+        """Maps record file from given path in __init__ and sets it as lazy
+        source. Pokemons are created only when they are accessed.
+
+        Raises:
+            MalformedPokemonDataError: Given file is not a record file.
+
+        """
+        self._pokemon_source = RecordFilePokemonSource(
+            self._get_base_file_path()
+            )
+
+    def _load_from_shared_memory(self) -> None:
+        """Attaches to shared memory segment from given path in __init__
+        and sets it as lazy source. Pokemons are created only when they
+        are accessed.
+
+        Raises:
+            FileNotFoundError: Given segment does not exist.
+            MalformedPokemonDataError: Given segment has no pokemons.
+
+        """
+        self._pokemon_source = SharedMemoryPokemonSource(
+            get_shared_memory_name(self._get_base_file_path())
+            )
+
+    def publish_to_shared_memory(self) -> SharedPokemonDatabase:
+        """Publishes validated pokemons of database in shared memory (see
+        model_shared), so worker processes can open it with returned
+        database's path instead of reading and checking given file again.
+        Published database is in pokedex number order.\n
+        Segment is removed when returned object is closed or garbage
+        collected, or when this process exits.
+
+        Raises:
+            MalformedPokemonDataError: Pokedex number is repeated or ability
+            of pokemon contains record file's separator character.
+
+        Returns:
+            SharedPokemonDatabase: Owner of published segment.
+        """
+        return SharedPokemonDatabase(sorted(
+            self.get_pokemon_database_list(),
+            key=lambda pokemon: pokemon.get_pokedex_number()
+            ))
+
+    def _load_from_sqlite(self) -> None:
+        """Opens SQLite database from given path in __init__ and sets it as
+        lazy source. Lookups and searches are done with database indexes.
+
+        Raises:
+            MalformedPokemonDataError: Given file is not a pokemon
+            SQLite database.
+
+        """
+        self._pokemon_source = SqlitePokemonSource(self._get_base_file_path())
+
+    def _load_from_shards(self) -> None:
+        """Reads manifest of sharded database from given path in __init__
+        and sets it as lazy source. Shards are read only when lookup or
+        search needs them.
+
+        Raises:
+            MalformedPokemonDataError: Given file is not a valid manifest.
+
+        """
+        self._pokemon_source = ShardedPokemonSource(
+            self._get_base_file_path()
+            )
+
     def _search_name(self, substring: str) -> list[BasePokemon]:
         """Searches for every pokemon with matching substring.
-        Given search is not case sensitive.\n
+        Given search is not case sensitive and substring is compared as
+        plain text, using substring index (see database_index).\n
         Returns empty list if substring is empty
         or when none of given pokemons contains substring.\n
         For example 'ika' is in 'Pikachu', but not in 'Raichu'.
@@ -115,16 +768,15 @@ class PokemonDatabase:
         """
         if substring == '' or None:
             return []
-        matching_pokemons = []
-        pokemons_list = self.get_pokemon_database_list()
-        for pokemon in pokemons_list:
-            name = pokemon.get_name()
-            if re.search(substring, name, re.IGNORECASE):
-                matching_pokemons.append(pokemon)
-        return matching_pokemons
+        snapshot = self._get_loaded_snapshot()
+        if snapshot is None:
+            return self._get_pokemon_source().search_name(substring)
+        return snapshot.get_index().search_name(substring)
 
     def get_pokemon_using_name(self, name: str) -> BasePokemon:
         """Return BasePokemon object using given name.\n
+        Given name is not case sensitive and must be whole pokemon's name,
+        it is compared as plain text (ex. 'mr. mime').\n
         Thows exception if none of give pokemons has given name.
 
         Args:
@@ -142,18 +794,23 @@ class PokemonDatabase:
             raise BadConversionError('Given name is not a string')
         if not name:
             raise DataDoesNotExistError('Given string is empty')
-        for pokemon in self.get_pokemon_database_list():
-            if re.match(pokemon.get_name(), name, re.IGNORECASE):
-                return pokemon
+        snapshot = self._get_loaded_snapshot()
+        if snapshot is None:
+            pokemon = self._get_pokemon_source().get_pokemon_using_name(name)
         else:
+            pokemon = snapshot.get_index().get_pokemon_using_name(name)
+        if pokemon is None:
             raise PokemonDataDoesNotExistError(
                 "Pokemon with given name does not exist"
                 )
+        return pokemon
 
     def _search_pokedex_number(self, number: int) -> list[BasePokemon]:
         """Searches for every pokemon with given equal or part of number and
         returns list of every matching pokemon.\n
-        Pokemon with equal value always appeares first in givel list.\n
+        Pokemon with equal value always appeares first in givel list, other
+        ones are in database order. Search is done with digit substring
+        index (see database_index).\n
         Returns empty list if number is lesser or equal 0, greater than 65535
         or when none of given pokemons has given pokedex_number or it's part.\n
         For example '56' returns list with pokemon '56' as first and '156',
@@ -165,19 +822,12 @@ class PokemonDatabase:
         Returns:
             list: List with BasePokemon objects with matching pokedex_number.
         """
-        if number <= 0 or number > 65535:
+        if not is_searched_pokedex_number(number):
             return []
-        number_as_str = str(number)
-        matching_pokemons = []
-        pokemons_list = self.get_pokemon_database_list()
-        for pokemon in pokemons_list:
-            pokedex_number = str(pokemon.get_pokedex_number())
-            if pokedex_number == number_as_str:
-                matching_pokemons.insert(0, pokemon)
-            if len(number_as_str) < len(pokedex_number):
-                if number_as_str in pokedex_number:
-                    matching_pokemons.append(pokemon)
-        return matching_pokemons
+        snapshot = self._get_loaded_snapshot()
+        if snapshot is None:
+            return self._get_pokemon_source().search_pokedex_number(number)
+        return snapshot.get_index().search_pokedex_number(number)
 
     def get_pokemon_using_pokedex_number(
             self, value: (int | str)) -> BasePokemon:
@@ -209,13 +859,46 @@ class PokemonDatabase:
         except NotANumberError:
             raise NotANumberError('Given string is not a number')
 
-        for pokemon in self.get_pokemon_database_list():
-            if pokemon.get_pokedex_number() == value:
-                return pokemon
+        snapshot = self._get_loaded_snapshot()
+        if snapshot is None:
+            pokemon = self._get_pokemon_source(
+                ).get_pokemon_using_pokedex_number(value)
         else:
+            pokemon = snapshot.get_index().get_pokemon_using_pokedex_number(
+                value
+                )
+        if pokemon is None:
             raise PokemonDataDoesNotExistError(
                 "Pokemon with given pokedex number does not exist"
                 )
+        return pokemon
+
+    def get_pokemons_using_type(self, pokemon_type: str) -> list[BasePokemon]:
+        """Returns list of every pokemon with given primary or secondary
+        type, in database order. Given type is not case sensitive.
+
+        Args:
+            pokemon_type (str): Pokemon type, ex. 'fire'.
+
+        Raises:
+            BadConversionError: Given type is not a string.
+            DataDoesNotExistError: Given type is empty.
+
+        Returns:
+            list: List with BasePokemon objects with given type.
+        """
+        if not isinstance(pokemon_type, str):
+            raise BadConversionError('Given type is not a string')
+        if not pokemon_type:
+            raise DataDoesNotExistError('Given string is empty')
+        pokemon_type = pokemon_type.lower()
+        snapshot = self._get_loaded_snapshot()
+        if snapshot is None:
+            return self._get_pokemon_source().search_type(pokemon_type)
+        return [
+            pokemon for pokemon in snapshot.get_pokemon_list()
+            if pokemon_type in pokemon.get_types()
+        ]
 
     def search_database(
                 self, query: (str | int)
@@ -251,13 +934,207 @@ class PokemonDatabase:
             return None
         return search_result
 
+    def search_name_fuzzy(
+                self, name: str,
+                count: int = FUZZY_RESULT_COUNT,
+                max_distance: int = FUZZY_MAX_DISTANCE
+                ) -> (list[BasePokemon] | None):
+        """Searches for pokemons with names closest to given, possibly
+        misspelled, name by edit distance (ex. 'Charizrd' finds
+        'Charizard'), using BK-tree of names (see database_index).
+        Search is not case sensitive.\n
+        Returns list of pokemons with up to count closest names, the
+        closest first, or None if no name is within max_distance edits.\n
+        If database uses lazy source, every pokemon is loaded from it
+        first, like in get_pokemon_database_list.
+
+        Args:
+            name (str): Searched name.
+            count (int, optional): The most returned distinct names.
+            Defaults to FUZZY_RESULT_COUNT.
+            max_distance (int, optional): The greatest edit distance of
+            returned names. Defaults to FUZZY_MAX_DISTANCE.
+
+        Raises:
+            BadConversionError: Given name is not a string.
+            DataDoesNotExistError: Given name is empty.
+
+        Returns:
+            list | None: list of BasePokemon objects or None
+        """
+        if not isinstance(name, str):
+            raise BadConversionError('Given name is not a string')
+        if not name:
+            raise DataDoesNotExistError('Given string is empty')
+        search_result = self._get_full_snapshot().get_index(
+            ).search_name_fuzzy(
+            name, count, max_distance
+            )
+        if not search_result:
+            return None
+        return search_result
+
+    def create_search_session(self) -> 'PokemonSearchSession':
+        """Returns new search session of this database, which reuses
+        results of previous query when query is extended (ex. search as
+        user types, see PokemonSearchSession).
+
+        Returns:
+            PokemonSearchSession: New search session.
+        """
+        return PokemonSearchSession(self)
+
+
+def is_searched_pokedex_number(number: int) -> bool:
+    """Checks if given number is between MIN_SEARCHED_POKEDEX_NUMBER and
+    MAX_SEARCHED_POKEDEX_NUMBER, so it can be searched for.
+    """
+    return (
+        MIN_SEARCHED_POKEDEX_NUMBER <= number <= MAX_SEARCHED_POKEDEX_NUMBER
+        )
+
+
+class PokemonSearchSession:
+    """Search of pokemon database with the same rules and results as
+    PokemonDatabase.search_database, for queries typed one character at
+    a time. When new name query contains previous one (ex. 'pik' after
+    'pi'), only names found by previous query are checked if there are
+    fewer of them than candidates from substring index (see
+    database_index). Pokedex numbers are found with dict lookup anyway.\n
+    When database is read from lazy source, which scans every pokemon,
+    previous result is filtered for extended name and number queries.\n
+    Session notices when database's list is replaced (ex. reloaded) and
+    does not reuse results found in old list.
+    """
+    def __init__(self, database: PokemonDatabase) -> None:
+        """Creates empty session of given database.
+
+        Args:
+            database (PokemonDatabase): Searched database.
+        """
+        self._database = database
+        self.reset()
+
+    def reset(self) -> None:
+        """Forgets previous query, so next one is searched in database.
+        """
+        self._snapshot = None
+        self._query = None
+        self._is_number = False
+        self._positions = None
+        self._result = []
+
+    def _can_narrow(self, query: str, is_number: bool,
+                    snapshot: (PokemonBaseSnapshot | None)) -> bool:
+        """Checks if pokemons matching given query are among pokemons
+        found by previous query in given snapshot of database.
+        """
+        return (
+            self._query is not None
+            and self._is_number == is_number
+            and self._snapshot is snapshot
+            and self._query in query
+            )
+
+    def _narrow_name(self, substring: str) -> list[BasePokemon]:
+        return [
+            pokemon for pokemon in self._result
+            if substring in fold_name(pokemon.get_name())
+        ]
+
+    def _narrow_pokedex_number(self, digits: str) -> list[BasePokemon]:
+        equal_pokemons = []
+        matching_pokemons = []
+        for pokemon in self._result:
+            pokedex_number = str(pokemon.get_pokedex_number())
+            if pokedex_number == digits:
+                equal_pokemons.append(pokemon)
+            elif digits in pokedex_number:
+                matching_pokemons.append(pokemon)
+        return equal_pokemons + matching_pokemons
+
+    def search(self, query: (str | int)) -> (list[BasePokemon] | None):
+        """Searches for given query like PokemonDatabase.search_database,
+        reusing result of previous query when it's possible.\n
+        Returns list of BasePokemon objects matching criteria or None if
+        none of given pokemons match it. Empty query returns every pokemon
+        and resets session.
+
+        Args:
+            query (str | str -> int | int): Any str, str convertable to
+            int or in value to search in database
+
+        Raises:
+            BadConversionError: Given query value is not a int or str
+
+        Returns:
+            list | None: list of BasePokemon objects or None
+        """
+        if not isinstance(query, (str, int)):
+            raise BadConversionError(
+                'Given query data type cannot be used for searching'
+                )
+        database = self._database
+        if not query:
+            self.reset()
+            return database.get_pokemon_database_list()
+        try:
+            number = io_convert_to_int(query)
+        except Exception:
+            number = None
+        is_number = number is not None
+        if is_number and not is_searched_pokedex_number(number):
+            self.reset()
+            return None
+        query = str(number) if is_number else fold_name(query)
+        # Snapshot is taken once, so previous positions are never used in
+        # list swapped meanwhile by reload.
+        snapshot = database._get_loaded_snapshot()
+        can_narrow = self._can_narrow(query, is_number, snapshot)
+        positions = None
+        if snapshot is None:
+            if is_number:
+                result = self._narrow_pokedex_number(query) if (
+                    can_narrow
+                    ) else database._search_pokedex_number(number)
+            else:
+                result = self._narrow_name(query) if (
+                    can_narrow
+                    ) else database._search_name(query)
+        elif is_number:
+            result = snapshot.get_index().search_pokedex_number(number)
+        else:
+            pokemon_index = snapshot.get_index()
+            positions = pokemon_index.search_name_positions(
+                query, self._positions if can_narrow else None
+                )
+            result = pokemon_index.get_pokemons(positions)
+        self._snapshot = snapshot
+        self._query = query
+        self._is_number = is_number
+        self._positions = positions
+        self._result = result
+        if not result:
+            return None
+        return result
+
 
 class PyGameObjectsDatabase:
     """Database with every single object used in every game menu
     """
     def __init__(self) -> None:
-        """Inits saved object as dict of given game and menu states
+        """Inits saved object as dict of given game and menu states.\n
+        pygame_objects (and pygame with it) is imported only here, so
+        PokemonDatabase can be used without pygame.
         """
+        from pygame_objects import (
+            Button,
+            PokemonList,
+            PokemonBalls,
+            PokemonFrame,
+            SpecialList,
+            GamePokemonList
+        )
         self._objects_base_dict = {
             'main_menu': {
                 'main_menu': {
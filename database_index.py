@@ -0,0 +1,455 @@
+from array import array
+from bisect import bisect_left
+from typing import Iterable, Sequence
+from classes import BasePokemon
+
+
+# In-memory indexes of PokemonDatabase's list of pokemons, built once
+# whenever list is replaced (see PokemonDatabase._set_pokemon_base_list),
+# so they always describe the list they were built from. When pokedex
+# number or name is repeated, index keeps the first pokemon in database
+# order, like linear search did.
+
+# Length of name fragments in substring index. Shorter queries are
+# checked against every name.
+NGRAM_SIZE = 3
+
+# Default limits of fuzzy name search: the most returned names and the
+# greatest edit distance from searched name.
+FUZZY_RESULT_COUNT = 5
+FUZZY_MAX_DISTANCE = 2
+
+# Posting list is intersected with binary search for every candidate
+# position when it is this many times longer than candidates list,
+# otherwise whole list is intersected as set.
+_BISECT_RATIO = 16
+
+
+def fold_name(name: str) -> str:
+    """ Returns given pokemon name in form used by name indexes, so names
+    are compared without case (ex. 'PIKACHU' and 'Pikachu' are equal).
+    """
+    return name.casefold()
+
+
+def _get_ngrams(text: str) -> set[str]:
+    return {
+        text[start:start + NGRAM_SIZE]
+        for start in range(len(text) - NGRAM_SIZE + 1)
+    }
+
+
+def _intersect_positions(positions: Sequence[int],
+                         postings: Sequence[int]) -> list[int]:
+    """ Returns given sorted positions which are also in given sorted
+    posting list, using binary search (positions are much fewer).
+    """
+    result = []
+    start = 0
+    end = len(postings)
+    for position in positions:
+        start = bisect_left(postings, position, start, end)
+        if start == end:
+            break
+        if postings[start] == position:
+            result.append(position)
+    return result
+
+
+def _get_char_masks(text: str) -> dict[str, int]:
+    """ Returns bit mask of positions of every character in given text,
+    used by _get_edit_distance.
+    """
+    char_masks = {}
+    for position, char in enumerate(text):
+        char_masks[char] = char_masks.get(char, 0) | (1 << position)
+    return char_masks
+
+
+def _get_edit_distance(text: str, char_masks: dict[str, int],
+                       other_text: str) -> int:
+    """ Returns Levenshtein distance between given texts, computing one
+    column of distances per character of other_text as bit vectors
+    (Myers' algorithm in Hyyro's form).
+
+    Args:
+        text (str): First text.
+        char_masks (dict[str, int]): Result of _get_char_masks for text.
+        other_text (str): Second text.
+
+    Returns:
+        int: Number of inserted, deleted or replaced characters.
+    """
+    length = len(text)
+    if not length:
+        return len(other_text)
+    full_mask = (1 << length) - 1
+    last_bit = 1 << (length - 1)
+    positive = full_mask
+    negative = 0
+    distance = length
+    for char in other_text:
+        equal = char_masks.get(char, 0)
+        vertical = equal | negative
+        horizontal = (((equal & positive) + positive) ^ positive) | equal
+        horizontal_positive = negative | (~(horizontal | positive) & full_mask)
+        horizontal_negative = positive & horizontal
+        if horizontal_positive & last_bit:
+            distance += 1
+        elif horizontal_negative & last_bit:
+            distance -= 1
+        horizontal_positive = ((horizontal_positive << 1) | 1) & full_mask
+        horizontal_negative = (horizontal_negative << 1) & full_mask
+        positive = horizontal_negative | (
+            ~(vertical | horizontal_positive) & full_mask
+            )
+        negative = horizontal_positive & vertical
+    return distance
+
+
+def get_edit_distance(text: str, other_text: str) -> int:
+    """ Returns Levenshtein distance between given texts: the least
+    number of inserted, deleted or replaced characters changing one text
+    into the other (ex. 'pikachoo' and 'pikachu' have distance 2).
+    """
+    return _get_edit_distance(text, _get_char_masks(text), other_text)
+
+
+class NameSubstringIndex:
+    """ Trigram inverted index of case-folded names: every fragment of
+    NGRAM_SIZE characters has sorted list of positions of names containing
+    it. Positions of names containing query are found by intersecting
+    lists of query's fragments, then checked with plain substring test.
+    """
+    def __init__(self, names: Iterable[str]) -> None:
+        """ Builds index of given names.
+
+        Args:
+            names (Iterable[str]): Names in database order.
+        """
+        self._folded_names = []
+        self._postings = {}
+        postings = self._postings
+        for position, name in enumerate(names):
+            folded_name = fold_name(name)
+            self._folded_names.append(folded_name)
+            for ngram in _get_ngrams(folded_name):
+                ngram_postings = postings.get(ngram)
+                if ngram_postings is None:
+                    ngram_postings = postings[ngram] = array('i')
+                ngram_postings.append(position)
+
+    def __len__(self) -> int:
+        return len(self._folded_names)
+
+    def search(self, substring: str,
+               candidates: (Sequence[int] | None) = None) -> list[int]:
+        """ Returns positions of names containing given substring, ignoring
+        case, in database order. Substring is compared as plain text.
+        When sorted positions of every possible match are given (ex. result
+        of search for part of substring), they are checked instead of the
+        whole index if there are fewer of them.
+
+        Args:
+            substring (str): Substring given for search.
+            candidates (Sequence[int] | None, optional): Sorted positions
+            including every matching name. Defaults to None (every name).
+
+        Returns:
+            list: Positions of matching names.
+        """
+        substring = fold_name(substring)
+        folded_names = self._folded_names
+        if len(substring) < NGRAM_SIZE:
+            if candidates is None:
+                candidates = range(len(folded_names))
+            return [
+                position for position in candidates
+                if substring in folded_names[position]
+            ]
+        posting_lists = []
+        for ngram in _get_ngrams(substring):
+            ngram_postings = self._postings.get(ngram)
+            if ngram_postings is None:
+                return []
+            posting_lists.append(ngram_postings)
+        posting_lists.sort(key=len)
+        if candidates is not None and (
+                    len(candidates) <= len(posting_lists[0])
+                ):
+            return [
+                position for position in candidates
+                if substring in folded_names[position]
+            ]
+        if len(substring) == NGRAM_SIZE:
+            # Substring is a fragment, every name in it's list has it.
+            return list(posting_lists[0])
+        positions = set(posting_lists[0])
+        for ngram_postings in posting_lists[1:]:
+            if len(positions) * _BISECT_RATIO < len(ngram_postings):
+                positions = set(_intersect_positions(
+                    sorted(positions), ngram_postings
+                    ))
+            else:
+                positions.intersection_update(ngram_postings)
+            if not positions:
+                return []
+        return [
+            position for position in sorted(positions)
+            if substring in folded_names[position]
+        ]
+
+
+class NameBKTree:
+    """ BK-tree of case-folded names: every child of node is stored under
+    it's edit distance from node's name, so search for names close to
+    query skips subtrees which, by triangle inequality, are too far
+    from it. Repeated names are kept in one node.
+    """
+    def __init__(self, names: Iterable[str]) -> None:
+        """ Builds tree of given names.
+
+        Args:
+            names (Iterable[str]): Names in database order.
+        """
+        # node: [folded name, it's char masks, positions, children]
+        self._root = None
+        self._name_count = 0
+        for position, name in enumerate(names):
+            self._add(fold_name(name), position)
+
+    def __len__(self) -> int:
+        """ Returns number of distinct names in tree.
+        """
+        return self._name_count
+
+    def _add(self, name: str, position: int) -> None:
+        if self._root is None:
+            self._root = [name, _get_char_masks(name), [position], {}]
+            self._name_count = 1
+            return
+        node = self._root
+        while True:
+            distance = _get_edit_distance(node[0], node[1], name)
+            if not distance:
+                node[2].append(position)
+                return
+            child = node[3].get(distance)
+            if child is None:
+                node[3][distance] = [
+                    name, _get_char_masks(name), [position], {}
+                ]
+                self._name_count += 1
+                return
+            node = child
+
+    def search(self, name: str,
+               count: int = FUZZY_RESULT_COUNT,
+               max_distance: int = FUZZY_MAX_DISTANCE) -> list[int]:
+        """ Returns positions of given count of names closest to given
+        name, ignoring case, not further than max_distance edits from it.
+        Names are ordered by distance, then by position of their first
+        appearance, positions of repeated name are next to each other.
+
+        Args:
+            name (str): Searched name.
+            count (int, optional): The most returned distinct names.
+            Defaults to FUZZY_RESULT_COUNT.
+            max_distance (int, optional): The greatest edit distance of
+            returned names. Defaults to FUZZY_MAX_DISTANCE.
+
+        Returns:
+            list: Positions of closest names.
+        """
+        if self._root is None or count < 1 or max_distance < 0:
+            return []
+        name = fold_name(name)
+        radius = max_distance
+        found = []
+        nodes = [self._root]
+        while nodes:
+            node = nodes.pop()
+            distance = _get_edit_distance(node[0], node[1], name)
+            if distance <= radius:
+                found.append((distance, node[2][0], node[2]))
+                if len(found) >= count:
+                    # Names further than count-th closest one are not
+                    # needed, so search radius shrinks.
+                    found.sort()
+                    del found[count:]
+                    radius = found[-1][0]
+            for child_distance, child in node[3].items():
+                if distance - radius <= child_distance <= distance + radius:
+                    nodes.append(child)
+        found.sort()
+        return [
+            position
+            for distance, first_position, positions in found[:count]
+            for position in positions
+        ]
+
+
+class PokemonIndex:
+    """ Dict indexes of pokemons by pokedex number and by case-folded
+    name, for constant time lookups, and substring index of their names
+    (see NameSubstringIndex) and of their pokedex numbers' digits.
+    Substring indexes are built on first name and first number search
+    and BK-tree of names (see NameBKTree) on first fuzzy search, so loads
+    and reloads pay only for dict indexes.
+    """
+    def __init__(self, pokemons: Iterable[BasePokemon] = ()) -> None:
+        """ Builds indexes of given pokemons.
+
+        Args:
+            pokemons (Iterable[BasePokemon], optional): Pokemons in
+            database order. Defaults to () (empty index).
+        """
+        self._pokemons = list(pokemons)
+        self._numbers = {}
+        self._names = {}
+        for pokemon in self._pokemons:
+            self._numbers.setdefault(pokemon.get_pokedex_number(), pokemon)
+            self._names.setdefault(fold_name(pokemon.get_name()), pokemon)
+        self._name_substrings = None
+        self._name_tree = None
+        self._number_indexes = None
+
+    def get_pokemon_using_pokedex_number(
+            self, pokedex_number: int) -> (BasePokemon | None):
+        """ Returns first pokemon with given pokedex number or None if it
+        does not exist.
+
+        Args:
+            pokedex_number (int): Pokemon's pokedex number.
+
+        Returns:
+            BasePokemon | None: Matching pokemon.
+        """
+        return self._numbers.get(pokedex_number)
+
+    def get_pokemon_using_name(self, name: str) -> (BasePokemon | None):
+        """ Returns first pokemon with given name, ignoring case, or None
+        if it does not exist. Name is compared as plain text.
+
+        Args:
+            name (str): Pokemon's name.
+
+        Returns:
+            BasePokemon | None: Matching pokemon.
+        """
+        return self._names.get(fold_name(name))
+
+    def search_name(self, substring: str) -> list[BasePokemon]:
+        """ Returns every pokemon with name containing given substring,
+        ignoring case, in database order. Substring is compared as plain
+        text (ex. 'mime' finds 'Mr. Mime' and 'Mime Jr.').
+
+        Args:
+            substring (str): Substring given for search.
+
+        Returns:
+            list: List with BasePokemon objects with matching name.
+        """
+        return self.get_pokemons(self.search_name_positions(substring))
+
+    def search_name_positions(
+            self, substring: str,
+            candidates: (Sequence[int] | None) = None) -> list[int]:
+        """ Returns positions of pokemons found by search_name, checking
+        only given candidates when it's faster (see
+        NameSubstringIndex.search).
+
+        Args:
+            substring (str): Substring given for search.
+            candidates (Sequence[int] | None, optional): Sorted positions
+            including every matching pokemon. Defaults to None.
+
+        Returns:
+            list: Positions of matching pokemons.
+        """
+        if self._name_substrings is None:
+            self._name_substrings = NameSubstringIndex(
+                pokemon.get_name() for pokemon in self._pokemons
+                )
+        return self._name_substrings.search(substring, candidates)
+
+    def search_name_fuzzy(self, name: str,
+                          count: int = FUZZY_RESULT_COUNT,
+                          max_distance: int = FUZZY_MAX_DISTANCE
+                          ) -> list[BasePokemon]:
+        """ Returns pokemons with given count of names closest to given
+        name by edit distance, ignoring case, not further than
+        max_distance edits from it (ex. 'Pikachoo' finds 'Pikachu'),
+        the closest ones first.
+
+        Args:
+            name (str): Searched name, can be misspelled.
+            count (int, optional): The most returned distinct names.
+            Defaults to FUZZY_RESULT_COUNT.
+            max_distance (int, optional): The greatest edit distance of
+            returned names. Defaults to FUZZY_MAX_DISTANCE.
+
+        Returns:
+            list: List with BasePokemon objects with the closest names.
+        """
+        if self._name_tree is None:
+            self._name_tree = NameBKTree(
+                pokemon.get_name() for pokemon in self._pokemons
+                )
+        return self.get_pokemons(
+            self._name_tree.search(name, count, max_distance)
+            )
+
+    def get_pokemons(self, positions: Iterable[int]) -> list[BasePokemon]:
+        """ Returns pokemons at given positions of database's list.
+        """
+        pokemons = self._pokemons
+        return [pokemons[position] for position in positions]
+
+    def _get_number_indexes(self) -> tuple[dict, dict]:
+        """ Returns positions of pokemons by every digit substring of
+        their pokedex numbers, building them on first call: dict of exact
+        numbers and dict of substrings of longer numbers.
+        """
+        if self._number_indexes is not None:
+            return self._number_indexes
+        number_positions = {}
+        number_substrings = {}
+        for position, pokemon in enumerate(self._pokemons):
+            digits = str(pokemon.get_pokedex_number())
+            number_positions.setdefault(digits, []).append(position)
+            substrings = {
+                digits[start:end]
+                for start in range(len(digits))
+                for end in range(start + 1, len(digits) + 1)
+            }
+            substrings.discard(digits)
+            for substring in substrings:
+                postings = number_substrings.get(substring)
+                if postings is None:
+                    postings = number_substrings[substring] = array('i')
+                postings.append(position)
+        self._number_indexes = number_positions, number_substrings
+        return self._number_indexes
+
+    def search_pokedex_number(self, number: int) -> list[BasePokemon]:
+        """ Returns pokemons with given pokedex number first, then every
+        pokemon with longer pokedex number containing given one's digits.
+        Both groups are in database order.
+
+        Args:
+            number (int): Exact or part of pokemon's pokedex_number.
+
+        Returns:
+            list: List with BasePokemon objects with matching pokedex_number.
+        """
+        digits = str(number)
+        pokemons = self._pokemons
+        number_positions, number_substrings = self._get_number_indexes()
+        return [
+            pokemons[position]
+            for position in number_positions.get(digits, ())
+        ] + [
+            pokemons[position]
+            for position in number_substrings.get(digits, ())
+        ]
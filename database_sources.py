@@ -0,0 +1,720 @@
+import io
+from typing import Iterator
+from classes import BasePokemon, SharedPokemonValues
+from model_io import (
+    get_worker_count,
+    iter_from_json,
+    io_convert_to_int,
+    io_return_valid_pokemon,
+    io_return_valid_pokemons_parallel,
+    JSON_FORMAT_V1,
+    JSON_STREAM_CHUNK_SIZE,
+    PARALLEL_ROWS_THRESHOLD
+)
+from model_records import PokemonRecordFile
+from model_shared import attach_shared_memory
+from database_index import fold_name
+from model_sqlite import PokemonSqliteFile
+from model_shards import read_manifest, read_shard
+
+
+class PokemonSource:
+    """Base class for sources that give PokemonDatabase it's BasePokemon
+    objects lazily, instead of as one list loaded at once.
+    """
+    def __iter__(self) -> Iterator[BasePokemon]:
+        """Yields every BasePokemon object from source in database order.
+
+        Raises:
+            NotImplementedError: Method must be implemented in child class.
+        """
+        raise NotImplementedError
+
+    def get_pokemon_using_pokedex_number(
+            self, pokedex_number: int) -> (BasePokemon | None):
+        """Returns pokemon with given pokedex number or None if it does
+        not exist. Child classes can replace iteration with faster lookup.
+
+        Args:
+            pokedex_number (int): Pokemon's pokedex number.
+
+        Returns:
+            BasePokemon | None: Matching pokemon.
+        """
+        for pokemon in self:
+            if pokemon.get_pokedex_number() == pokedex_number:
+                return pokemon
+        return None
+
+    def get_pokemon_using_name(self, name: str) -> (BasePokemon | None):
+        """Returns first pokemon matching given name (with the same rules
+        as PokemonDatabase.get_pokemon_using_name) or None if it does
+        not exist. Child classes can replace iteration with faster lookup.
+
+        Args:
+            name (str): Pokemon's name.
+
+        Returns:
+            BasePokemon | None: Matching pokemon.
+        """
+        folded_name = fold_name(name)
+        for pokemon in self:
+            if fold_name(pokemon.get_name()) == folded_name:
+                return pokemon
+        return None
+
+    def search_name(self, substring: str) -> list[BasePokemon]:
+        """Returns every pokemon with name containing given substring
+        (with the same rules as PokemonDatabase._search_name).
+        Child classes can replace iteration with faster search.
+
+        Args:
+            substring (str): Substring given for search.
+
+        Returns:
+            list: List with BasePokemon objects with matching name.
+        """
+        folded_substring = fold_name(substring)
+        return [
+            pokemon for pokemon in self
+            if folded_substring in fold_name(pokemon.get_name())
+        ]
+
+    def search_pokedex_number(self, number: int) -> list[BasePokemon]:
+        """Returns every pokemon with given equal or part of pokedex number
+        (with the same rules as PokemonDatabase._search_pokedex_number).
+        Child classes can replace iteration with faster search.
+
+        Args:
+            number (int): Exact or part of pokemon's pokedex_number.
+
+        Returns:
+            list: List with BasePokemon objects with matching pokedex_number.
+        """
+        number_as_str = str(number)
+        equal_pokemons = []
+        matching_pokemons = []
+        for pokemon in self:
+            pokedex_number = str(pokemon.get_pokedex_number())
+            if pokedex_number == number_as_str:
+                equal_pokemons.append(pokemon)
+            elif number_as_str in pokedex_number:
+                matching_pokemons.append(pokemon)
+        return equal_pokemons + matching_pokemons
+
+    def search_type(self, pokemon_type: str) -> list[BasePokemon]:
+        """Returns every pokemon with given primary or secondary type.
+        Child classes can replace iteration with faster search.
+
+        Args:
+            pokemon_type (str): Pokemon type, ex. 'fire'.
+
+        Returns:
+            list: List with BasePokemon objects with given type.
+        """
+        return [
+            pokemon for pokemon in self if pokemon_type in pokemon.get_types()
+        ]
+
+    def validate_all(self, parallel: bool = False,
+                     workers: (int | None) = None) -> list[BasePokemon]:
+        """Loads and checks every pokemon of source at once and returns
+        them. Child classes can check pokemons in parallel.
+
+        Args:
+            parallel (bool, optional): Checks rows in worker processes.
+            Defaults to False.
+            workers (int | None, optional): Number of worker processes in
+            parallel mode. Defaults to None (number of CPUs).
+
+        Raises:
+            MalformedPokemonDataError: returns type of data corruption
+            and row where it was found.
+
+        Returns:
+            list: List of every BasePokemon object in database order.
+        """
+        return list(self)
+
+    def close(self) -> None:
+        """Releases every resource (ex. open files) used by source.
+        """
+        pass
+
+
+class StreamingPokemonSource(PokemonSource):
+    """Source that reads pokemons from JSON file one row at a time,
+    only when they are needed. Already read pokemons are kept, so file
+    is read only once.
+    """
+    def __init__(self,
+                 file_hantle: io.TextIOWrapper,
+                 chunk_size: int = JSON_STREAM_CHUNK_SIZE) -> None:
+        """Creates source reading from given open JSON file.
+        File is closed by source after it's last row is read.
+
+        Args:
+            file_hantle (io.TextIOWrapper): file_hantle variable from
+            json file.
+            chunk_size (int, optional): Number of characters read from file
+            at once. Defaults to JSON_STREAM_CHUNK_SIZE.
+        """
+        self._file_hantle = file_hantle
+        self._pokemon_iterator = self._iter_file(chunk_size)
+        self._loaded_pokemons = []
+        self._load_error = None
+
+    def _iter_file(self, chunk_size: int) -> Iterator[BasePokemon]:
+        """Yields pokemons read from file, which is closed when the last
+        one is read, when reading fails or when generator is closed.
+        """
+        try:
+            yield from iter_from_json(self._file_hantle, chunk_size)
+        finally:
+            self._file_hantle.close()
+
+    def _load_next_pokemon(self) -> (BasePokemon | None):
+        """Reads next pokemon from file and returns it, or None if every
+        pokemon was already read.\n
+        Error found in file is thrown again every time it is reached.
+
+        Raises:
+            MalformedPokemonDataError: returns type of data corruption
+            from JSON file and row where it was found.
+
+        Returns:
+            BasePokemon | None: Next pokemon from file.
+        """
+        if self._load_error is not None:
+            raise self._load_error
+        if self._pokemon_iterator is None:
+            return None
+        try:
+            pokemon = next(self._pokemon_iterator)
+        except StopIteration:
+            self.close()
+            return None
+        except Exception as e:
+            self._load_error = e
+            self.close()
+            raise
+        self._loaded_pokemons.append(pokemon)
+        return pokemon
+
+    def __iter__(self) -> Iterator[BasePokemon]:
+        """Yields every already read pokemon, then reads and yields
+        remaining ones from file. File stays open when iteration stops
+        early, so later lookups continue reading it, until close.
+
+        Raises:
+            MalformedPokemonDataError: returns type of data corruption
+            from JSON file and row where it was found.
+
+        Yields:
+            BasePokemon: Every pokemon in file order.
+        """
+        idx = 0
+        while True:
+            if idx < len(self._loaded_pokemons):
+                yield self._loaded_pokemons[idx]
+                idx += 1
+            elif self._load_next_pokemon() is None:
+                return
+
+    def is_closed(self) -> bool:
+        """Checks if JSON file is already closed.
+        """
+        return self._file_hantle.closed
+
+    def close(self) -> None:
+        """Closes JSON file. Pokemons that were not read yet are skipped.
+        """
+        pokemon_iterator = self._pokemon_iterator
+        self._pokemon_iterator = None
+        if pokemon_iterator is not None:
+            pokemon_iterator.close()
+        self._file_hantle.close()
+
+
+class LazyRowsPokemonSource(PokemonSource):
+    """Source keeping raw parsed rows of JSON file. Each row is checked and
+    converted to BasePokemon object on first access, and only once.
+    Lookups by pokedex number and name searches use raw rows, so only
+    matching rows are converted.
+    """
+    def __init__(self,
+                 rows: list[dict],
+                 format_version: int = JSON_FORMAT_V1,
+                 shared_values: (SharedPokemonValues | None) = None
+                 ) -> None:
+        """Creates source from given raw rows. Rows are not checked yet.
+
+        Args:
+            rows (list[dict]): Every pokemon row from json file.
+            format_version (int, optional): Format of given rows.
+            Defaults to JSON_FORMAT_V1.
+            shared_values (SharedPokemonValues | None, optional): Cache of
+            values shared between pokemons. Defaults to None (new cache).
+        """
+        self._rows = rows
+        self._format_version = format_version
+        self._shared_values = shared_values or SharedPokemonValues()
+        self._pokemons = [None] * len(rows)
+        self._number_index = None
+        self._name_index = None
+        self._unindexed_rows = False
+
+    def __len__(self) -> int:
+        return len(self._rows)
+
+    def get_loaded_count(self) -> int:
+        """Returns number of rows already converted to BasePokemon objects.
+        """
+        return sum(pokemon is not None for pokemon in self._pokemons)
+
+    def _get_pokemon(self, position: int) -> BasePokemon:
+        """Returns pokemon of row at given position, checking and converting
+        row first if it's needed.
+
+        Raises:
+            MalformedPokemonDataError: returns type of data corruption
+            from JSON file and row where it was found.
+        """
+        pokemon = self._pokemons[position]
+        if pokemon is None:
+            pokemon = io_return_valid_pokemon(
+                self._rows[position], position + 1, self._format_version
+                )
+            pokemon.share_values(self._shared_values)
+            self._pokemons[position] = pokemon
+        return pokemon
+
+    def _get_number_index(self) -> dict[int, int]:
+        """Returns positions of rows by their raw pokedex numbers, building
+        index on first use. Rows with unreadable numbers are not indexed.
+        """
+        if self._number_index is None:
+            self._number_index = {}
+            for position, item in enumerate(self._rows):
+                try:
+                    number = io_convert_to_int(item['pokedex_number'])
+                except (KeyError, TypeError, ValueError):
+                    self._unindexed_rows = True
+                    continue
+                self._number_index.setdefault(number, position)
+        return self._number_index
+
+    def _iter_raw_names(self) -> Iterator[tuple[int, str]]:
+        """Yields position and raw name of every row. Rows with invalid
+        names are converted, so they throw exception.
+
+        Raises:
+            MalformedPokemonDataError: returns type of data corruption
+            from JSON file and row where it was found.
+        """
+        for position, item in enumerate(self._rows):
+            name = item.get('name')
+            if not name or not isinstance(name, str):
+                name = self._get_pokemon(position).get_name()
+            yield position, name
+
+    def get_pokemon_using_pokedex_number(
+            self, pokedex_number: int) -> (BasePokemon | None):
+        """Returns pokemon with given pokedex number or None if it does
+        not exist. Only row of returned pokemon is converted, unless some
+        rows have unreadable pokedex numbers.
+        """
+        position = self._get_number_index().get(pokedex_number)
+        if position is not None:
+            return self._get_pokemon(position)
+        if self._unindexed_rows:
+            return super().get_pokemon_using_pokedex_number(pokedex_number)
+        return None
+
+    def _get_name_index(self) -> dict[str, int]:
+        """Returns positions of rows by their case-folded raw names,
+        building index on first use.
+
+        Raises:
+            MalformedPokemonDataError: returns type of data corruption
+            from JSON file and row where it was found.
+        """
+        if self._name_index is None:
+            name_index = {}
+            for position, name in self._iter_raw_names():
+                name_index.setdefault(fold_name(name), position)
+            self._name_index = name_index
+        return self._name_index
+
+    def get_pokemon_using_name(self, name: str) -> (BasePokemon | None):
+        """Returns first pokemon with given name or None if it does
+        not exist. Only row of returned pokemon is converted.
+        """
+        position = self._get_name_index().get(fold_name(name))
+        if position is None:
+            return None
+        return self._get_pokemon(position)
+
+    def search_name(self, substring: str) -> list[BasePokemon]:
+        """Returns every pokemon with name containing given substring.
+        Only rows of returned pokemons are converted.
+        """
+        folded_substring = fold_name(substring)
+        return [
+            self._get_pokemon(position)
+            for position, name in self._iter_raw_names()
+            if folded_substring in fold_name(name)
+        ]
+
+    def __iter__(self) -> Iterator[BasePokemon]:
+        """Yields every pokemon in file order, converting rows which were
+        not accessed yet.
+
+        Raises:
+            MalformedPokemonDataError: returns type of data corruption
+            from JSON file and row where it was found.
+
+        Yields:
+            BasePokemon: Every pokemon in file.
+        """
+        for position in range(len(self._rows)):
+            yield self._get_pokemon(position)
+
+    def validate_all(self, parallel: bool = False,
+                     workers: (int | None) = None,
+                     parallel_threshold: int = PARALLEL_ROWS_THRESHOLD
+                     ) -> list[BasePokemon]:
+        """Checks and converts every row which was not accessed yet and
+        returns every pokemon. In parallel mode rows are checked in worker
+        processes, if there are at least parallel_threshold rows (see
+        model_io.read_from_json). Already converted pokemons are kept.
+
+        Raises:
+            MalformedPokemonDataError: returns type of data corruption
+            from JSON file and row with the lowest number where it was
+            found.
+
+        Returns:
+            list: List of every BasePokemon object in file order.
+        """
+        if parallel and len(self._rows) >= parallel_threshold and (
+                    get_worker_count(workers) > 1
+                ) and None in self._pokemons:
+            pokemon_list = io_return_valid_pokemons_parallel(
+                self._rows, workers, self._format_version
+                )
+            for position, pokemon in enumerate(pokemon_list):
+                if self._pokemons[position] is None:
+                    pokemon.share_values(self._shared_values)
+                    self._pokemons[position] = pokemon
+        return list(self)
+
+
+class RecordFilePokemonSource(PokemonSource):
+    """Source reading pokemons from memory-mapped binary record file
+    (see model_records). Records are converted to BasePokemon objects
+    only when they are accessed, and each one only once.
+    """
+    def __init__(self, file_path: (str | None) = None,
+                 buffer: (memoryview | None) = None) -> None:
+        """Opens given record file, or reads records from given buffer.
+
+        Args:
+            file_path (str | None, optional): Path to record file.
+            Defaults to None (buffer must be given).
+            buffer (memoryview | None, optional): Buffer with records.
+            Defaults to None.
+
+        Raises:
+            FileNotFoundError: Given file does not exist.
+            PermissionError: Given file cannot be accessed.
+            IsADirectoryError: Given path is a directory.
+            MalformedPokemonDataError: Given file is not a record file.
+        """
+        self._record_file = PokemonRecordFile(file_path, buffer)
+        self._pokemons = {}
+        self._name_index = None
+
+    def get_pokemon_using_pokedex_number(
+            self, pokedex_number: int) -> (BasePokemon | None):
+        """Returns pokemon with given pokedex number using record's offset,
+        or None if it does not exist.
+
+        Args:
+            pokedex_number (int): Pokemon's pokedex number.
+
+        Returns:
+            BasePokemon | None: Matching pokemon.
+        """
+        pokemon = self._pokemons.get(pokedex_number)
+        if pokemon is None:
+            pokemon = self._record_file.get_pokemon(pokedex_number)
+            if pokemon is not None:
+                self._pokemons[pokedex_number] = pokemon
+        return pokemon
+
+    def get_pokemon_using_name(self, name: str) -> (BasePokemon | None):
+        """Returns first pokemon with given name or None if it does
+        not exist. Only names are read to build index on first use.
+
+        Args:
+            name (str): Pokemon's name.
+
+        Returns:
+            BasePokemon | None: Matching pokemon.
+        """
+        if self._name_index is None:
+            name_index = {}
+            for pokedex_number, pokemon_name in (
+                        self._record_file.iter_names()
+                    ):
+                name_index.setdefault(fold_name(pokemon_name), pokedex_number)
+            self._name_index = name_index
+        pokedex_number = self._name_index.get(fold_name(name))
+        if pokedex_number is None:
+            return None
+        return self.get_pokemon_using_pokedex_number(pokedex_number)
+
+    def __iter__(self) -> Iterator[BasePokemon]:
+        """Yields every pokemon in pokedex number order.
+
+        Yields:
+            BasePokemon: Every pokemon in file.
+        """
+        for pokedex_number, _ in self._record_file.iter_names():
+            yield self.get_pokemon_using_pokedex_number(pokedex_number)
+
+    def close(self) -> None:
+        """Unmaps record file.
+        """
+        self._pokemons = {}
+        self._record_file.close()
+
+
+class SharedMemoryPokemonSource(RecordFilePokemonSource):
+    """Source reading pokemons from shared memory segment published by
+    other process (see model_shared.SharedPokemonDatabase). Records are
+    read in place, without copying segment.
+    """
+    def __init__(self, name: str) -> None:
+        """Attaches to shared memory segment with given name.
+
+        Args:
+            name (str): Name of segment.
+
+        Raises:
+            FileNotFoundError: Given segment does not exist.
+            MalformedPokemonDataError: Given segment has no pokemons.
+        """
+        self._segment = attach_shared_memory(name)
+        try:
+            super().__init__(buffer=self._segment.buf)
+        except Exception:
+            self._segment.close()
+            raise
+
+    def close(self) -> None:
+        """Detaches from shared memory segment, which stays available
+        for other processes.
+        """
+        super().close()
+        self._segment.close()
+
+
+class SqlitePokemonSource(PokemonSource):
+    """Source reading pokemons from SQLite database (see model_sqlite).
+    Lookups and searches are done with database indexes, so only matching
+    rows are read and converted to BasePokemon objects.
+    """
+    def __init__(self, file_path: str) -> None:
+        """Opens given SQLite database.
+
+        Args:
+            file_path (str): Path to SQLite database file.
+
+        Raises:
+            FileNotFoundError: Given file does not exist.
+            PermissionError: Given file cannot be accessed.
+            IsADirectoryError: Given path is a directory.
+            MalformedPokemonDataError: Given file is not a pokemon
+            SQLite database.
+        """
+        self._sqlite_file = PokemonSqliteFile(file_path)
+
+    def get_pokemon_using_pokedex_number(
+            self, pokedex_number: int) -> (BasePokemon | None):
+        """Returns pokemon with given pokedex number or None if it does
+        not exist.
+        """
+        return self._sqlite_file.get_pokemon(pokedex_number)
+
+    def get_pokemon_using_name(self, name: str) -> (BasePokemon | None):
+        """Returns pokemon with given name or None if it does not exist.
+        """
+        return self._sqlite_file.get_pokemon_using_name(name)
+
+    def search_name(self, substring: str) -> list[BasePokemon]:
+        """Returns every pokemon with name containing given substring.
+        """
+        return self._sqlite_file.search_name(substring)
+
+    def search_pokedex_number(self, number: int) -> list[BasePokemon]:
+        """Returns every pokemon with given equal or part of pokedex number.
+        """
+        return self._sqlite_file.search_pokedex_number(number)
+
+    def search_type(self, pokemon_type: str) -> list[BasePokemon]:
+        """Returns every pokemon with given primary or secondary type.
+        """
+        return self._sqlite_file.search_type(pokemon_type)
+
+    def __iter__(self) -> Iterator[BasePokemon]:
+        """Yields every pokemon in database order.
+
+        Yields:
+            BasePokemon: Every pokemon in database.
+        """
+        return iter(self._sqlite_file)
+
+    def close(self) -> None:
+        """Closes database connection.
+        """
+        self._sqlite_file.close()
+
+
+class ShardedPokemonSource(PokemonSource):
+    """Source reading pokemons from generation-sharded database (see
+    model_shards). Lookups and searches use manifest index to find
+    matching pokemons, and only shards containing them are read.
+    """
+    def __init__(self, manifest_path: str) -> None:
+        """Reads manifest of sharded database. Shards are not read yet.
+
+        Args:
+            manifest_path (str): Path to manifest file.
+
+        Raises:
+            FileNotFoundError: Given file does not exist.
+            PermissionError: Given file cannot be accessed.
+            IsADirectoryError: Given path is a directory.
+            MalformedPokemonDataError: Given file is not a valid manifest.
+        """
+        self._manifest_path = manifest_path
+        self._shards = read_manifest(manifest_path)
+        self._loaded_shards = {}
+        self._shared_values = SharedPokemonValues()
+        self._index = [
+            (shard_idx, position, pokedex_number, name)
+            for shard_idx, shard in enumerate(self._shards)
+            for position, (pokedex_number, name) in enumerate(
+                zip(shard['pokedex_numbers'], shard['names'])
+                )
+        ]
+        self._number_index = {}
+        self._name_index = {}
+        for entry in self._index:
+            self._number_index.setdefault(entry[2], entry)
+            self._name_index.setdefault(fold_name(entry[3]), entry)
+
+    def get_loaded_generations(self) -> list[int]:
+        """Returns generations of shards which were already read.
+
+        Returns:
+            list: Generations in manifest order.
+        """
+        return [
+            shard['generation'] for idx, shard in enumerate(self._shards)
+            if idx in self._loaded_shards
+        ]
+
+    def _get_shard(self, shard_idx: int) -> list[BasePokemon]:
+        """Returns pokemons of shard with given index, reading it first
+        if it's needed.
+
+        Raises:
+            MalformedPokemonDataError: returns type of data corruption
+            from shard file and row where it was found.
+        """
+        pokemons = self._loaded_shards.get(shard_idx)
+        if pokemons is None:
+            pokemons = read_shard(self._manifest_path, self._shards[shard_idx],
+                                  self._shared_values)
+            self._loaded_shards[shard_idx] = pokemons
+        return pokemons
+
+    def _get_pokemons(self, entries: list[tuple]) -> list[BasePokemon]:
+        return [
+            self._get_shard(shard_idx)[position]
+            for shard_idx, position, _, _ in entries
+        ]
+
+    def get_pokemon_using_pokedex_number(
+            self, pokedex_number: int) -> (BasePokemon | None):
+        """Returns pokemon with given pokedex number or None if it does
+        not exist. Only shard containing it is read.
+        """
+        entry = self._number_index.get(pokedex_number)
+        if entry is None:
+            return None
+        return self._get_pokemons([entry])[0]
+
+    def get_pokemon_using_name(self, name: str) -> (BasePokemon | None):
+        """Returns first pokemon with given name or None if it does
+        not exist. Only shard containing it is read.
+        """
+        entry = self._name_index.get(fold_name(name))
+        if entry is None:
+            return None
+        return self._get_pokemons([entry])[0]
+
+    def search_name(self, substring: str) -> list[BasePokemon]:
+        """Returns every pokemon with name containing given substring.
+        Only shards containing them are read.
+        """
+        folded_substring = fold_name(substring)
+        return self._get_pokemons([
+            entry for entry in self._index
+            if folded_substring in fold_name(entry[3])
+        ])
+
+    def search_pokedex_number(self, number: int) -> list[BasePokemon]:
+        """Returns every pokemon with given equal or part of pokedex number.
+        Only shards containing them are read.
+        """
+        number_as_str = str(number)
+        equal_entries = []
+        matching_entries = []
+        for entry in self._index:
+            pokedex_number = str(entry[2])
+            if pokedex_number == number_as_str:
+                equal_entries.append(entry)
+            elif number_as_str in pokedex_number:
+                matching_entries.append(entry)
+        return self._get_pokemons(equal_entries + matching_entries)
+
+    def search_type(self, pokemon_type: str) -> list[BasePokemon]:
+        """Returns every pokemon with given primary or secondary type.
+        Only shards with pokemons of given type are read.
+        """
+        return [
+            pokemon
+            for shard_idx, shard in enumerate(self._shards)
+            if pokemon_type in shard['types']
+            for pokemon in self._get_shard(shard_idx)
+            if pokemon_type in pokemon.get_types()
+        ]
+
+    def __iter__(self) -> Iterator[BasePokemon]:
+        """Yields every pokemon in database order, reading shards one
+        at a time.
+
+        Yields:
+            BasePokemon: Every pokemon in database.
+        """
+        for shard_idx in range(len(self._shards)):
+            yield from self._get_shard(shard_idx)
+
+    def close(self) -> None:
+        """Forgets every read shard.
+        """
+        self._loaded_shards = {}
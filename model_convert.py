@@ -0,0 +1,162 @@
+import argparse
+from typing import Iterator
+from classes import BasePokemon
+from model_csv import iter_reference_csv_rows, REFERENCE_CSV_SUFFIX
+from model_io import (
+    iter_from_json,
+    open_json_file,
+    io_return_valid_pokemon,
+    write_to_json_v2,
+    JSON_FORMAT_V1
+)
+from model_records import write_record_file, RECORD_FILE_SUFFIX
+from model_sqlite import write_sqlite_file, SQLITE_FILE_SUFFIX
+from model_shards import write_sharded_database, MANIFEST_FILE_SUFFIX
+
+
+def iter_from_reference_csv(file_path: str) -> Iterator[BasePokemon]:
+    """ Reads original reference csv file one row at a time and yields
+    every row as validated BasePokemon object.
+
+    Args:
+        file_path (str): Path to reference csv file.
+
+    Raises:
+        MalformedPokemonDataError: returns type of data corruption and
+        row where it was found.
+
+    Yields:
+        BasePokemon: Pokemon created from every row.
+    """
+    with open(file_path, 'r', encoding='utf-8-sig', newline='') as file:
+        for idx, item in enumerate(iter_reference_csv_rows(file)):
+            yield io_return_valid_pokemon(item, idx+1, JSON_FORMAT_V1)
+
+
+def iter_from_source_file(file_path: str) -> Iterator[BasePokemon]:
+    """ Reads pokemon database from json file (v1 or v2) or reference
+    csv file, chosen by file extension, and yields every pokemon.
+
+    Args:
+        file_path (str): Path to source file.
+
+    Raises:
+        MalformedPokemonDataError: returns type of data corruption and
+        row where it was found.
+
+    Yields:
+        BasePokemon: Every validated pokemon.
+    """
+    if file_path.lower().endswith(REFERENCE_CSV_SUFFIX):
+        yield from iter_from_reference_csv(file_path)
+        return
+    with open_json_file(file_path) as file_hantle:
+        yield from iter_from_json(file_hantle)
+
+
+def convert_to_v2(source_path: str, target_path: str) -> int:
+    """ Converts pokemon.json (v1) or reference csv file into typed
+    pokemon.json v2 file. Rows are read, validated and written one
+    at a time. Both files can be compressed (see model_io.open_json_file).
+
+    Args:
+        source_path (str): Path to json or csv source file.
+        target_path (str): Path to new v2 json file.
+
+    Raises:
+        MalformedPokemonDataError: returns type of data corruption and
+        row where it was found.
+
+    Returns:
+        int: Number of converted pokemons.
+    """
+    with open_json_file(target_path, 'w') as file_hantle:
+        return write_to_json_v2(iter_from_source_file(source_path),
+                                file_hantle)
+
+
+def convert_to_record_file(source_path: str, target_path: str) -> int:
+    """ Converts pokemon.json (v1 or v2) or reference csv file into binary
+    record file (see model_records). Rows are read, validated and written
+    one at a time.
+
+    Args:
+        source_path (str): Path to json or csv source file.
+        target_path (str): Path to new record file.
+
+    Raises:
+        MalformedPokemonDataError: returns type of data corruption and
+        row where it was found, or pokemons are not sorted by pokedex number.
+
+    Returns:
+        int: Number of converted pokemons.
+    """
+    return write_record_file(iter_from_source_file(source_path), target_path)
+
+
+def convert_to_sqlite(source_path: str, target_path: str) -> int:
+    """ Imports pokemon.json (v1 or v2) or reference csv file into indexed
+    SQLite database (see model_sqlite) in one transaction. Rows are read
+    and validated one at a time.
+
+    Args:
+        source_path (str): Path to json or csv source file.
+        target_path (str): Path to SQLite database file.
+
+    Raises:
+        MalformedPokemonDataError: returns type of data corruption and
+        row where it was found. Database is not changed then.
+
+    Returns:
+        int: Number of imported pokemons.
+    """
+    return write_sqlite_file(iter_from_source_file(source_path), target_path)
+
+
+def convert_to_shards(source_path: str, manifest_path: str) -> int:
+    """ Converts pokemon.json (v1 or v2) or reference csv file into
+    generation-sharded database (see model_shards).
+
+    Args:
+        source_path (str): Path to json or csv source file.
+        manifest_path (str): Path to new manifest file, shards are saved
+        next to it.
+
+    Raises:
+        MalformedPokemonDataError: returns type of data corruption and
+        row where it was found.
+
+    Returns:
+        int: Number of converted pokemons.
+    """
+    return write_sharded_database(iter_from_source_file(source_path),
+                                  manifest_path)
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description='Converts pokemon.json or reference csv file '
+                    'into typed pokemon.json v2 file, binary record '
+                    'file ({} extension), SQLite database ({} extension) '
+                    'or generation shards ({} extension).'.format(
+                        RECORD_FILE_SUFFIX, SQLITE_FILE_SUFFIX,
+                        MANIFEST_FILE_SUFFIX)
+        )
+    parser.add_argument('source', help='pokemon.json (v1) or csv file')
+    parser.add_argument('target',
+                        help='path of new v2 json, record, SQLite or '
+                             'manifest file')
+    args = parser.parse_args()
+    if args.target.lower().endswith(RECORD_FILE_SUFFIX):
+        count = convert_to_record_file(args.source, args.target)
+    elif args.target.lower().endswith(SQLITE_FILE_SUFFIX):
+        count = convert_to_sqlite(args.source, args.target)
+    elif args.target.lower().endswith(MANIFEST_FILE_SUFFIX):
+        count = convert_to_shards(args.source, args.target)
+    else:
+        count = convert_to_v2(args.source, args.target)
+    print('Converted {} pokemons to {}'.format(count, args.target))
+
+
+if __name__ == '__main__':
+    main()
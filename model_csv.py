@@ -0,0 +1,359 @@
+import csv
+import io
+from ast import literal_eval
+from typing import Callable, Iterator
+from classes import (
+    BasePokemon,
+    MalformedPokemonDataError,
+    SharedPokemonValues
+)
+from model_io import (
+    io_return_valid_pokemon,
+    io_share_pokemon_values,
+    JSON_FORMAT_V1
+)
+from model_schema import POKEMON_SCHEMA
+
+
+# Number of columns in original reference/pokemon.csv file
+REFERENCE_CSV_COLUMNS = 41
+REFERENCE_CSV_SUFFIX = '.csv'
+
+# Columns of reference csv file with names of their keys in pokemon.json,
+# if they are different.
+_CSV_SPECIAL_STRENGTH_COLUMNS = {
+    'against_{}'.format(pokemon_type): 'against_{}'.format(
+        'fighting' if pokemon_type == 'fight' else pokemon_type
+        )
+    for pokemon_type in (
+        'bug', 'dark', 'dragon', 'electric', 'fairy', 'fight',
+        'fire', 'flying', 'ghost', 'grass', 'ground', 'ice',
+        'normal', 'poison', 'psychic', 'rock', 'steel', 'water'
+        )
+}
+
+
+def _quote_abilities_column(line: str) -> str:
+    """ Puts bracketed abilities list at the beginning of csv line in quotes,
+    as it's commas are not escaped in reference csv file.
+
+    Args:
+        line (str): Line of reference csv file.
+
+    Returns:
+        str: Line with abilities column readable by csv module.
+    """
+    if not line.startswith('['):
+        return line
+    end = line.find(']')
+    if end == -1:
+        return line
+    abilities = line[:end + 1].replace('"', '""')
+    return '"{}"{}'.format(abilities, line[end + 1:])
+
+
+def reference_csv_row_to_record(row: dict) -> dict:
+    """ Returns row of reference csv file as pokemon.json (v1) row,
+    with every value saved as string.
+
+    Args:
+        row (dict): Row of reference csv file read by csv.DictReader.
+
+    Returns:
+        dict: Pokemon's row in pokemon.json format.
+    """
+    return {
+        'pokedex_number': row['pokedex_number'],
+        'name': row['name'],
+        'abilities': row['abilities'],
+        'stats': {
+            'hp': row['hp'],
+            'defense': row['defense'],
+            'attack': row['attack'],
+            'speed': row['speed'],
+            'type1': row['type1'],
+            'type2': row['type2'],
+            'classfication': row['classfication'],
+            'experience_growth': row['experience_growth']
+        },
+        'special_strength': {
+            json_key: row[csv_key]
+            for csv_key, json_key in _CSV_SPECIAL_STRENGTH_COLUMNS.items()
+        },
+        'other': {
+            'percentage_male': row['percentage_male'],
+            'height_m': row['height_m'],
+            'weight_kg': row['weight_kg'],
+            'generation': row['generation']
+        }
+    }
+
+
+def iter_reference_csv_rows(file_hantle: io.TextIOWrapper) -> Iterator[dict]:
+    """ Reads original 41-column reference csv file one line at a time and
+    yields every row as pokemon.json (v1) row. Rows are not validated.\n
+    Throws exception if row does not have all columns.
+
+    Args:
+        file_hantle (io.TextIOWrapper): file_hantle variable from csv file,
+        opened with 'utf-8-sig' encoding.
+
+    Raises:
+        MalformedPokemonDataError: Row has wrong number of columns or
+        csv file is corrupted.
+
+    Yields:
+        dict: Pokemon's row in pokemon.json format.
+    """
+    lines = (_quote_abilities_column(line) for line in file_hantle)
+    reader = csv.DictReader(lines, delimiter=',')
+    idx = 0
+    try:
+        for idx, row in enumerate(reader, 1):
+            if None in row or None in row.values():
+                raise MalformedPokemonDataError(
+                    'Malformed wrong data size in row {}: \nGiven row size '
+                    'is not equal {}'.format(idx, REFERENCE_CSV_COLUMNS)
+                    )
+            try:
+                record = reference_csv_row_to_record(row)
+            except KeyError as e:
+                raise MalformedPokemonDataError(
+                    'Malformed redundant key in row {}: \nMissing column '
+                    '{}'.format(idx, e)
+                    )
+            yield record
+    except csv.Error as e:
+        raise MalformedPokemonDataError(
+            'Malformed csv data in row {}: \n{}'.format(idx + 1, e)
+            )
+
+
+class _ColumnConversionError(Exception):
+    """ Column cannot be converted at once, rows have to be checked
+    one at a time to find error.
+    """
+
+
+def _check_column(condition: bool) -> None:
+    if not condition:
+        raise _ColumnConversionError
+
+
+def _convert_positive_int_column(column: tuple) -> list:
+    values = list(map(int, column))
+    _check_column(all(value > 0 for value in values))
+    return values
+
+
+def _convert_string_column(column: tuple) -> list:
+    _check_column(all(column))
+    return list(column)
+
+
+def _convert_optional_string_column(column: tuple) -> list:
+    return [value or None for value in column]
+
+
+def _convert_string_list_column(column: tuple) -> list:
+    # Most pokemons share abilities, every unique string is parsed once.
+    parsed = {}
+    for value in set(column):
+        _check_column(value)
+        abilities = literal_eval(value)
+        _check_column(isinstance(abilities, list) and abilities and all(
+            ability and isinstance(ability, str) for ability in abilities
+            ))
+        parsed[value] = abilities
+    return [list(parsed[value]) for value in column]
+
+
+def _convert_not_negative_float_column(column: tuple) -> list:
+    values = list(map(float, column))
+    _check_column(all(value >= 0 for value in values))
+    return values
+
+
+def _convert_optional_not_negative_float_column(column: tuple) -> list:
+    values = [float(value) if value else None for value in column]
+    _check_column(all(value is None or value >= 0 for value in values))
+    return values
+
+
+def _convert_optional_positive_float_column(column: tuple) -> list:
+    values = [float(value) if value else None for value in column]
+    _check_column(all(value is None or value > 0 for value in values))
+    return values
+
+
+def _convert_required_positive_float_column(column: tuple) -> list:
+    _check_column(all(column))
+    values = list(map(float, column))
+    _check_column(all(value > 0 for value in values))
+    return values
+
+
+# Converters of whole csv columns, named by value kind like
+# model_schema.FIELD_CONVERTERS. They accept only values which the same
+# field converter accepts and return the same values, anything else
+# is left for row by row checking.
+COLUMN_CONVERTERS = {
+    'positive_int': _convert_positive_int_column,
+    'string': _convert_string_column,
+    'optional_string': _convert_optional_string_column,
+    'string_list': _convert_string_list_column,
+    'not_negative_float': _convert_not_negative_float_column,
+    'optional_not_negative_float': (
+        _convert_optional_not_negative_float_column
+        ),
+    'optional_positive_float': _convert_optional_positive_float_column,
+    'required_positive_float': _convert_required_positive_float_column,
+}
+
+_JSON_TO_CSV_COLUMNS = {
+    json_key: csv_key
+    for csv_key, json_key in _CSV_SPECIAL_STRENGTH_COLUMNS.items()
+}
+
+
+def _get_column_layout(schema: dict = POKEMON_SCHEMA
+                       ) -> list[tuple[str | None, str, str, str]]:
+    """ Returns section, json key, csv column and value kind of every
+    pokemon field, in order of pokemon.json rows made from csv.
+    """
+    record = reference_csv_row_to_record({
+        key: key for key in (
+            'pokedex_number', 'name', 'abilities', 'hp', 'defense',
+            'attack', 'speed', 'type1', 'type2', 'classfication',
+            'experience_growth', 'percentage_male', 'height_m',
+            'weight_kg', 'generation', *_CSV_SPECIAL_STRENGTH_COLUMNS
+            )
+        })
+    layout = []
+    for key, value in record.items():
+        if isinstance(value, dict):
+            fields = schema[key].fields
+            for field_name, csv_key in value.items():
+                layout.append((key, field_name, csv_key, fields[field_name]))
+        else:
+            layout.append((None, key, value, schema[key]))
+    return layout
+
+
+_COLUMN_LAYOUT = _get_column_layout()
+
+
+def _read_reference_csv_table(file_hantle: io.TextIOWrapper
+                              ) -> tuple[list[str], list[list[str]]]:
+    """ Reads header and every row of reference csv file, checking only
+    number of columns in every row.
+
+    Raises:
+        MalformedPokemonDataError: Row has wrong number of columns or
+        csv file is corrupted.
+    """
+    lines = (_quote_abilities_column(line) for line in file_hantle)
+    reader = csv.reader(lines, delimiter=',')
+    rows = []
+    try:
+        header = next(reader, [])
+        for row in reader:
+            if not row:
+                continue
+            if len(row) != len(header):
+                raise MalformedPokemonDataError(
+                    'Malformed wrong data size in row {}: \nGiven row size '
+                    'is not equal {}'.format(
+                        len(rows) + 1, REFERENCE_CSV_COLUMNS
+                        )
+                    )
+            rows.append(row)
+    except csv.Error as e:
+        raise MalformedPokemonDataError(
+            'Malformed csv data in row {}: \n{}'.format(len(rows) + 1, e)
+            )
+    return header, rows
+
+
+def _read_pokemons_by_rows(header: list[str],
+                           rows: list[list[str]]) -> list[BasePokemon]:
+    """ Checks every row of reference csv file one at a time, like json
+    rows are checked, and returns them as BasePokemon objects.
+
+    Raises:
+        MalformedPokemonDataError: returns type of data corruption and
+        row where it was found.
+    """
+    pokemon_list = []
+    for idx, row in enumerate(rows, 1):
+        try:
+            record = reference_csv_row_to_record(dict(zip(header, row)))
+        except KeyError as e:
+            raise MalformedPokemonDataError(
+                'Malformed redundant key in row {}: \nMissing column '
+                '{}'.format(idx, e)
+                )
+        pokemon_list.append(
+            io_return_valid_pokemon(record, idx, JSON_FORMAT_V1)
+            )
+    return pokemon_list
+
+
+def read_from_reference_csv(file_hantle: io.TextIOWrapper,
+                            column_converters: dict[str, Callable] = (
+                                COLUMN_CONVERTERS),
+                            shared_values: (SharedPokemonValues | None) = None
+                            ) -> list[BasePokemon]:
+    """ Reads original 41-column reference csv file and returns every row
+    as BasePokemon object. Values are converted column by column, every
+    column at once.\n
+    If any column cannot be converted, rows are checked one at a time
+    like pokemon.json rows, so the same exception with the same row number
+    is thrown as for pokemon.json made from given file.
+
+    Args:
+        file_hantle (io.TextIOWrapper): file_hantle variable from csv file,
+        opened with 'utf-8-sig' encoding.
+        column_converters (dict, optional): Converters of whole columns
+        for every value kind. Defaults to COLUMN_CONVERTERS.
+        shared_values (SharedPokemonValues | None, optional): Cache of
+        values shared between pokemons. Defaults to None (new cache).
+
+    Raises:
+        MalformedPokemonDataError: returns type of data corruption and
+        row where it was found.
+
+    Returns:
+        list: List of BasePokemon objects.
+    """
+    header, rows = _read_reference_csv_table(file_hantle)
+    if not rows:
+        return []
+    column_indexes = {key: idx for idx, key in enumerate(header)}
+    columns = list(zip(*rows))
+    converted = []
+    try:
+        for section, key, csv_key, kind in _COLUMN_LAYOUT:
+            column = columns[column_indexes[csv_key]]
+            converted.append(
+                (section, key, column_converters[kind](column))
+                )
+    except Exception:
+        # Any error (missing column, literal_eval errors, failed checks)
+        # is described by row checking with it's exact row number.
+        return io_share_pokemon_values(
+            _read_pokemons_by_rows(header, rows), shared_values
+            )
+    pokemon_list = []
+    for idx in range(len(rows)):
+        record = {'stats': {}, 'special_strength': {}, 'other': {}}
+        for section, key, values in converted:
+            if section is None:
+                record[key] = values[idx]
+            else:
+                record[section][key] = values[idx]
+        pokemon_list.append(BasePokemon(
+            record['pokedex_number'], record['name'], record['abilities'],
+            record['stats'], record['special_strength'], record['other']
+            ))
+    return io_share_pokemon_values(pokemon_list, shared_values)
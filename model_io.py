@@ -1,5 +1,7 @@
 import json
-from classes import BasePokemon
+from classes import BasePokemon, SharedPokemonValues
+from model_schema import compile_pokemon_validator, TYPED_FIELD_CONVERTERS
+from model_json import JsonBackend, get_json_backend
 from classes import (
     MalformedPokemonDataError,
     InvalidDataLineLeghthError,
@@ -8,8 +10,79 @@ from classes import (
     BadConversionError,
     RedundantKeyError
 )
+import bz2
+import gzip
+import hashlib
 import io
+import lzma
+import os
 from ast import literal_eval
+from concurrent.futures import ProcessPoolExecutor
+from math import ceil
+from typing import Iterable, Iterator
+
+
+JSON_STREAM_CHUNK_SIZE = 1 << 16
+# Starting process pool and sending rows to it costs about 50 ms, as
+# much as checking ~1000 rows in one process, so parallel mode is used
+# only for files where it's a small part of serial time (5000 rows take
+# ~0.2 s). See benchmarks/bench_parallel.py.
+PARALLEL_ROWS_THRESHOLD = 5000
+
+# pokemon.json formats: v1 is a list of rows with every value saved as
+# string, v2 is {"format_version": 2, "pokemon": [rows]} with json numbers,
+# nulls and ability arrays.
+JSON_FORMAT_V1 = 1
+JSON_FORMAT_V2 = 2
+
+_JSON_WHITESPACE = ' \t\n\r'
+
+# Compressed json files are opened by extension and decompressed while
+# they are parsed.
+COMPRESSED_FILE_OPENERS = {
+    '.gz': gzip.open,
+    '.bz2': bz2.open,
+    '.xz': lzma.open,
+}
+_COMPRESSED_FILE_TYPES = (gzip.GzipFile, bz2.BZ2File, lzma.LZMAFile)
+_DECOMPRESSION_ERRORS = (EOFError, OSError, lzma.LZMAError)
+
+_POKEMON_RECORD_VALIDATORS = {
+    JSON_FORMAT_V1: compile_pokemon_validator(),
+    JSON_FORMAT_V2: compile_pokemon_validator(
+        converters=TYPED_FIELD_CONVERTERS
+        ),
+}
+
+
+def open_json_file(file_path: str, mode: str = 'r') -> io.TextIOWrapper:
+    """ Opens json file in text mode. Files with extension from
+    COMPRESSED_FILE_OPENERS (ex. pokemon.json.gz) are decompressed or
+    compressed while they are read or written.
+
+    Args:
+        file_path (str): Path to json file.
+        mode (str, optional): 'r' or 'w'. Defaults to 'r'.
+
+    Raises:
+        FileNotFoundError: Given file does not exist.
+        PermissionError: Given file cannot be accessed.
+        IsADirectoryError: Given path is a directory.
+
+    Returns:
+        io.TextIOWrapper: Opened file.
+    """
+    extension = os.path.splitext(file_path)[1].lower()
+    opener = COMPRESSED_FILE_OPENERS.get(extension)
+    if opener is None:
+        return open(file_path, mode, encoding='utf-8')
+    return opener(file_path, mode + 't', encoding='utf-8')
+
+
+def _is_compressed_file(file_hantle: io.TextIOWrapper) -> bool:
+    return isinstance(
+        getattr(file_hantle, 'buffer', None), _COMPRESSED_FILE_TYPES
+        )
 
 
 def io_convert_to_int(value: (int | str)) -> int:
@@ -368,17 +441,255 @@ def io_return_valid_other_dict(value: dict) -> dict:
     return value
 
 
-def read_from_json(file_hantle: io.TextIOWrapper) -> list[BasePokemon]:
+def io_return_valid_pokemon(item: dict, row: int,
+                            format_version: int = JSON_FORMAT_V1
+                            ) -> BasePokemon:
+    """ Checks if given pokemon's row from json file is not corrupted
+    and returns it as BasePokemon object.\n
+    Row is checked by validator compiled from model_schema.POKEMON_SCHEMA,
+    which throws the same errors as io_return_valid_* functions.
+    Rows in v2 format are only type-checked, without string conversion.\n
+    Throws exception otherwise.
+
+    Args:
+        item (dict): Single pokemon's row from json file.
+        row (int): Number of given row, used in exception message.
+        format_version (int, optional): Format of given row
+        (JSON_FORMAT_V1 or JSON_FORMAT_V2). Defaults to JSON_FORMAT_V1.
+
+    Raises:
+        MalformedPokemonDataError: returns type of data corruption and
+        row where it was found.
+
+    Returns:
+        BasePokemon: Pokemon created from given row.
+    """
+    validate = _POKEMON_RECORD_VALIDATORS[format_version]
+    try:
+        return BasePokemon(*validate(item))
+    except BadConversionError as e:
+        raise MalformedPokemonDataError(
+            'Malformed non_convertable data in row {}: \n{}'.format(row, e)
+            )
+    except PokemonDataDoesNotExistError as e:
+        raise MalformedPokemonDataError(
+            'Malformed empty data in row {}: \n{}'.format(row, e)
+            )
+    except NotANumberError as e:
+        raise MalformedPokemonDataError(
+            'Malformed non-numeric data in row {}: \n{}'.format(row, e)
+            )
+    except ValueError as e:
+        raise MalformedPokemonDataError(
+            'Malformed wrong value data in row {}: \n{}'.format(row, e)
+            )
+    except InvalidDataLineLeghthError as e:
+        raise MalformedPokemonDataError(
+            'Malformed wrong data size in row {}: \n{}'.format(row, e)
+            )
+    except RedundantKeyError as e:
+        raise MalformedPokemonDataError(
+            'Malformed redundant key in row {}: \n{}'.format(row, e)
+            )
+    except (KeyError, TypeError, AttributeError) as e:
+        raise MalformedPokemonDataError(
+            'Malformed data structure in row {}: \n{}: {}'.format(
+                row, type(e).__name__, e)
+            )
+
+
+def _return_valid_pokemon_chunk(items: list[dict],
+                                first_row: int,
+                                format_version: int) -> list[BasePokemon]:
+    """ Checks every row in given chunk of json file and returns them
+    as BasePokemon objects. Used by worker processes in parallel mode.
+
+    Args:
+        items (list[dict]): Chunk of pokemon rows from json file.
+        first_row (int): Number of first row in given chunk.
+        format_version (int): Format of given rows.
+
+    Raises:
+        MalformedPokemonDataError: returns type of data corruption and
+        row where it was found.
+
+    Returns:
+        list: List of BasePokemon objects.
+    """
+    return [
+        io_return_valid_pokemon(item, first_row + idx, format_version)
+        for idx, item in enumerate(items)
+        ]
+
+
+def get_worker_count(workers: (int | None) = None) -> int:
+    """ Returns number of worker processes used by parallel validation:
+    given number or number of CPUs if it's not given.
+    """
+    return workers or os.cpu_count() or 1
+
+
+def io_return_valid_pokemons_parallel(
+            data: list[dict], workers: (int | None) = None,
+            format_version: int = JSON_FORMAT_V1
+        ) -> list[BasePokemon]:
+    """ Checks every row of json file in chunks split between worker
+    processes and returns BasePokemon objects in original order.\n
+    If many rows are corrupted, throws exception for the one with the
+    lowest row number, like serial reading does.
+
+    Args:
+        data (list[dict]): Every pokemon row from json file.
+        workers (int | None, optional): Number of worker processes.
+        Defaults to None (number of CPUs).
+        format_version (int, optional): Format of given rows.
+        Defaults to JSON_FORMAT_V1.
+
+    Raises:
+        MalformedPokemonDataError: returns type of data corruption and
+        row where it was found.
+
+    Returns:
+        list: List of BasePokemon objects.
+    """
+    workers = get_worker_count(workers)
+    chunk_size = max(ceil(len(data) / (workers * 4)), 1)
+    pokemon_list = []
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        futures = [
+            executor.submit(
+                _return_valid_pokemon_chunk,
+                data[start:start + chunk_size], start + 1, format_version
+                )
+            for start in range(0, len(data), chunk_size)
+            ]
+        try:
+            for future in futures:
+                pokemon_list.extend(future.result())
+        except BaseException:
+            for future in futures:
+                future.cancel()
+            raise
+    return pokemon_list
+
+
+def io_return_format_rows(data: (list | dict)) -> tuple[int, list]:
+    """ Detects format of given parsed json file and returns it with
+    list of pokemon rows.\n
+    Throws exception if format is not supported.
+
+    Args:
+        data (list | dict): Parsed json file.
+
+    Raises:
+        MalformedPokemonDataError: Given format is not supported.
+
+    Returns:
+        tuple(int, list): Format version and list of pokemon rows.
+    """
+    if not isinstance(data, dict):
+        return JSON_FORMAT_V1, data
+    rows = data.get('pokemon')
+    if data.get('format_version') != JSON_FORMAT_V2 or not isinstance(
+                rows, list
+            ):
+        raise MalformedPokemonDataError(
+            'Unsupported pokemon database format: {}'.format(
+                data.get('format_version')
+                )
+            )
+    return JSON_FORMAT_V2, rows
+
+
+def io_share_pokemon_values(
+            pokemons: list[BasePokemon],
+            shared_values: (SharedPokemonValues | None) = None
+        ) -> list[BasePokemon]:
+    """ Shares repeated values between given pokemons (see
+    BasePokemon.share_values) and returns them.
+
+    Args:
+        pokemons (list[BasePokemon]): Pokemons of one database.
+        shared_values (SharedPokemonValues | None, optional): Cache of
+        shared values. Defaults to None (new cache).
+
+    Returns:
+        list: Given list of BasePokemon objects.
+    """
+    shared_values = shared_values or SharedPokemonValues()
+    for pokemon in pokemons:
+        pokemon.share_values(shared_values)
+    return pokemons
+
+
+def io_read_format_rows(file_hantle: io.TextIOWrapper,
+                        json_backend: (JsonBackend | None) = None
+                        ) -> tuple[int, list]:
+    """ Parses json file and returns it's format with list of pokemon rows.
+    Plain files are parsed from bytes by given json backend (see
+    model_json). Compressed files (see open_json_file) are parsed while
+    they are decompressed, so whole decompressed text is never kept
+    in memory.
+
+    Args:
+        file_hantle (io.TextIOWrapper): file_hantle variable from json file.
+        json_backend (JsonBackend | None, optional): Parser of plain files.
+        Defaults to None (the fastest installed backend).
+
+    Raises:
+        json.JSONDecodeError: Given file is not a valid json file.
+        MalformedPokemonDataError: Given format is not supported or
+        compressed file cannot be decompressed.
+
+    Returns:
+        tuple(int, list): Format version and list of pokemon rows.
+    """
+    if not _is_compressed_file(file_hantle):
+        json_backend = json_backend or get_json_backend()
+        return io_return_format_rows(json_backend.load(file_hantle))
+    format_version = JSON_FORMAT_V1
+    data = []
+    for format_version, item in _iter_json_rows(file_hantle,
+                                                JSON_STREAM_CHUNK_SIZE):
+        data.append(item)
+    return format_version, data
+
+
+def read_from_json(file_hantle: io.TextIOWrapper,
+                   parallel: bool = False,
+                   workers: (int | None) = None,
+                   parallel_threshold: int = PARALLEL_ROWS_THRESHOLD,
+                   shared_values: (SharedPokemonValues | None) = None,
+                   json_backend: (JsonBackend | None) = None
+                   ) -> list[BasePokemon]:
     """ Reads every item in json file, check if it's not corrupted
     and returns list of every base pokemon if no corrupted data was found.\n
-    Throws exception otherwise.
+    Throws exception otherwise.\n
+    File format (v1 or v2) is detected from it's content.\n
+    In parallel mode rows are checked in worker processes, but only if
+    file has at least parallel_threshold rows, as starting processes
+    is slower than checking small file in one process, and if more than
+    one worker would be used (ex. not on machine with one CPU).
+    Repeated values of pokemons are shared (see
+    BasePokemon.share_values).
 
     Args:
         file_hantle (io.TextIOWrapper): file_hantle variable from json file.
+        parallel (bool, optional): Checks rows in worker processes.
+        Defaults to False.
+        workers (int | None, optional): Number of worker processes in
+        parallel mode. Defaults to None (number of CPUs).
+        parallel_threshold (int, optional): Minimal number of rows checked
+        in parallel mode. Defaults to PARALLEL_ROWS_THRESHOLD.
+        shared_values (SharedPokemonValues | None, optional): Cache of
+        values shared between pokemons. Defaults to None (new cache).
+        json_backend (JsonBackend | None, optional): Parser of plain files
+        (see io_read_format_rows). Defaults to None (the fastest installed
+        backend).
 
     Raises:
         MalformedPokemonDataError: returns type of data corruption and
-        row where it was found.
+        row where it was found, or that file's format is not supported.
 
         Types of data corruption:
         -  BadConversionError: Given value cannot be converted to other
@@ -396,53 +707,375 @@ def read_from_json(file_hantle: io.TextIOWrapper) -> list[BasePokemon]:
     Returns:
         list: List of BasePokemon objects.
     """
-    data = json.load(file_hantle)
-    pokemon_list = []
-    try:
+    format_version, data = io_read_format_rows(file_hantle, json_backend)
+    if parallel and len(data) >= parallel_threshold and (
+                get_worker_count(workers) > 1
+            ):
+        pokemon_list = io_return_valid_pokemons_parallel(
+            data, workers, format_version
+            )
+    else:
+        pokemon_list = []
         for idx, item in enumerate(data):
-            pokedex_number = io_return_if_positive(
-                io_convert_to_int(item['pokedex_number'])
-                )
-            name = io_return_if_valid_string(
-                item['name']
-                )
-            abilities = io_return_if_valid_abilities_as_list(
-                item['abilities']
-                )
-            stats = io_return_valid_stats_dict(
-                item['stats']
+            pokemon_list.append(
+                io_return_valid_pokemon(item, idx+1, format_version)
                 )
-            special_strength = io_return_valid_special_strength_dict(
-                item['special_strength']
-                )
-            other = io_return_valid_other_dict(
-                item['other']
-                )
-            pokemon = BasePokemon(pokedex_number, name, abilities,
-                                  stats, special_strength, other)
-            pokemon_list.append(pokemon)
-        return pokemon_list
-    except BadConversionError as e:
-        raise MalformedPokemonDataError(
-            'Malformed non_convertable data in row {}: \n{}'.format(idx+1, e)
-            )
-    except PokemonDataDoesNotExistError as e:
-        raise MalformedPokemonDataError(
-            'Malformed empty data in row {}: \n{}'.format(idx+1, e)
-            )
-    except NotANumberError as e:
-        raise MalformedPokemonDataError(
-            'Malformed non-numeric data in row {}: \n{}'.format(idx+1, e)
-            )
-    except ValueError as e:
-        raise MalformedPokemonDataError(
-            'Malformed wrong value data in row {}: \n{}'.format(idx+1, e)
+    return io_share_pokemon_values(pokemon_list, shared_values)
+
+
+def io_return_row_hash(item: dict, format_version: int,
+                       json_backend: (JsonBackend | None) = None) -> bytes:
+    """ Returns hash of given raw pokemon row from json file, which does not
+    depend on order of keys or json formatting.\n
+    Hashes made with different json backends can differ, so compared
+    hashes must be made with the same backend.
+
+    Args:
+        item (dict): Single pokemon's row from json file.
+        format_version (int): Format of given row.
+        json_backend (JsonBackend | None, optional): Serializer of row.
+        Defaults to None (the fastest installed backend).
+
+    Returns:
+        bytes: sha1 digest of row.
+    """
+    json_backend = json_backend or get_json_backend()
+    row_hash = hashlib.sha1(str(format_version).encode('utf-8') + b':')
+    row_hash.update(json_backend.dumps_sorted(item))
+    return row_hash.digest()
+
+
+def read_changed_from_json(
+            file_hantle: io.TextIOWrapper,
+            known_rows: (dict[bytes, BasePokemon] | None) = None,
+            shared_values: (SharedPokemonValues | None) = None,
+            json_backend: (JsonBackend | None) = None
+        ) -> tuple[list[BasePokemon], dict[bytes, BasePokemon], int]:
+    """ Reads every item in json file like read_from_json, but checks only
+    rows whose hash is not in given known_rows. Pokemons of unchanged rows
+    are taken from known_rows.\n
+    Throws exception if any checked row is corrupted.
+
+    Args:
+        file_hantle (io.TextIOWrapper): file_hantle variable from json file.
+        known_rows (dict | None, optional): Row hashes (see
+        io_return_row_hash) with pokemons created from these rows.
+        Defaults to None (every row is checked).
+        shared_values (SharedPokemonValues | None, optional): Cache of
+        values shared between pokemons. Defaults to None (new cache).
+        json_backend (JsonBackend | None, optional): Parser of plain files
+        (see io_read_format_rows). Defaults to None (the fastest installed
+        backend).
+
+    Raises:
+        MalformedPokemonDataError: returns type of data corruption and
+        row where it was found, or that file's format is not supported.
+
+    Returns:
+        tuple(list, dict, int): List of BasePokemon objects, row hashes
+        of read file with their pokemons and number of checked rows.
+    """
+    known_rows = known_rows or {}
+    shared_values = shared_values or SharedPokemonValues()
+    json_backend = json_backend or get_json_backend()
+    format_version, data = io_read_format_rows(file_hantle, json_backend)
+    pokemon_list = []
+    row_hashes = {}
+    checked_rows = 0
+    for idx, item in enumerate(data):
+        row_hash = io_return_row_hash(item, format_version, json_backend)
+        pokemon = row_hashes.get(row_hash) or known_rows.get(row_hash)
+        if pokemon is None:
+            pokemon = io_return_valid_pokemon(item, idx+1, format_version)
+            pokemon.share_values(shared_values)
+            checked_rows += 1
+        row_hashes[row_hash] = pokemon
+        pokemon_list.append(pokemon)
+    return pokemon_list, row_hashes, checked_rows
+
+
+class _JsonStreamReader:
+    """ Reads json values from file incrementally, keeping in memory
+    only currently parsed value and single chunk of file.
+    """
+    def __init__(self, file_hantle: io.TextIOWrapper,
+                 chunk_size: int) -> None:
+        self._file_hantle = file_hantle
+        self._chunk_size = chunk_size
+        self._decoder = json.JSONDecoder()
+        self._buffer = ''
+        self._position = 0
+        self._end_of_file = False
+        self._decompression_errors = (
+            _DECOMPRESSION_ERRORS if _is_compressed_file(file_hantle) else ()
             )
-    except InvalidDataLineLeghthError as e:
+
+    def _read_chunk(self) -> None:
+        try:
+            chunk = self._file_hantle.read(self._chunk_size)
+        except self._decompression_errors as e:
+            raise MalformedPokemonDataError(
+                'Given file cannot be decompressed: {}'.format(e)
+                )
+        self._buffer = self._buffer[self._position:] + chunk
+        self._position = 0
+        self._end_of_file = not chunk
+
+    def _error(self, message: str) -> json.JSONDecodeError:
+        return json.JSONDecodeError(message, self._buffer, self._position)
+
+    def peek(self) -> str:
+        """ Skips whitespace and returns next character, or empty
+        string at the end of file.
+        """
+        while True:
+            buffer = self._buffer
+            position = self._position
+            while position < len(buffer) and buffer[position] in (
+                        _JSON_WHITESPACE
+                    ):
+                position += 1
+            self._position = position
+            if position < len(buffer):
+                return buffer[position]
+            if self._end_of_file:
+                return ''
+            self._read_chunk()
+
+    def expect(self, characters: str) -> str:
+        """ Consumes next character if it's one of given characters.
+        Throws json.JSONDecodeError otherwise.
+        """
+        char = self.peek()
+        if not char or char not in characters:
+            raise self._error('Expecting {}'.format(
+                ' or '.join(repr(c) for c in characters)
+                ))
+        self._position += 1
+        return char
+
+    def expect_end(self) -> None:
+        """ Throws json.JSONDecodeError if anything is left in file.
+        """
+        if self.peek():
+            raise self._error('Extra data')
+
+    def decode_value(self):
+        """ Parses next json value, reading more chunks if needed.
+        """
+        if not self.peek():
+            raise self._error('Expecting value')
+        while True:
+            try:
+                value, end = self._decoder.raw_decode(
+                    self._buffer, self._position
+                    )
+                if end < len(self._buffer) or self._end_of_file:
+                    self._position = end
+                    return value
+            except json.JSONDecodeError:
+                if self._end_of_file:
+                    raise
+            self._read_chunk()
+
+    def iter_array(self) -> Iterator:
+        """ Yields every element of json array starting at next character.
+        """
+        self.expect('[')
+        if self.peek() == ']':
+            self._position += 1
+            return
+        while True:
+            yield self.decode_value()
+            if self.expect(',]') == ']':
+                return
+
+
+def _iter_json_rows(file_hantle: io.TextIOWrapper,
+                    chunk_size: int) -> Iterator[tuple[int, dict]]:
+    """ Parses pokemon rows from json file one row at a time, reading file
+    in chunks, and yields every row with file's format version.\n
+    Rows of v2 file are streamed when "format_version" key is placed
+    before "pokemon" key, as done by write_to_json_v2. Otherwise rows are
+    kept in memory until format version is read, so the same files are
+    accepted as by read_from_json.
+
+    Args:
+        file_hantle (io.TextIOWrapper): file_hantle variable from json file.
+        chunk_size (int): Number of characters read from file at once.
+
+    Raises:
+        json.JSONDecodeError: Given file is not a valid json file.
+        MalformedPokemonDataError: Given file's format is not supported.
+
+    Yields:
+        tuple(int, dict): Format version and row of every pokemon.
+    """
+    reader = _JsonStreamReader(file_hantle, chunk_size)
+    if reader.peek() == '[':
+        for item in reader.iter_array():
+            yield JSON_FORMAT_V1, item
+        reader.expect_end()
+        return
+    reader.expect('{')
+    format_version = None
+    has_rows = False
+    buffered_rows = []
+    if reader.peek() == '}':
+        reader.expect('}')
+    else:
+        while True:
+            key = reader.decode_value()
+            reader.expect(':')
+            if key == 'pokemon' and reader.peek() != '[':
+                reader.decode_value()
+                has_rows = False
+            elif key == 'pokemon':
+                if format_version is None:
+                    buffered_rows = list(reader.iter_array())
+                elif format_version != JSON_FORMAT_V2:
+                    raise MalformedPokemonDataError(
+                        'Unsupported pokemon database format: {}'.format(
+                            format_version
+                            )
+                        )
+                else:
+                    for item in reader.iter_array():
+                        yield format_version, item
+                has_rows = True
+            elif key == 'format_version':
+                format_version = reader.decode_value()
+            else:
+                reader.decode_value()
+            if reader.expect(',}') == '}':
+                break
+    if not has_rows or format_version != JSON_FORMAT_V2:
         raise MalformedPokemonDataError(
-            'Malformed wrong data size in row {}: \n{}'.format(idx+1, e)
+            'Unsupported pokemon database format: {}'.format(format_version)
             )
-    except RedundantKeyError as e:
-        raise MalformedPokemonDataError(
-            'Malformed redundant key in row {}: \n{}'.format(idx+1, e)
+    for item in buffered_rows:
+        yield format_version, item
+    reader.expect_end()
+
+
+def iter_from_json(file_hantle: io.TextIOWrapper,
+                   chunk_size: int = JSON_STREAM_CHUNK_SIZE,
+                   shared_values: (SharedPokemonValues | None) = None
+                   ) -> Iterator[BasePokemon]:
+    """ Reads json file incrementally, one pokemon row at a time, and
+    yields every base pokemon after checking if it's not corrupted.\n
+    File format (v1 or v2) is detected from it's content.\n
+    Throws exception when first corrupted row is reached, after yielding
+    every pokemon from previous rows.
+
+    Args:
+        file_hantle (io.TextIOWrapper): file_hantle variable from json file.
+        chunk_size (int, optional): Number of characters read from file
+        at once. Defaults to JSON_STREAM_CHUNK_SIZE.
+        shared_values (SharedPokemonValues | None, optional): Cache of
+        values shared between pokemons. Defaults to None (new cache).
+
+    Raises:
+        MalformedPokemonDataError: returns type of data corruption and
+        row where it was found (same as in read_from_json).
+        json.JSONDecodeError: Given file is not a valid json file.
+
+    Yields:
+        BasePokemon: Pokemon created from every row.
+    """
+    shared_values = shared_values or SharedPokemonValues()
+    rows = _iter_json_rows(file_hantle, chunk_size)
+    for idx, (format_version, item) in enumerate(rows):
+        pokemon = io_return_valid_pokemon(item, idx+1, format_version)
+        pokemon.share_values(shared_values)
+        yield pokemon
+
+
+def pokemon_to_record(pokemon: BasePokemon) -> dict:
+    """ Returns values of given pokemon as typed row of pokemon.json v2.
+
+    Args:
+        pokemon (BasePokemon): Pokemon to save.
+
+    Returns:
+        dict: Pokemon's row with json numbers, nulls and ability list.
+    """
+    other = pokemon.get_other_dict()
+    return {
+        'pokedex_number': pokemon.get_pokedex_number(),
+        'name': pokemon.get_name(),
+        'abilities': list(pokemon.get_abilities()),
+        'stats': {
+            'hp': pokemon.get_base_hp(),
+            'defense': pokemon.get_base_defense(),
+            'attack': pokemon.get_base_attack(),
+            'speed': pokemon.get_base_speed(),
+            'type1': pokemon.get_types()[0],
+            'type2': pokemon.get_types()[1],
+            'classfication': pokemon.get_classfication(),
+            'experience_growth': pokemon.get_experience_growth()
+        },
+        'special_strength': dict(pokemon.get_special_strength_dict()),
+        'other': {
+            'percentage_male': other['percentage_male'],
+            'height_m': other['height_m'],
+            'weight_kg': other['weight_kg'],
+            'generation': other['generation']
+        }
+    }
+
+
+def write_rows_to_json(rows: Iterable[dict],
+                       file_hantle: io.TextIOWrapper,
+                       format_version: int = JSON_FORMAT_V2) -> int:
+    """ Writes given raw pokemon rows to json file in given format, one row
+    at a time. Rows are not checked.
+
+    Args:
+        rows (Iterable[dict]): Rows to save, can be generator.
+        file_hantle (io.TextIOWrapper): file_hantle variable of file
+        opened for writing.
+        format_version (int, optional): JSON_FORMAT_V1 (list of rows) or
+        JSON_FORMAT_V2. Defaults to JSON_FORMAT_V2.
+
+    Returns:
+        int: Number of written rows.
+    """
+    if format_version == JSON_FORMAT_V1:
+        file_hantle.write('[')
+        separator = '\n    '
+    else:
+        file_hantle.write(
+            '{{\n    "format_version": {},\n    "pokemon": ['.format(
+                JSON_FORMAT_V2
+                )
             )
+        separator = '\n        '
+    count = 0
+    for item in rows:
+        file_hantle.write(',' + separator if count else separator)
+        file_hantle.write(json.dumps(item, ensure_ascii=False))
+        count += 1
+    if format_version == JSON_FORMAT_V1:
+        file_hantle.write('\n]\n')
+    else:
+        file_hantle.write('\n    ]\n}\n')
+    return count
+
+
+def write_to_json_v2(pokemons: Iterable[BasePokemon],
+                     file_hantle: io.TextIOWrapper) -> int:
+    """ Writes given pokemons to json file in v2 format, one row at a time.
+
+    Args:
+        pokemons (Iterable[BasePokemon]): Pokemons to save, can be
+        generator.
+        file_hantle (io.TextIOWrapper): file_hantle variable of file
+        opened for writing.
+
+    Returns:
+        int: Number of written pokemons.
+    """
+    return write_rows_to_json(
+        (pokemon_to_record(pokemon) for pokemon in pokemons), file_hantle
+        )
@@ -0,0 +1,169 @@
+import io
+import json
+from importlib import import_module
+from typing import Any, Callable
+from classes import RedundantKeyError
+
+
+# Json parsers which can read pokemon databases, from the fastest one.
+# Only stdlib json is always installed, others are used when available.
+JSON_BACKEND_NAMES = ('orjson', 'ujson', 'json')
+
+_json_backends = {}
+
+
+class JsonBackend:
+    """ Json parser used to read pokemon database files. Every backend
+    throws json.JSONDecodeError for invalid json, like stdlib json.
+    """
+    def __init__(self,
+                 name: str,
+                 loads: Callable[[(bytes | str)], Any],
+                 errors: tuple[type[Exception], ...],
+                 dumps_sorted: Callable[[Any], bytes]) -> None:
+        """ Creates backend using given parsing function.
+
+        Args:
+            name (str): Name of backend's module.
+            loads (Callable): Function parsing json from bytes or string.
+            errors (tuple): Exceptions thrown by loads for invalid json.
+            dumps_sorted (Callable): Function serializing value to utf-8
+            json with sorted keys.
+        """
+        self._name = name
+        self._loads = loads
+        self._errors = errors
+        self._dumps_sorted = dumps_sorted
+
+    def get_name(self) -> str:
+        """ Returns name of backend's module (ex. 'orjson').
+        """
+        return self._name
+
+    def loads(self, data: (bytes | str)) -> Any:
+        """ Parses given json document.
+
+        Args:
+            data (bytes | str): Json document, bytes must be utf-8.
+
+        Raises:
+            json.JSONDecodeError: Given data is not a valid json.
+
+        Returns:
+            Any: Parsed value.
+        """
+        try:
+            return self._loads(data)
+        except json.JSONDecodeError:
+            raise
+        except self._errors as error:
+            raise json.JSONDecodeError(str(error), '', 0)
+
+    def dumps_sorted(self, value: Any) -> bytes:
+        """ Serializes given value to utf-8 json with sorted keys, so equal
+        values always give equal bytes. Output of different backends
+        can differ (ex. in whitespace).
+
+        Args:
+            value (Any): Json-serializable value.
+
+        Returns:
+            bytes: Serialized value.
+        """
+        return self._dumps_sorted(value)
+
+    def load(self, file_hantle: (io.TextIOWrapper | io.BufferedIOBase)
+             ) -> Any:
+        """ Parses whole json file. Bytes of text file opened from disk
+        are parsed directly, without decoding them to string first.
+
+        Args:
+            file_hantle (io.TextIOWrapper | io.BufferedIOBase): Json file
+            opened in text or binary mode, at it's beginning.
+
+        Raises:
+            json.JSONDecodeError: Given file is not a valid json.
+
+        Returns:
+            Any: Parsed value.
+        """
+        buffer = getattr(file_hantle, 'buffer', None)
+        if buffer is not None:
+            return self.loads(buffer.read())
+        return self.loads(file_hantle.read())
+
+
+def _dumps_sorted(value: Any) -> bytes:
+    return json.dumps(value, sort_keys=True, ensure_ascii=False).encode(
+        'utf-8'
+        )
+
+
+def _create_json_backend(name: str) -> JsonBackend:
+    """ Imports module of given backend and creates it.
+
+    Raises:
+        ImportError: Module of given backend is not installed.
+    """
+    module = import_module(name)
+    if name == 'json':
+        return JsonBackend(name, module.loads, (UnicodeDecodeError,),
+                           _dumps_sorted)
+    if name == 'orjson':
+        def dumps_sorted(value: Any) -> bytes:
+            try:
+                return module.dumps(value, option=module.OPT_SORT_KEYS)
+            except module.JSONEncodeError:
+                # ex. integers longer than 64 bits
+                return _dumps_sorted(value)
+    else:
+        def dumps_sorted(value: Any) -> bytes:
+            return module.dumps(value, sort_keys=True,
+                                ensure_ascii=False).encode('utf-8')
+    return JsonBackend(
+        name, module.loads, (getattr(module, 'JSONDecodeError', ValueError),),
+        dumps_sorted
+        )
+
+
+def get_json_backend(name: (str | None) = None) -> JsonBackend:
+    """ Returns json backend with given name, or the fastest installed one
+    (see JSON_BACKEND_NAMES) if name is not given. Backends are created
+    once and reused.
+
+    Args:
+        name (str | None, optional): Name of backend. Defaults to None
+        (the fastest installed backend).
+
+    Raises:
+        RedundantKeyError: Given backend is not supported.
+        ImportError: Given backend is not installed.
+
+    Returns:
+        JsonBackend: Json backend.
+    """
+    if name is None:
+        for backend_name in JSON_BACKEND_NAMES:
+            try:
+                return get_json_backend(backend_name)
+            except ImportError:
+                continue
+    if name not in JSON_BACKEND_NAMES:
+        raise RedundantKeyError(
+            'Unsupported json backend: {}'.format(name)
+            )
+    if name not in _json_backends:
+        _json_backends[name] = _create_json_backend(name)
+    return _json_backends[name]
+
+
+def get_available_json_backends() -> list[JsonBackend]:
+    """ Returns every installed json backend, from the fastest one.
+    """
+    backends = []
+    for name in JSON_BACKEND_NAMES:
+        try:
+            backends.append(get_json_backend(name))
+        except ImportError:
+            continue
+    return backends
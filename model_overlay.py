@@ -0,0 +1,259 @@
+import argparse
+import io
+import json
+from classes import (
+    BasePokemon,
+    DataDoesNotExistError,
+    MalformedPokemonDataError,
+    SharedPokemonValues
+)
+from model_io import (
+    open_json_file,
+    io_convert_to_int,
+    io_read_format_rows,
+    io_return_row_hash,
+    io_return_valid_pokemon,
+    pokemon_to_record,
+    JSON_FORMAT_V2
+)
+from model_json import JsonBackend, get_json_backend
+from model_schema import POKEMON_SCHEMA, SchemaSection
+
+
+# Overlay (mod) files patch or add single pokemons of base database:
+# {"overlay_format_version": 1, "pokemon": [rows]}, where every row has
+# pokedex_number and values in pokemon.json v2 format. Row of pokemon
+# existing in base database may have only changed values (nested stats,
+# special_strength and other dicts are merged key by key), row of new
+# pokemon must be complete.
+OVERLAY_FILE_SUFFIX = '.overlay.json'
+OVERLAY_FORMAT_VERSION = 1
+
+_SECTION_KEYS = tuple(
+    key for key, declaration in POKEMON_SCHEMA.items()
+    if isinstance(declaration, SchemaSection)
+)
+
+
+def read_overlay(file_hantle: io.TextIOWrapper,
+                 json_backend: (JsonBackend | None) = None) -> list[dict]:
+    """ Parses overlay file and returns it's rows. Values of rows are
+    checked only when overlay is applied (see apply_overlay).
+
+    Args:
+        file_hantle (io.TextIOWrapper): file_hantle variable from overlay
+        file.
+        json_backend (JsonBackend | None, optional): Json parser.
+        Defaults to None (the fastest installed backend).
+
+    Raises:
+        json.JSONDecodeError: Given file is not a valid json file.
+        MalformedPokemonDataError: Given file is not a valid overlay.
+
+    Returns:
+        list: Overlay rows.
+    """
+    data = (json_backend or get_json_backend()).load(file_hantle)
+    if not isinstance(data, dict) or (
+                data.get('overlay_format_version') != OVERLAY_FORMAT_VERSION
+            ):
+        raise MalformedPokemonDataError('Unsupported overlay format')
+    rows = data.get('pokemon')
+    if not isinstance(rows, list) or not all(
+                isinstance(item, dict) and 'pokedex_number' in item
+                for item in rows
+            ):
+        raise MalformedPokemonDataError('Malformed overlay rows')
+    return rows
+
+
+def _merge_row(record: dict, item: dict) -> dict:
+    """ Returns copy of given v2 record with values of given overlay row.
+    """
+    merged = dict(record)
+    for key, value in item.items():
+        if key == 'pokedex_number':
+            continue
+        if key in _SECTION_KEYS and isinstance(value, dict):
+            merged[key] = {**record[key], **value}
+        else:
+            merged[key] = value
+    return merged
+
+
+def apply_overlay(pokemons: list[BasePokemon],
+                  rows: list[dict],
+                  shared_values: (SharedPokemonValues | None) = None
+                  ) -> list[BasePokemon]:
+    """ Returns new list of pokemons with given overlay rows applied.
+    Only patched and added pokemons are checked and created, every other
+    pokemon is the same object as in given list, which is not modified.
+    Added pokemons are placed after given ones, in overlay order.
+
+    Args:
+        pokemons (list[BasePokemon]): Pokemons of base database.
+        rows (list[dict]): Overlay rows (see read_overlay).
+        shared_values (SharedPokemonValues | None, optional): Cache of
+        values shared between pokemons, the same as base database's one.
+        Defaults to None (new cache).
+
+    Raises:
+        MalformedPokemonDataError: returns type of data corruption and
+        overlay row where it was found.
+
+    Returns:
+        list: List of BasePokemon objects.
+    """
+    shared_values = shared_values or SharedPokemonValues()
+    positions = {
+        pokemon.get_pokedex_number(): idx
+        for idx, pokemon in enumerate(pokemons)
+    }
+    pokemon_list = list(pokemons)
+    for idx, item in enumerate(rows):
+        for key in item:
+            if key not in POKEMON_SCHEMA:
+                raise MalformedPokemonDataError(
+                    'Malformed redundant key in row {}: \n{}'.format(
+                        idx + 1, key
+                        )
+                    )
+        try:
+            number = io_convert_to_int(item['pokedex_number'])
+        except (TypeError, ValueError):
+            number = None
+        position = positions.get(number)
+        if position is not None:
+            item = _merge_row(pokemon_to_record(pokemon_list[position]), item)
+        elif len(item) != len(POKEMON_SCHEMA):
+            raise MalformedPokemonDataError(
+                'Malformed wrong data size in row {}: \n'
+                'New pokemon must have every value'.format(idx + 1)
+                )
+        pokemon = io_return_valid_pokemon(item, idx + 1, JSON_FORMAT_V2)
+        pokemon.share_values(shared_values)
+        if position is None:
+            positions[pokemon.get_pokedex_number()] = len(pokemon_list)
+            pokemon_list.append(pokemon)
+        else:
+            pokemon_list[position] = pokemon
+    return pokemon_list
+
+
+def _read_numbered_rows(file_path: str
+                        ) -> tuple[int, dict[int, tuple[int, dict]]]:
+    """ Reads raw rows of given json file with their row numbers (used in
+    exception messages), by their pokedex numbers.
+    """
+    with open_json_file(file_path) as file_hantle:
+        format_version, data = io_read_format_rows(file_hantle)
+    rows = {}
+    for idx, item in enumerate(data):
+        try:
+            rows[io_convert_to_int(item['pokedex_number'])] = (idx + 1, item)
+        except (KeyError, TypeError, ValueError):
+            raise MalformedPokemonDataError(
+                'Malformed pokedex number in row {}'.format(idx + 1)
+                )
+    return format_version, rows
+
+
+def _get_changed_values(record: dict, target_record: dict) -> dict:
+    """ Returns values of target_record different from record, with
+    pokedex number (nested dicts only with changed values).
+    """
+    changed = {'pokedex_number': target_record['pokedex_number']}
+    for key, value in target_record.items():
+        if value == record[key]:
+            continue
+        if key in _SECTION_KEYS:
+            value = {
+                section_key: section_value
+                for section_key, section_value in value.items()
+                if record[key].get(section_key) != section_value
+            }
+        changed[key] = value
+    return changed
+
+
+def diff_databases(base_path: str, target_path: str) -> list[dict]:
+    """ Returns overlay rows, which change base database into target one.
+    Rows are compared by their hashes (see model_io.io_return_row_hash),
+    only rows with different hashes are checked and compared by values.
+
+    Args:
+        base_path (str): Path to base json file (v1 or v2).
+        target_path (str): Path to target json file (v1 or v2).
+
+    Raises:
+        FileNotFoundError: Given file does not exist.
+        MalformedPokemonDataError: Given file has corrupted row.
+        DataDoesNotExistError: Target database misses pokemons of base
+        database, which cannot be saved in overlay.
+
+    Returns:
+        list: Overlay rows, in target database order.
+    """
+    base_format, base_rows = _read_numbered_rows(base_path)
+    target_format, target_rows = _read_numbered_rows(target_path)
+    removed = sorted(set(base_rows) - set(target_rows))
+    if removed:
+        raise DataDoesNotExistError(
+            'Overlay cannot remove pokemons: {}'.format(
+                ', '.join(str(number) for number in removed)
+                )
+            )
+    overlay_rows = []
+    for number, (row, item) in target_rows.items():
+        base_row, base_item = base_rows.get(number, (None, None))
+        if base_item is not None and io_return_row_hash(
+                    base_item, base_format
+                ) == io_return_row_hash(item, target_format):
+            continue
+        target_record = pokemon_to_record(
+            io_return_valid_pokemon(item, row, target_format)
+            )
+        if base_item is None:
+            overlay_rows.append(target_record)
+            continue
+        changed = _get_changed_values(pokemon_to_record(
+            io_return_valid_pokemon(base_item, base_row, base_format)
+            ), target_record)
+        if len(changed) > 1:
+            overlay_rows.append(changed)
+    return overlay_rows
+
+
+def write_overlay(rows: list[dict], file_hantle: io.TextIOWrapper) -> None:
+    """ Writes given overlay rows to overlay file.
+
+    Args:
+        rows (list[dict]): Overlay rows.
+        file_hantle (io.TextIOWrapper): file_hantle variable of file
+        opened for writing.
+    """
+    json.dump({
+        'overlay_format_version': OVERLAY_FORMAT_VERSION,
+        'pokemon': rows
+    }, file_hantle, ensure_ascii=False, indent=4)
+    file_hantle.write('\n')
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description='Writes overlay file ({} extension), which changes '
+                    'base pokemon.json into target one.'.format(
+                        OVERLAY_FILE_SUFFIX)
+        )
+    parser.add_argument('base', help='base pokemon.json (v1 or v2) file')
+    parser.add_argument('target', help='target pokemon.json (v1 or v2) file')
+    parser.add_argument('overlay', help='path of new overlay file')
+    args = parser.parse_args()
+    rows = diff_databases(args.base, args.target)
+    with open(args.overlay, 'w', encoding='utf-8') as file_hantle:
+        write_overlay(rows, file_hantle)
+    print('Written {} changed pokemons to {}'.format(len(rows), args.overlay))
+
+
+if __name__ == '__main__':
+    main()
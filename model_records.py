@@ -0,0 +1,381 @@
+import io
+import math
+import mmap
+import struct
+from typing import Iterable, Iterator
+from classes import (
+    BasePokemon,
+    MalformedPokemonDataError,
+    SharedPokemonValues
+)
+from model_schema import SPECIAL_STRENGTH_KEYS
+
+
+# Binary pokemon database: header, then one fixed-width record per
+# pokedex number (starting from the lowest one, empty slots for gaps),
+# then table of unique strings used by records.
+RECORD_FILE_SUFFIX = '.pkdb'
+RECORD_FILE_MAGIC = b'PKDB'
+RECORD_FILE_VERSION = 1
+
+# magic, version, record size, number of slots, first pokedex number,
+# number of pokemons, offset of string table
+HEADER_STRUCT = struct.Struct('<4sHHIIIQ')
+HEADER_SIZE = 32
+
+# pokedex_number (0 for empty slot), hp, attack, defense, speed,
+# experience_growth, generation, string ids of name, type1, type2,
+# classfication and abilities, 18 special strength values (float32),
+# percentage_male, height_m, weight_kg (float64, NaN for None)
+RECORD_STRUCT = struct.Struct('<12I18f3d')
+
+# Every pokedex number up to the highest one has a slot in file, so
+# higher numbers are rejected instead of writing huge gaps of empty slots.
+MAX_RECORD_POKEDEX_NUMBER = 1000000
+
+# Number of empty slots of gap written at once.
+_EMPTY_RECORDS_CHUNK = 4096
+
+NO_STRING = 0xFFFFFFFF
+ABILITIES_SEPARATOR = '\x1f'
+
+_STRING_COUNT_STRUCT = struct.Struct('<I')
+
+
+def _none_to_nan(value: (float | None)) -> float:
+    return math.nan if value is None else value
+
+
+def _nan_to_none(value: float) -> (float | None):
+    return None if math.isnan(value) else value
+
+
+def write_record_file(pokemons: Iterable[BasePokemon], file_path: str) -> int:
+    """ Writes given pokemons to binary record file, one at a time.
+    Only table of unique strings is kept in memory until the end.\n
+    Throws exception if pokemons are not sorted by pokedex number or
+    pokedex number is greater than MAX_RECORD_POKEDEX_NUMBER.
+
+    Args:
+        pokemons (Iterable[BasePokemon]): Pokemons sorted by pokedex
+        number, can be generator.
+        file_path (str): Path of new record file.
+
+    Raises:
+        MalformedPokemonDataError: Pokemons are not sorted by pokedex number,
+        pokedex number is greater than MAX_RECORD_POKEDEX_NUMBER or given
+        ability contains separator character.
+
+    Returns:
+        int: Number of written pokemons.
+    """
+    with open(file_path, 'wb') as file_hantle:
+        return write_records(pokemons, file_hantle)
+
+
+def write_records(pokemons: Iterable[BasePokemon],
+                  file_hantle: io.BufferedIOBase) -> int:
+    """ Writes given pokemons in record file layout to given seekable
+    binary file (ex. io.BytesIO), like write_record_file.
+
+    Args:
+        pokemons (Iterable[BasePokemon]): Pokemons sorted by pokedex
+        number, can be generator.
+        file_hantle (io.BufferedIOBase): Binary file opened for writing,
+        at it's beginning.
+
+    Raises:
+        MalformedPokemonDataError: Pokemons are not sorted by pokedex number,
+        pokedex number is greater than MAX_RECORD_POKEDEX_NUMBER or given
+        ability contains separator character.
+
+    Returns:
+        int: Number of written pokemons.
+    """
+    string_ids = {}
+
+    def get_string_id(value: (str | None)) -> int:
+        if value is None:
+            return NO_STRING
+        if value not in string_ids:
+            string_ids[value] = len(string_ids)
+        return string_ids[value]
+
+    empty_records = memoryview(
+        bytes(RECORD_STRUCT.size * _EMPTY_RECORDS_CHUNK)
+        )
+    first_number = None
+    previous_number = None
+    count = 0
+    file_hantle.write(bytes(HEADER_SIZE))
+    for pokemon in pokemons:
+        number = pokemon.get_pokedex_number()
+        if previous_number is not None and number <= previous_number:
+            raise MalformedPokemonDataError(
+                'Pokemons must be sorted by pokedex number, got {} '
+                'after {}'.format(number, previous_number)
+                )
+        if number > MAX_RECORD_POKEDEX_NUMBER:
+            raise MalformedPokemonDataError(
+                'Pokedex number {} is greater than {}'.format(
+                    number, MAX_RECORD_POKEDEX_NUMBER)
+                )
+        if first_number is None:
+            first_number = number
+        else:
+            gap_size = (number - previous_number - 1) * RECORD_STRUCT.size
+            while gap_size > 0:
+                chunk = empty_records[:gap_size]
+                file_hantle.write(chunk)
+                gap_size -= len(chunk)
+        abilities = pokemon.get_abilities()
+        if any(ABILITIES_SEPARATOR in ability for ability in abilities):
+            raise MalformedPokemonDataError(
+                'Ability of pokemon {} contains separator'.format(number)
+                )
+        type1, type2 = pokemon.get_types()
+        special_strength = pokemon.get_special_strength_dict()
+        other = pokemon.get_other_dict()
+        file_hantle.write(RECORD_STRUCT.pack(
+            number,
+            pokemon.get_base_hp(),
+            pokemon.get_base_attack(),
+            pokemon.get_base_defense(),
+            pokemon.get_base_speed(),
+            pokemon.get_experience_growth(),
+            other['generation'],
+            get_string_id(pokemon.get_name()),
+            get_string_id(type1),
+            get_string_id(type2),
+            get_string_id(pokemon.get_classfication()),
+            get_string_id(ABILITIES_SEPARATOR.join(abilities)),
+            *(special_strength[key] for key in SPECIAL_STRENGTH_KEYS),
+            _none_to_nan(other['percentage_male']),
+            _none_to_nan(other['height_m']),
+            _none_to_nan(other['weight_kg'])
+            ))
+        previous_number = number
+        count += 1
+    strings_offset = file_hantle.tell()
+    encoded_strings = [value.encode('utf-8') for value in string_ids]
+    offsets = [0]
+    for value in encoded_strings:
+        offsets.append(offsets[-1] + len(value))
+    file_hantle.write(_STRING_COUNT_STRUCT.pack(len(encoded_strings)))
+    file_hantle.write(struct.pack('<{}I'.format(len(offsets)), *offsets))
+    file_hantle.write(b''.join(encoded_strings))
+    slot_count = 0 if first_number is None else (
+        previous_number - first_number + 1
+        )
+    file_hantle.seek(0)
+    file_hantle.write(HEADER_STRUCT.pack(
+        RECORD_FILE_MAGIC, RECORD_FILE_VERSION, RECORD_STRUCT.size,
+        slot_count, first_number or 0, count, strings_offset
+        ))
+    return count
+
+
+class PokemonRecordFile:
+    """ Read-only binary record file opened with mmap, so many processes
+    share the same pages of OS cache. Pokemon with given pokedex number
+    is found with offset calculation and is converted to BasePokemon
+    only when it's read.
+    Records can also be read from given buffer (ex. shared memory, see
+    model_shared), without copying it.
+    """
+    def __init__(self, file_path: (str | None) = None,
+                 buffer: (memoryview | None) = None) -> None:
+        """ Opens and maps given record file, or uses given buffer.
+
+        Args:
+            file_path (str | None, optional): Path to record file.
+            Defaults to None (buffer must be given).
+            buffer (memoryview | None, optional): Buffer with records,
+            which is not closed by close. Defaults to None.
+
+        Raises:
+            FileNotFoundError: Given file does not exist.
+            PermissionError: Given file cannot be accessed.
+            IsADirectoryError: Given path is a directory.
+            MalformedPokemonDataError: Given file is not a record file
+            or has unsupported version.
+        """
+        self._owns_buffer = buffer is None
+        if buffer is not None:
+            self._buffer = buffer
+            self._read_header()
+            return
+        with open(file_path, 'rb') as file_hantle:
+            try:
+                self._buffer = mmap.mmap(
+                    file_hantle.fileno(), 0, access=mmap.ACCESS_READ
+                    )
+            except ValueError:
+                raise MalformedPokemonDataError('Given record file is empty')
+        self._read_header()
+
+    def _read_header(self) -> None:
+        """ Reads and checks header and string table position.
+
+        Raises:
+            MalformedPokemonDataError: Buffer is not a record file
+            or has unsupported version.
+        """
+        buffer = self._buffer
+        try:
+            (magic, version, record_size, self._slot_count,
+             self._first_number, self._pokemon_count,
+             strings_offset) = HEADER_STRUCT.unpack_from(buffer, 0)
+            if magic != RECORD_FILE_MAGIC:
+                raise MalformedPokemonDataError(
+                    'Given file is not a record file'
+                    )
+            if version != RECORD_FILE_VERSION or (
+                        record_size != RECORD_STRUCT.size
+                    ):
+                raise MalformedPokemonDataError(
+                    'Unsupported record file version: {}'.format(version)
+                    )
+            (string_count,) = _STRING_COUNT_STRUCT.unpack_from(
+                buffer, strings_offset
+                )
+        except struct.error:
+            raise MalformedPokemonDataError('Given record file is truncated')
+        self._string_offsets_position = (
+            strings_offset + _STRING_COUNT_STRUCT.size
+            )
+        self._strings_position = (
+            self._string_offsets_position + 4 * (string_count + 1)
+            )
+        self._string_count = string_count
+        self._strings = {}
+        self._shared_values = SharedPokemonValues()
+
+    def __len__(self) -> int:
+        """ Returns number of pokemons in file.
+        """
+        return self._pokemon_count
+
+    def get_string(self, string_id: int) -> (str | None):
+        """ Reads string with given id from string table.
+        Decoded strings are cached, so every string is shared.
+
+        Args:
+            string_id (int): Id of string or NO_STRING.
+
+        Returns:
+            str | None: String value or None for NO_STRING.
+        """
+        if string_id == NO_STRING:
+            return None
+        value = self._strings.get(string_id)
+        if value is None:
+            start, end = struct.unpack_from(
+                '<2I', self._buffer,
+                self._string_offsets_position + 4 * string_id
+                )
+            value = str(
+                self._buffer[
+                    self._strings_position + start:
+                    self._strings_position + end
+                    ],
+                'utf-8')
+            self._strings[string_id] = value
+        return value
+
+    def _get_record(self, slot: int) -> (tuple | None):
+        """ Unpacks record in given slot.
+
+        Args:
+            slot (int): Slot number (pokedex number - first pokedex number).
+
+        Returns:
+            tuple | None: Record values or None for empty slot.
+        """
+        record = RECORD_STRUCT.unpack_from(
+            self._buffer, HEADER_SIZE + slot * RECORD_STRUCT.size
+            )
+        if not record[0]:
+            return None
+        return record
+
+    def _record_to_pokemon(self, record: tuple) -> BasePokemon:
+        """ Creates BasePokemon object from unpacked record, sharing
+        repeated values with pokemons already read from file.
+
+        Args:
+            record (tuple): Record values.
+
+        Returns:
+            BasePokemon: Pokemon from record.
+        """
+        get_string = self.get_string
+        stats = {
+            'hp': record[1],
+            'defense': record[3],
+            'attack': record[2],
+            'speed': record[4],
+            'type1': get_string(record[8]),
+            'type2': get_string(record[9]),
+            'classfication': get_string(record[10]),
+            'experience_growth': record[5]
+        }
+        special_strength = dict(zip(SPECIAL_STRENGTH_KEYS, record[12:30]))
+        other = {
+            'percentage_male': _nan_to_none(record[30]),
+            'height_m': _nan_to_none(record[31]),
+            'weight_kg': _nan_to_none(record[32]),
+            'generation': record[6]
+        }
+        abilities = get_string(record[11]).split(ABILITIES_SEPARATOR)
+        pokemon = BasePokemon(record[0], get_string(record[7]), abilities,
+                              stats, special_strength, other)
+        pokemon.share_values(self._shared_values)
+        return pokemon
+
+    def get_pokemon(self, pokedex_number: int) -> (BasePokemon | None):
+        """ Reads pokemon with given pokedex number using offset calculation.
+
+        Args:
+            pokedex_number (int): Pokemon's pokedex number.
+
+        Returns:
+            BasePokemon | None: Pokemon or None if it's not in file.
+        """
+        slot = pokedex_number - self._first_number
+        if slot < 0 or slot >= self._slot_count:
+            return None
+        record = self._get_record(slot)
+        if record is None:
+            return None
+        return self._record_to_pokemon(record)
+
+    def iter_names(self) -> Iterator[tuple[int, str]]:
+        """ Yields pokedex number and name of every pokemon, without
+        creating BasePokemon objects.
+
+        Yields:
+            tuple(int, str): Pokedex number and name.
+        """
+        for slot in range(self._slot_count):
+            record = self._get_record(slot)
+            if record is not None:
+                yield record[0], self.get_string(record[7])
+
+    def __iter__(self) -> Iterator[BasePokemon]:
+        """ Yields every pokemon from file in pokedex number order.
+
+        Yields:
+            BasePokemon: Every pokemon in file.
+        """
+        for slot in range(self._slot_count):
+            record = self._get_record(slot)
+            if record is not None:
+                yield self._record_to_pokemon(record)
+
+    def close(self) -> None:
+        """ Unmaps file. Given buffer is only forgotten.
+        """
+        if self._owns_buffer:
+            self._buffer.close()
+        self._buffer = None
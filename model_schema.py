@@ -0,0 +1,436 @@
+from ast import literal_eval
+from typing import Callable
+from classes import (
+    InvalidDataLineLeghthError,
+    PokemonDataDoesNotExistError,
+    NotANumberError,
+    BadConversionError,
+    RedundantKeyError
+)
+
+
+class SchemaSection:
+    """ Declares nested dict of pokemon record, which must have exactly
+    given fields.
+    """
+    def __init__(self,
+                 fields: dict[str, str],
+                 convert_while_checking_keys: bool = False,
+                 reads_keys_method: bool = False) -> None:
+        """ Creates section declaration.
+
+        Args:
+            fields (dict[str, str]): Field names with their value kinds
+            (keys of FIELD_CONVERTERS), in order of conversion.
+            convert_while_checking_keys (bool, optional): Converts every
+            value right after checking it's key, in given dict's order,
+            instead of checking every key before converting values.
+            Decides which error is thrown first for malformed dicts.
+            Defaults to False.
+            reads_keys_method (bool, optional): Checks keys returned by
+            given value's keys method, so value which is not a dict throws
+            AttributeError, like in io_return_valid_stats_dict.
+            Defaults to False.
+        """
+        self.fields = fields
+        self.convert_while_checking_keys = convert_while_checking_keys
+        self.reads_keys_method = reads_keys_method
+
+
+# Every pokemon type in canonical order, used for special strength keys.
+POKEMON_TYPES = (
+    'bug', 'dark', 'dragon', 'electric', 'fairy', 'fighting',
+    'fire', 'flying', 'ghost', 'grass', 'ground', 'ice',
+    'normal', 'poison', 'psychic', 'rock', 'steel', 'water'
+)
+
+SPECIAL_STRENGTH_KEYS = tuple(
+    'against_{}'.format(pokemon_type) for pokemon_type in POKEMON_TYPES
+)
+
+POKEMON_SCHEMA = {
+    'pokedex_number': 'positive_int',
+    'name': 'string',
+    'abilities': 'string_list',
+    'stats': SchemaSection({
+        'hp': 'positive_int',
+        'defense': 'positive_int',
+        'attack': 'positive_int',
+        'speed': 'positive_int',
+        'type1': 'string',
+        'type2': 'optional_string',
+        'classfication': 'string',
+        'experience_growth': 'positive_int',
+        }, reads_keys_method=True),
+    'special_strength': SchemaSection({
+        key: 'not_negative_float' for key in SPECIAL_STRENGTH_KEYS
+        }, convert_while_checking_keys=True),
+    'other': SchemaSection({
+        'percentage_male': 'optional_not_negative_float',
+        'weight_kg': 'optional_positive_float',
+        'height_m': 'optional_positive_float',
+        'generation': 'required_positive_float',
+        }),
+}
+
+
+# Converters of single field values, named by value kind. Each one
+# checks and converts value in one step and throws the same exceptions,
+# with the same messages, as io_* function chain in model_io.
+
+def _make_positive_int_converter(field_name: str) -> Callable:
+    def convert(value):
+        try:
+            float_value = float(value)
+            if float_value != int(float_value):
+                raise BadConversionError
+            value = int(value)
+        except BadConversionError:
+            raise BadConversionError(
+                "Float cannot be mapped (rounded) to int in this instance."
+                )
+        except ValueError:
+            raise NotANumberError('Given value cannot be converted to int.')
+        if value <= 0:
+            raise ValueError('Given value must be positive.')
+        return value
+    return convert
+
+
+def _make_string_converter(field_name: str) -> Callable:
+    def convert(value):
+        if not value:
+            raise PokemonDataDoesNotExistError('Given value is empty')
+        if not isinstance(value, str):
+            raise BadConversionError('Given value is not string.')
+        return value
+    return convert
+
+
+def _make_optional_string_converter(field_name: str) -> Callable:
+    def convert(value):
+        if not value:
+            return None
+        if not isinstance(value, str):
+            raise BadConversionError('Given value is not string.')
+        return value
+    return convert
+
+
+def _make_string_list_converter(field_name: str) -> Callable:
+    def convert(value):
+        if not value:
+            raise PokemonDataDoesNotExistError('Given value is empty')
+        if not isinstance(value, str):
+            raise BadConversionError('Given value is not string.')
+        try:
+            value = literal_eval(value)
+            if not isinstance(value, list):
+                raise TypeError
+        except ValueError:
+            raise BadConversionError('Given value is not convertable to list')
+        except TypeError:
+            raise BadConversionError('Given string value is not a list')
+        if not value:
+            raise PokemonDataDoesNotExistError('Given list in empty')
+        for item in value:
+            if not item:
+                raise PokemonDataDoesNotExistError('Given value is empty')
+            if not isinstance(item, str):
+                raise BadConversionError('Given value is not string.')
+        return value
+    return convert
+
+
+def _make_not_negative_float_converter(field_name: str) -> Callable:
+    def convert(value):
+        try:
+            value = float(value)
+        except ValueError:
+            raise NotANumberError('Given value cannot be converted to float.')
+        if value < 0:
+            raise ValueError('Given value must be not negative.')
+        return value
+    return convert
+
+
+def _make_optional_not_negative_float_converter(field_name: str) -> Callable:
+    def convert(value):
+        if not value:
+            return None
+        try:
+            value = float(value)
+        except ValueError:
+            raise NotANumberError('Given value cannot be converted to float.')
+        if value < 0:
+            raise ValueError('Given value must be not negative.')
+        return value
+    return convert
+
+
+def _make_optional_positive_float_converter(field_name: str) -> Callable:
+    def convert(value):
+        if not value:
+            return None
+        try:
+            value = float(value)
+        except ValueError:
+            raise NotANumberError('Given value cannot be converted to float.')
+        if value <= 0:
+            raise ValueError('Given value must be positive.')
+        return value
+    return convert
+
+
+def _make_required_positive_float_converter(field_name: str) -> Callable:
+    empty_message = 'Given value in {} key is not a number'.format(field_name)
+
+    def convert(value):
+        if not value:
+            raise NotANumberError(empty_message)
+        try:
+            value = float(value)
+        except ValueError:
+            raise NotANumberError('Given value cannot be converted to float.')
+        if value <= 0:
+            raise ValueError('Given value must be positive.')
+        return value
+    return convert
+
+
+FIELD_CONVERTERS = {
+    'positive_int': _make_positive_int_converter,
+    'string': _make_string_converter,
+    'optional_string': _make_optional_string_converter,
+    'string_list': _make_string_list_converter,
+    'not_negative_float': _make_not_negative_float_converter,
+    'optional_not_negative_float': (
+        _make_optional_not_negative_float_converter
+        ),
+    'optional_positive_float': _make_optional_positive_float_converter,
+    'required_positive_float': _make_required_positive_float_converter,
+}
+
+
+# Converters of typed values from pokemon.json v2 format, where numbers
+# are stored as json numbers, empty values as null and abilities as
+# arrays. They only check values, without any string conversion.
+
+def _is_number(value) -> bool:
+    return type(value) in (int, float)
+
+
+def _make_typed_positive_int_converter(field_name: str) -> Callable:
+    def convert(value):
+        if type(value) is not int:
+            if _is_number(value):
+                raise BadConversionError(
+                    "Float cannot be mapped (rounded) to int in this instance."
+                    )
+            raise NotANumberError('Given value is not a number.')
+        if value <= 0:
+            raise ValueError('Given value must be positive.')
+        return value
+    return convert
+
+
+def _make_typed_string_list_converter(field_name: str) -> Callable:
+    def convert(value):
+        if not value:
+            raise PokemonDataDoesNotExistError('Given list in empty')
+        if not isinstance(value, list):
+            raise BadConversionError('Given value is not a list')
+        for item in value:
+            if not item:
+                raise PokemonDataDoesNotExistError('Given value is empty')
+            if not isinstance(item, str):
+                raise BadConversionError('Given value is not string.')
+        return value
+    return convert
+
+
+def _make_typed_not_negative_float_converter(field_name: str) -> Callable:
+    def convert(value):
+        if not _is_number(value):
+            raise NotANumberError('Given value is not a number.')
+        if value < 0:
+            raise ValueError('Given value must be not negative.')
+        return float(value)
+    return convert
+
+
+def _make_typed_optional_not_negative_float_converter(
+            field_name: str
+        ) -> Callable:
+    def convert(value):
+        if value is None:
+            return None
+        if not _is_number(value):
+            raise NotANumberError('Given value is not a number.')
+        if value < 0:
+            raise ValueError('Given value must be not negative.')
+        return float(value)
+    return convert
+
+
+def _make_typed_optional_positive_float_converter(field_name: str) -> Callable:
+    def convert(value):
+        if value is None:
+            return None
+        if not _is_number(value):
+            raise NotANumberError('Given value is not a number.')
+        if value <= 0:
+            raise ValueError('Given value must be positive.')
+        return float(value)
+    return convert
+
+
+def _make_typed_required_positive_float_converter(
+            field_name: str
+        ) -> Callable:
+    empty_message = 'Given value in {} key is not a number'.format(field_name)
+
+    def convert(value):
+        if value is None:
+            raise NotANumberError(empty_message)
+        if not _is_number(value):
+            raise NotANumberError('Given value is not a number.')
+        if value <= 0:
+            raise ValueError('Given value must be positive.')
+        return value
+    return convert
+
+
+TYPED_FIELD_CONVERTERS = {
+    'positive_int': _make_typed_positive_int_converter,
+    'string': _make_string_converter,
+    'optional_string': _make_optional_string_converter,
+    'string_list': _make_typed_string_list_converter,
+    'not_negative_float': _make_typed_not_negative_float_converter,
+    'optional_not_negative_float': (
+        _make_typed_optional_not_negative_float_converter
+        ),
+    'optional_positive_float': _make_typed_optional_positive_float_converter,
+    'required_positive_float': _make_typed_required_positive_float_converter,
+}
+
+
+def compile_section_validator(section: SchemaSection,
+                              converters: dict = FIELD_CONVERTERS
+                              ) -> Callable[[dict], dict]:
+    """ Compiles section declaration into function, which checks given
+    dict's size and keys, converts it's values in place and returns it.\n
+    Keys are checked with set lookups and every value is converted
+    with one converter call.
+
+    Args:
+        section (SchemaSection): Section declaration.
+        converters (dict, optional): Converter factories for every value
+        kind. Defaults to FIELD_CONVERTERS.
+
+    Raises:
+        RedundantKeyError: Given value kind does not exist in converters.
+
+    Returns:
+        Callable: Function validating dict of given section.
+    """
+    field_converters = {}
+    for field_name, kind in section.fields.items():
+        if kind not in converters:
+            raise RedundantKeyError(
+                'Given value kind: {} does not exist'.format(kind)
+                )
+        field_converters[field_name] = converters[kind](field_name)
+    field_items = tuple(field_converters.items())
+    field_names = tuple(field_converters)
+    keys = frozenset(field_converters)
+    size = len(field_converters)
+    size_message = 'Given dict size is not equal {}'.format(size)
+    key_message = 'Given key: {} is invalid in given dict'
+    reads_keys_method = section.reads_keys_method
+
+    # Values which are not dicts (ex. string or list from malformed file)
+    # go through the same steps as in io_* functions: size check, key
+    # check by tuple membership (items can be unhashable) and indexing,
+    # which throws the same TypeError as there.
+    if section.convert_while_checking_keys:
+        def validate(value: dict) -> dict:
+            if len(value) != size:
+                raise InvalidDataLineLeghthError(size_message)
+            if not isinstance(value, dict):
+                for key in value:
+                    if key not in field_names:
+                        raise RedundantKeyError(key_message.format(key))
+                    value[key] = field_converters[key](value[key])
+                return value
+            for key in value:
+                convert = field_converters.get(key)
+                if convert is None:
+                    raise RedundantKeyError(key_message.format(key))
+                value[key] = convert(value[key])
+            return value
+    else:
+        def validate(value: dict) -> dict:
+            if len(value) != size:
+                raise InvalidDataLineLeghthError(size_message)
+            if not isinstance(value, dict) or value.keys() != keys:
+                for key in value.keys() if reads_keys_method else value:
+                    if key not in field_names:
+                        raise RedundantKeyError(key_message.format(key))
+            for key, convert in field_items:
+                value[key] = convert(value[key])
+            return value
+    return validate
+
+
+def compile_pokemon_validator(schema: dict = POKEMON_SCHEMA,
+                              converters: dict = FIELD_CONVERTERS
+                              ) -> Callable[[dict], tuple]:
+    """ Compiles pokemon record declaration into function, which checks
+    and converts every field of given record and returns values in
+    order of BasePokemon's arguments.\n
+    Compiled function throws the same exceptions as io_* function chain
+    in model_io (ex. BadConversionError, RedundantKeyError), also for
+    section which is not a dict (ex. InvalidDataLineLeghthError for string
+    of wrong length, TypeError or AttributeError for list). Fields are
+    converted in schema order, so the first malformed field decides the
+    error. Missing top-level field, where io_* chain throws KeyError,
+    throws PokemonDataDoesNotExistError when it's reached, and record
+    which is not a dict throws BadConversionError.
+
+    Args:
+        schema (dict, optional): Record declaration, with value kinds or
+        SchemaSection objects. Defaults to POKEMON_SCHEMA.
+        converters (dict, optional): Converter factories for every value
+        kind. Defaults to FIELD_CONVERTERS.
+
+    Returns:
+        Callable: Function validating single pokemon record.
+    """
+    field_items = []
+    for field_name, declaration in schema.items():
+        if isinstance(declaration, SchemaSection):
+            validate = compile_section_validator(declaration, converters)
+        else:
+            if declaration not in converters:
+                raise RedundantKeyError(
+                    'Given value kind: {} does not exist'.format(declaration)
+                    )
+            validate = converters[declaration](field_name)
+        field_items.append((field_name, validate))
+    field_items = tuple(field_items)
+
+    def validate_record(item: dict) -> tuple:
+        if not isinstance(item, dict):
+            raise BadConversionError('Given row is not a dict')
+        values = []
+        for key, validate in field_items:
+            try:
+                value = item[key]
+            except KeyError:
+                raise PokemonDataDoesNotExistError(
+                    'Given row has no key: {!r}'.format(key)
+                    )
+            values.append(validate(value))
+        return tuple(values)
+    return validate_record
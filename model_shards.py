@@ -0,0 +1,147 @@
+import json
+import os
+from typing import Iterable
+from classes import (
+    BasePokemon,
+    MalformedPokemonDataError,
+    SharedPokemonValues
+)
+from model_io import read_from_json, write_to_json_v2
+
+
+# Sharded pokemon database: one pokemon.json v2 file per generation and
+# small manifest with index of pokedex numbers, names and types of every
+# shard, so shards are read only when lookup or search needs them.
+MANIFEST_FILE_SUFFIX = '.manifest.json'
+MANIFEST_FORMAT_VERSION = 1
+
+
+def get_shard_file_name(manifest_path: str, generation: int) -> str:
+    """ Returns file name of shard with given generation, saved next to
+    given manifest.
+
+    Args:
+        manifest_path (str): Path to manifest file.
+        generation (int): Generation of pokemons in shard.
+
+    Returns:
+        str: File name of shard (without directory).
+    """
+    base_name = os.path.basename(manifest_path)
+    if base_name.lower().endswith(MANIFEST_FILE_SUFFIX):
+        base_name = base_name[:-len(MANIFEST_FILE_SUFFIX)]
+    return '{}.gen{}.json'.format(base_name, generation)
+
+
+def write_sharded_database(pokemons: Iterable[BasePokemon],
+                           manifest_path: str) -> int:
+    """ Writes given pokemons as one v2 json file per generation and
+    manifest describing them. Shards are ordered by generation, pokemons
+    in shard keep their given order.
+
+    Args:
+        pokemons (Iterable[BasePokemon]): Pokemons to save, can be
+        generator.
+        manifest_path (str): Path of new manifest file.
+
+    Returns:
+        int: Number of written pokemons.
+    """
+    generations = {}
+    for pokemon in pokemons:
+        generation = pokemon.get_other_value('generation')
+        generations.setdefault(generation, []).append(pokemon)
+    directory = os.path.dirname(manifest_path)
+    shards = []
+    for generation in sorted(generations):
+        shard_pokemons = generations[generation]
+        file_name = get_shard_file_name(manifest_path, generation)
+        with open(os.path.join(directory, file_name), 'w',
+                  encoding='utf-8') as file_hantle:
+            write_to_json_v2(shard_pokemons, file_hantle)
+        shards.append({
+            'generation': generation,
+            'file': file_name,
+            'pokedex_numbers': [
+                pokemon.get_pokedex_number() for pokemon in shard_pokemons
+            ],
+            'names': [pokemon.get_name() for pokemon in shard_pokemons],
+            'types': sorted({
+                pokemon_type
+                for pokemon in shard_pokemons
+                for pokemon_type in pokemon.get_types()
+                if pokemon_type is not None
+            })
+        })
+    with open(manifest_path, 'w', encoding='utf-8') as file_hantle:
+        json.dump({
+            'format_version': MANIFEST_FORMAT_VERSION,
+            'shards': shards
+        }, file_hantle, ensure_ascii=False)
+    return sum(len(shard['names']) for shard in shards)
+
+
+def read_manifest(manifest_path: str) -> list[dict]:
+    """ Reads manifest of sharded database and returns it's shards.
+
+    Args:
+        manifest_path (str): Path to manifest file.
+
+    Raises:
+        FileNotFoundError: Given file does not exist.
+        PermissionError: Given file cannot be accessed.
+        IsADirectoryError: Given path is a directory.
+        MalformedPokemonDataError: Given file is not a valid manifest.
+
+    Returns:
+        list: Shards with generation, file, pokedex_numbers, names and types.
+    """
+    with open(manifest_path, 'r', encoding='utf-8') as file_hantle:
+        try:
+            manifest = json.load(file_hantle)
+        except json.JSONDecodeError:
+            raise MalformedPokemonDataError('Given manifest is not valid json')
+    if not isinstance(manifest, dict) or (
+                manifest.get('format_version') != MANIFEST_FORMAT_VERSION
+            ):
+        raise MalformedPokemonDataError('Unsupported manifest format')
+    shards = manifest.get('shards')
+    keys = ('generation', 'file', 'pokedex_numbers', 'names', 'types')
+    if not isinstance(shards, list) or not all(
+                isinstance(shard, dict) and all(key in shard for key in keys)
+                and len(shard['pokedex_numbers']) == len(shard['names'])
+                for shard in shards
+            ):
+        raise MalformedPokemonDataError('Malformed manifest shards')
+    return shards
+
+
+def read_shard(manifest_path: str, shard: dict,
+               shared_values: (SharedPokemonValues | None) = None
+               ) -> list[BasePokemon]:
+    """ Reads and validates every pokemon of given shard. Throws exception
+    if shard does not match it's manifest entry.
+
+    Args:
+        manifest_path (str): Path to manifest file.
+        shard (dict): Shard from manifest.
+        shared_values (SharedPokemonValues | None, optional): Cache of
+        values shared between pokemons. Defaults to None (new cache).
+
+    Raises:
+        FileNotFoundError: Shard file does not exist.
+        MalformedPokemonDataError: returns type of data corruption
+        from shard file and row where it was found.
+
+    Returns:
+        list: List of BasePokemon objects from shard.
+    """
+    path = os.path.join(os.path.dirname(manifest_path), shard['file'])
+    with open(path, 'r', encoding='utf-8') as file_hantle:
+        pokemons = read_from_json(file_hantle, shared_values=shared_values)
+    numbers = [pokemon.get_pokedex_number() for pokemon in pokemons]
+    if numbers != shard['pokedex_numbers']:
+        raise MalformedPokemonDataError(
+            'Shard {} does not match manifest'.format(shard['file'])
+            )
+    return pokemons
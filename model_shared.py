@@ -0,0 +1,148 @@
+import io
+import sys
+import threading
+import weakref
+from multiprocessing import resource_tracker, shared_memory
+from typing import Iterable
+from classes import BasePokemon
+from model_records import write_records
+
+
+# Validated pokemon database published in shared memory, so worker
+# processes (ex. battle simulations in process pool) attach to it instead
+# of reading and checking pokemon.json again. Segment has record file
+# layout (see model_records): fixed-width numeric records and table of
+# strings, read in place by every process. Database opened from path
+# returned by SharedPokemonDatabase.get_path (SHARED_MEMORY_PATH_PREFIX
+# and name of segment) reads pokemons from segment, see
+# database_sources.SharedMemoryPokemonSource.
+SHARED_MEMORY_PATH_PREFIX = 'shm://'
+
+_attach_lock = threading.Lock()
+
+
+def get_shared_memory_path(name: str) -> str:
+    """ Returns database path of shared memory segment with given name.
+    """
+    return SHARED_MEMORY_PATH_PREFIX + name
+
+
+def is_shared_memory_path(file_path: str) -> bool:
+    """ Checks if given database path points to shared memory segment.
+    """
+    return file_path.startswith(SHARED_MEMORY_PATH_PREFIX)
+
+
+def get_shared_memory_name(file_path: str) -> str:
+    """ Returns name of shared memory segment from given database path.
+    """
+    return file_path[len(SHARED_MEMORY_PATH_PREFIX):]
+
+
+def attach_shared_memory(name: str) -> shared_memory.SharedMemory:
+    """ Attaches to existing shared memory segment without taking it's
+    ownership, so segment is not unlinked when attached process exits.
+
+    Args:
+        name (str): Name of segment.
+
+    Raises:
+        FileNotFoundError: Segment with given name does not exist.
+
+    Returns:
+        SharedMemory: Attached segment.
+    """
+    if sys.version_info >= (3, 13):
+        return shared_memory.SharedMemory(name=name, track=False)
+    # Before Python 3.13 every attached process registers segment in
+    # resource tracker, which unlinks it when process exits. Tracker is
+    # shared with parent process, so segment cannot be unregistered after
+    # attaching either (it would forget owner's registration).
+    register = resource_tracker.register
+
+    def register_untracked(resource_name: str, resource_type: str) -> None:
+        if resource_type != 'shared_memory':
+            register(resource_name, resource_type)
+
+    with _attach_lock:
+        resource_tracker.register = register_untracked
+        try:
+            return shared_memory.SharedMemory(name=name)
+        finally:
+            resource_tracker.register = register
+
+
+def _release_segment(segment: shared_memory.SharedMemory) -> None:
+    """ Closes and unlinks segment, called by close or at exit.
+    """
+    segment.close()
+    try:
+        segment.unlink()
+    except FileNotFoundError:
+        pass
+
+
+class SharedPokemonDatabase:
+    """ Owner of shared memory segment with published pokemons. Segment
+    is unlinked by close, when owner is garbage collected or when owning
+    process exits, processes already attached to it can still read it
+    until they close it.
+    """
+    def __init__(self, pokemons: Iterable[BasePokemon]) -> None:
+        """ Creates shared memory segment with given pokemons.
+
+        Args:
+            pokemons (Iterable[BasePokemon]): Validated pokemons sorted by
+            pokedex number.
+
+        Raises:
+            MalformedPokemonDataError: Pokemons are not sorted by pokedex
+            number or given ability contains separator character.
+        """
+        with io.BytesIO() as file_hantle:
+            self._pokemon_count = write_records(pokemons, file_hantle)
+            data = file_hantle.getbuffer()
+            segment = shared_memory.SharedMemory(create=True, size=len(data))
+            segment.buf[:len(data)] = data
+            del data
+        self._segment = segment
+        self._size = segment.size
+        self._finalizer = weakref.finalize(self, _release_segment, segment)
+
+    def __len__(self) -> int:
+        """ Returns number of published pokemons.
+        """
+        return self._pokemon_count
+
+    def get_name(self) -> str:
+        """ Returns name of shared memory segment.
+        """
+        return self._segment.name
+
+    def get_path(self) -> str:
+        """ Returns path opening published database in PokemonDatabase,
+        which can be sent to worker processes.
+        """
+        return get_shared_memory_path(self.get_name())
+
+    def get_size(self) -> int:
+        """ Returns size of shared memory segment in bytes.
+        """
+        return self._size
+
+    def is_closed(self) -> bool:
+        """ Checks if segment was already unlinked.
+        """
+        return not self._finalizer.alive
+
+    def close(self) -> None:
+        """ Closes and unlinks segment, new processes cannot attach to it.
+        Does nothing if segment is already unlinked.
+        """
+        self._finalizer()
+
+    def __enter__(self) -> 'SharedPokemonDatabase':
+        return self
+
+    def __exit__(self, *args) -> None:
+        self.close()
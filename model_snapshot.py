@@ -0,0 +1,124 @@
+import hashlib
+import os
+import pickle
+import struct
+from classes import BasePokemon
+
+
+SNAPSHOT_FORMAT_VERSION = 2
+SNAPSHOT_MAGIC = b'PKSNAP'
+SNAPSHOT_SUFFIX = '.snapshot'
+
+_HEADER_STRUCT = struct.Struct('>6sHI')
+
+
+def get_snapshot_path(file_path: str) -> str:
+    """ Returns path of binary snapshot saved next to given source file.
+
+    Args:
+        file_path (str): Path to source pokemon database file.
+
+    Returns:
+        str: Path to snapshot file.
+    """
+    return file_path + SNAPSHOT_SUFFIX
+
+
+def get_source_file_key(file_path: str) -> tuple[int, int, str]:
+    """ Returns key identifying current content of given source file:
+    it's size, modification time and sha256 hash of it's content.
+
+    Args:
+        file_path (str): Path to source pokemon database file.
+
+    Raises:
+        FileNotFoundError: Given file does not exist.
+        PermissionError: Given file cannot be accessed.
+        IsADirectoryError: Given path is a directory.
+
+    Returns:
+        tuple(int, int, str): File size, mtime in nanoseconds and hash.
+    """
+    file_stat = os.stat(file_path)
+    content_hash = hashlib.sha256()
+    with open(file_path, 'rb') as file_hantle:
+        for chunk in iter(lambda: file_hantle.read(1 << 16), b''):
+            content_hash.update(chunk)
+    return (file_stat.st_size, file_stat.st_mtime_ns, content_hash.hexdigest())
+
+
+def remove_snapshot(snapshot_path: str) -> None:
+    """ Removes given snapshot file if it exists. Does nothing otherwise.
+
+    Args:
+        snapshot_path (str): Path to snapshot file.
+    """
+    try:
+        os.remove(snapshot_path)
+    except OSError:
+        pass
+
+
+def read_snapshot(snapshot_path: str,
+                  source_key: tuple[int, int, str]
+                  ) -> (list[BasePokemon] | None):
+    """ Reads validated pokemon list from binary snapshot.\n
+    Returns None if snapshot does not exist. Snapshot is removed and None
+    is returned if it's format version or source key does not match,
+    or if it's content is corrupted.
+
+    Args:
+        snapshot_path (str): Path to snapshot file.
+        source_key (tuple(int, int, str)): Current key of source file
+        returned by get_source_file_key.
+
+    Returns:
+        list | None: List of BasePokemon objects or None.
+    """
+    try:
+        file_hantle = open(snapshot_path, 'rb')
+    except OSError:
+        return None
+    with file_hantle:
+        try:
+            header = file_hantle.read(_HEADER_STRUCT.size)
+            magic, version, key_size = _HEADER_STRUCT.unpack(header)
+            if magic != SNAPSHOT_MAGIC or version != SNAPSHOT_FORMAT_VERSION:
+                raise ValueError
+            if pickle.loads(file_hantle.read(key_size)) != source_key:
+                raise ValueError
+            pokemon_list = pickle.load(file_hantle)
+            if not isinstance(pokemon_list, list):
+                raise ValueError
+        except Exception:
+            pokemon_list = None
+    if pokemon_list is None:
+        remove_snapshot(snapshot_path)
+    return pokemon_list
+
+
+def write_snapshot(snapshot_path: str,
+                   source_key: tuple[int, int, str],
+                   pokemon_list: list[BasePokemon]) -> None:
+    """ Writes validated pokemon list to binary snapshot.\n
+    File is replaced atomically, so readers never see partial snapshot.
+    Does nothing if snapshot cannot be written (ex. read-only directory).
+
+    Args:
+        snapshot_path (str): Path to snapshot file.
+        source_key (tuple(int, int, str)): Key of source file returned by
+        get_source_file_key.
+        pokemon_list (list): List of validated BasePokemon objects.
+    """
+    key_data = pickle.dumps(source_key, pickle.HIGHEST_PROTOCOL)
+    temp_path = '{}.{}.tmp'.format(snapshot_path, os.getpid())
+    try:
+        with open(temp_path, 'wb') as file_hantle:
+            file_hantle.write(_HEADER_STRUCT.pack(
+                SNAPSHOT_MAGIC, SNAPSHOT_FORMAT_VERSION, len(key_data)
+                ))
+            file_hantle.write(key_data)
+            pickle.dump(pokemon_list, file_hantle, pickle.HIGHEST_PROTOCOL)
+        os.replace(temp_path, snapshot_path)
+    except OSError:
+        remove_snapshot(temp_path)
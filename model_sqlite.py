@@ -0,0 +1,255 @@
+import json
+import sqlite3
+from pathlib import Path
+from typing import Iterable, Iterator
+from classes import (
+    BasePokemon,
+    MalformedPokemonDataError,
+    SharedPokemonValues
+)
+from database_index import fold_name
+from model_io import (
+    io_return_valid_pokemon,
+    io_share_pokemon_values,
+    pokemon_to_record,
+    JSON_FORMAT_V2
+)
+
+
+# SQLite pokemon database: one row per pokemon in database order, with
+# columns used by lookups and whole typed (v2) record saved as json text.
+SQLITE_FILE_SUFFIX = '.sqlite'
+SQLITE_FORMAT_VERSION = 1
+
+_SCHEMA = (
+    'CREATE TABLE pokedex_meta (format_version INTEGER NOT NULL)',
+    'CREATE TABLE pokemon ('
+    'position INTEGER PRIMARY KEY, '
+    'pokedex_number INTEGER NOT NULL, '
+    'name TEXT NOT NULL, '
+    'name_folded TEXT NOT NULL, '
+    'type1 TEXT NOT NULL, '
+    'type2 TEXT, '
+    'record TEXT NOT NULL)',
+    'CREATE INDEX pokemon_pokedex_number ON pokemon (pokedex_number)',
+    'CREATE INDEX pokemon_name_folded ON pokemon (name_folded)',
+    'CREATE INDEX pokemon_type1 ON pokemon (type1)',
+    'CREATE INDEX pokemon_type2 ON pokemon (type2)',
+)
+
+_INSERT_POKEMON = (
+    'INSERT INTO pokemon (position, pokedex_number, name, name_folded, '
+    'type1, type2, record) VALUES (?, ?, ?, ?, ?, ?, ?)'
+)
+
+
+def _pokemon_to_row(position: int, pokemon: BasePokemon) -> tuple:
+    type1, type2 = pokemon.get_types()
+    return (
+        position,
+        pokemon.get_pokedex_number(),
+        pokemon.get_name(),
+        fold_name(pokemon.get_name()),
+        type1,
+        type2,
+        json.dumps(pokemon_to_record(pokemon), ensure_ascii=False)
+    )
+
+
+def write_sqlite_file(pokemons: Iterable[BasePokemon], file_path: str) -> int:
+    """ Imports given pokemons into new SQLite database in one transaction.
+    Existing tables in given file are replaced, so file is never left
+    half imported.
+
+    Args:
+        pokemons (Iterable[BasePokemon]): Pokemons in database order,
+        can be generator.
+        file_path (str): Path of SQLite database file.
+
+    Raises:
+        MalformedPokemonDataError: returns type of data corruption and
+        row where it was found, if pokemons are read from file.
+
+    Returns:
+        int: Number of imported pokemons.
+    """
+    connection = sqlite3.connect(file_path, isolation_level=None)
+    try:
+        connection.execute('BEGIN')
+        try:
+            connection.execute('DROP TABLE IF EXISTS pokedex_meta')
+            connection.execute('DROP TABLE IF EXISTS pokemon')
+            for statement in _SCHEMA:
+                connection.execute(statement)
+            connection.execute('INSERT INTO pokedex_meta VALUES (?)',
+                               (SQLITE_FORMAT_VERSION,))
+            cursor = connection.executemany(_INSERT_POKEMON, (
+                _pokemon_to_row(position, pokemon)
+                for position, pokemon in enumerate(pokemons, 1)
+                ))
+            count = cursor.rowcount
+            connection.execute('COMMIT')
+        except BaseException:
+            connection.execute('ROLLBACK')
+            raise
+    finally:
+        connection.close()
+    return count
+
+
+class PokemonSqliteFile:
+    """ Read-only SQLite pokemon database. Lookups by pokedex number,
+    name and type use indexes, so only matching rows are read and
+    converted to BasePokemon objects.
+    """
+    def __init__(self, file_path: str) -> None:
+        """ Opens given SQLite database in read-only mode.
+
+        Args:
+            file_path (str): Path to SQLite database file.
+
+        Raises:
+            FileNotFoundError: Given file does not exist.
+            PermissionError: Given file cannot be accessed.
+            IsADirectoryError: Given path is a directory.
+            MalformedPokemonDataError: Given file is not a pokemon
+            SQLite database or has unsupported version.
+        """
+        # sqlite3 creates missing files and hides the reason of errors,
+        # so file is opened normally first.
+        open(file_path, 'rb').close()
+        self._shared_values = SharedPokemonValues()
+        self._connection = sqlite3.connect(
+            Path(file_path).resolve().as_uri() + '?mode=ro', uri=True
+            )
+        try:
+            row = self._connection.execute(
+                'SELECT format_version FROM pokedex_meta'
+                ).fetchone()
+        except sqlite3.DatabaseError:
+            self.close()
+            raise MalformedPokemonDataError(
+                'Given file is not a pokemon SQLite database'
+                )
+        if row is None or row[0] != SQLITE_FORMAT_VERSION:
+            self.close()
+            raise MalformedPokemonDataError(
+                'Unsupported SQLite database version: {}'.format(
+                    None if row is None else row[0])
+                )
+
+    def __len__(self) -> int:
+        """ Returns number of pokemons in database.
+        """
+        return self._connection.execute(
+            'SELECT COUNT(*) FROM pokemon'
+            ).fetchone()[0]
+
+    def _rows_to_pokemons(self, rows: Iterable[tuple]) -> list[BasePokemon]:
+        """ Creates BasePokemon objects from (position, record) rows.
+
+        Raises:
+            MalformedPokemonDataError: returns type of data corruption
+            and position of row where it was found.
+        """
+        return io_share_pokemon_values([
+            io_return_valid_pokemon(json.loads(record), position,
+                                    JSON_FORMAT_V2)
+            for position, record in rows
+        ], self._shared_values)
+
+    def _query(self, where: str, parameters: tuple = (),
+               limit: int = -1) -> list[tuple]:
+        return self._connection.execute(
+            'SELECT position, record FROM pokemon WHERE {} '
+            'ORDER BY position LIMIT ?'.format(where),
+            parameters + (limit,)
+            ).fetchall()
+
+    def get_pokemon(self, pokedex_number: int) -> (BasePokemon | None):
+        """ Reads first pokemon with given pokedex number.
+
+        Args:
+            pokedex_number (int): Pokemon's pokedex number.
+
+        Returns:
+            BasePokemon | None: Pokemon or None if it's not in database.
+        """
+        rows = self._query('pokedex_number = ?', (pokedex_number,), 1)
+        return self._rows_to_pokemons(rows)[0] if rows else None
+
+    def get_pokemon_using_name(self, name: str) -> (BasePokemon | None):
+        """ Reads first pokemon with given case-folded name (the same rule
+        as PokemonDatabase.get_pokemon_using_name).
+
+        Args:
+            name (str): Pokemon's name.
+
+        Returns:
+            BasePokemon | None: Pokemon or None if it's not in database.
+        """
+        rows = self._query('name_folded = ?', (fold_name(name),), 1)
+        return self._rows_to_pokemons(rows)[0] if rows else None
+
+    def search_name(self, substring: str) -> list[BasePokemon]:
+        """ Reads every pokemon whose name contains given substring, ignoring
+        case. Substring is compared as plain text.
+
+        Args:
+            substring (str): Substring given for search.
+
+        Returns:
+            list: List with BasePokemon objects with matching name.
+        """
+        rows = self._query('instr(name_folded, ?)', (fold_name(substring),))
+        return self._rows_to_pokemons(rows)
+
+    def search_pokedex_number(self, number: int) -> list[BasePokemon]:
+        """ Reads pokemon with given pokedex number first, then every
+        pokemon with longer pokedex number containing given one.
+
+        Args:
+            number (int): Exact or part of pokemon's pokedex_number.
+
+        Returns:
+            list: List with BasePokemon objects with matching pokedex_number.
+        """
+        number_as_str = str(number)
+        rows = self._query('pokedex_number = ?', (number,))
+        rows += self._query(
+            'length(pokedex_number) > ? AND instr(pokedex_number, ?)',
+            (len(number_as_str), number_as_str)
+            )
+        return self._rows_to_pokemons(rows)
+
+    def search_type(self, pokemon_type: str) -> list[BasePokemon]:
+        """ Reads every pokemon with given primary or secondary type.
+
+        Args:
+            pokemon_type (str): Pokemon type, ex. 'fire'.
+
+        Returns:
+            list: List with BasePokemon objects with given type.
+        """
+        return self._rows_to_pokemons(self._query(
+            'position IN (SELECT position FROM pokemon WHERE type1 = ? '
+            'UNION SELECT position FROM pokemon WHERE type2 = ?)',
+            (pokemon_type, pokemon_type)
+            ))
+
+    def __iter__(self) -> Iterator[BasePokemon]:
+        """ Yields every pokemon from database in database order.
+
+        Yields:
+            BasePokemon: Every pokemon in database.
+        """
+        cursor = self._connection.execute(
+            'SELECT position, record FROM pokemon ORDER BY position'
+            )
+        for row in cursor:
+            yield self._rows_to_pokemons((row,))[0]
+
+    def close(self) -> None:
+        """ Closes database connection.
+        """
+        self._connection.close()
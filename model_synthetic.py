@@ -0,0 +1,261 @@
+import argparse
+import json
+import random
+from typing import Callable, Iterable, Iterator
+from model_io import (
+    open_json_file,
+    io_return_valid_pokemon,
+    pokemon_to_record,
+    write_rows_to_json,
+    JSON_FORMAT_V1,
+    JSON_FORMAT_V2
+)
+
+
+# Synthetic pokemon databases of any size, for scaling benchmarks. Every
+# value is sampled from reference database (pokemon.json), so types,
+# stats and special strengths follow real distributions:
+# - types, special strength, abilities and classfication are taken
+#   together from one reference pokemon, so weaknesses match types,
+# - every base stat is taken from reference pokemon with the same first
+#   type and changed by up to STAT_JITTER,
+# - experience growth, gender ratio, height, weight and generation are
+#   taken from other reference pokemons,
+# - names are made from beginning of one reference name and end of other.
+STAT_JITTER = 0.1
+
+_STAT_KEYS = ('hp', 'defense', 'attack', 'speed')
+
+
+def _set_empty_name(item: dict) -> None:
+    item['name'] = ''
+
+
+def _set_stat_not_a_number(item: dict) -> None:
+    item['stats']['hp'] = 'many'
+
+
+def _set_negative_stat(item: dict) -> None:
+    attack = item['stats']['attack']
+    item['stats']['attack'] = (
+        '-' + attack if isinstance(attack, str) else -attack
+        )
+
+
+def _add_redundant_key(item: dict) -> None:
+    item['special_strength']['against_sound'] = (
+        item['special_strength'].pop('against_bug')
+        )
+
+
+def _remove_key(item: dict) -> None:
+    del item['other']['generation']
+
+
+# Ways of corrupting synthetic rows, each one makes read_from_json throw
+# MalformedPokemonDataError in both json formats.
+MALFORMATIONS: dict[str, Callable[[dict], None]] = {
+    'empty_name': _set_empty_name,
+    'not_a_number': _set_stat_not_a_number,
+    'negative_stat': _set_negative_stat,
+    'redundant_key': _add_redundant_key,
+    'missing_key': _remove_key,
+}
+
+
+def read_reference_rows(file_path: str = 'pokemon.json'
+                        ) -> tuple[list[dict], list[dict]]:
+    """ Reads reference database in v1 format and returns it's rows with
+    matching v2 rows (see model_io.pokemon_to_record).
+
+    Args:
+        file_path (str, optional): Path to pokemon.json (v1) file.
+        Defaults to 'pokemon.json'.
+
+    Raises:
+        FileNotFoundError: Given file does not exist.
+        MalformedPokemonDataError: Given file has corrupted row.
+
+    Returns:
+        tuple(list, list): v1 rows and v2 rows of reference pokemons.
+    """
+    with open_json_file(file_path) as file_hantle:
+        rows = json.load(file_hantle)
+    records = [
+        pokemon_to_record(io_return_valid_pokemon(item, idx + 1))
+        for idx, item in enumerate(rows)
+    ]
+    return rows, records
+
+
+def _get_synthetic_name(rng: random.Random, names: list[str],
+                        used_names: set[str]) -> str:
+    head = rng.choice(names)
+    tail = rng.choice(names)
+    head = head[:rng.randint(2, max(2, len(head) - 1))]
+    tail = tail[rng.randint(1, max(1, len(tail) - 2)):].lower()
+    name = head + tail
+    suffix = 2
+    while name.casefold() in used_names:
+        name = '{}{}'.format(head + tail, suffix)
+        suffix += 1
+    used_names.add(name.casefold())
+    return name
+
+
+def iter_synthetic_names(names: list[str], count: int,
+                         seed: (int | None) = None) -> Iterator[str]:
+    """ Yields distinct (ignoring case) synthetic pokemon names, made of
+    beginning of one given name and end of other, the same as names of
+    synthetic rows (see iter_synthetic_rows). Same seed always gives same
+    names.
+
+    Args:
+        names (list[str]): Reference pokemon names.
+        count (int): Number of names.
+        seed (int | None, optional): Seed of random generator.
+        Defaults to None (random names).
+
+    Yields:
+        str: Synthetic name.
+    """
+    rng = random.Random(seed)
+    used_names = set()
+    for _ in range(count):
+        yield _get_synthetic_name(rng, names, used_names)
+
+
+def iter_synthetic_rows(reference: tuple[list[dict], list[dict]],
+                        count: int,
+                        seed: (int | None) = None,
+                        malformed_rows: Iterable[int] = (),
+                        format_version: int = JSON_FORMAT_V1
+                        ) -> Iterator[dict]:
+    """ Yields rows of synthetic pokemon database with pokedex numbers from
+    1 to count. Same seed always gives same rows.
+
+    Args:
+        reference (tuple[list[dict], list[dict]]): Reference rows (see
+        read_reference_rows).
+        count (int): Number of rows.
+        seed (int | None, optional): Seed of random generator.
+        Defaults to None (random rows).
+        malformed_rows (Iterable[int], optional): Numbers of rows (from 1)
+        corrupted by one of MALFORMATIONS. Defaults to ().
+        format_version (int, optional): JSON_FORMAT_V1 or JSON_FORMAT_V2.
+        Defaults to JSON_FORMAT_V1.
+
+    Yields:
+        dict: Raw pokemon row.
+    """
+    rng = random.Random(seed)
+    rows = reference[0] if format_version == JSON_FORMAT_V1 else reference[1]
+    names = [item['name'] for item in rows]
+    rows_by_type = {}
+    for item in rows:
+        rows_by_type.setdefault(item['stats']['type1'], []).append(item)
+    malformed_rows = set(malformed_rows)
+    malformations = list(MALFORMATIONS.values())
+    used_names = set()
+    for number in range(1, count + 1):
+        base = rng.choice(rows)
+        same_type = rows_by_type[base['stats']['type1']]
+        stats = dict(base['stats'])
+        for key in _STAT_KEYS:
+            value = int(rng.choice(same_type)['stats'][key])
+            value = max(1, round(
+                value * rng.uniform(1 - STAT_JITTER, 1 + STAT_JITTER)
+                ))
+            stats[key] = value if format_version != JSON_FORMAT_V1 else (
+                str(value)
+                )
+        stats['experience_growth'] = (
+            rng.choice(rows)['stats']['experience_growth']
+            )
+        other = dict(rng.choice(rows)['other'])
+        other['generation'] = rng.choice(rows)['other']['generation']
+        item = {
+            'pokedex_number': number if format_version != JSON_FORMAT_V1
+            else str(number),
+            'name': _get_synthetic_name(rng, names, used_names),
+            'abilities': base['abilities'] if format_version == JSON_FORMAT_V1
+            else list(base['abilities']),
+            'stats': stats,
+            'special_strength': dict(base['special_strength']),
+            'other': other
+        }
+        if number in malformed_rows:
+            rng.choice(malformations)(item)
+        yield item
+
+
+def write_synthetic_database(file_path: str,
+                             count: int,
+                             seed: (int | None) = None,
+                             malformed_count: int = 0,
+                             format_version: int = JSON_FORMAT_V1,
+                             reference_path: str = 'pokemon.json'
+                             ) -> list[int]:
+    """ Writes synthetic pokemon database (see iter_synthetic_rows) to given
+    json file, one row at a time. File is compressed if it's extension is
+    in model_io.COMPRESSED_FILE_OPENERS.
+
+    Args:
+        file_path (str): Path of new json file.
+        count (int): Number of pokemons.
+        seed (int | None, optional): Seed of random generator.
+        Defaults to None (random database).
+        malformed_count (int, optional): Number of corrupted rows, chosen
+        at random. Defaults to 0.
+        format_version (int, optional): JSON_FORMAT_V1 or JSON_FORMAT_V2.
+        Defaults to JSON_FORMAT_V1.
+        reference_path (str, optional): Path to reference pokemon.json
+        (v1) file. Defaults to 'pokemon.json'.
+
+    Raises:
+        ValueError: More corrupted rows than rows.
+
+    Returns:
+        list: Sorted numbers of corrupted rows (from 1).
+    """
+    if not 0 <= malformed_count <= count:
+        raise ValueError('Malformed rows count must be between 0 and count')
+    malformed_rows = sorted(random.Random(seed).sample(
+        range(1, count + 1), malformed_count
+        ))
+    rows = iter_synthetic_rows(read_reference_rows(reference_path), count,
+                               seed, malformed_rows, format_version)
+    with open_json_file(file_path, 'w') as file_hantle:
+        write_rows_to_json(rows, file_hantle, format_version)
+    return malformed_rows
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description='Writes synthetic pokemon.json file of any size with '
+                    'values sampled from reference pokemon.json.'
+        )
+    parser.add_argument('target', help='path of new json file')
+    parser.add_argument('--count', type=int, default=100000,
+                        help='number of pokemons')
+    parser.add_argument('--seed', type=int, default=None)
+    parser.add_argument('--malformed', type=int, default=0,
+                        help='number of corrupted rows')
+    parser.add_argument('--format', type=int, default=JSON_FORMAT_V1,
+                        choices=(JSON_FORMAT_V1, JSON_FORMAT_V2))
+    parser.add_argument('--reference', default='pokemon.json',
+                        help='reference pokemon.json (v1) file')
+    args = parser.parse_args()
+    malformed_rows = write_synthetic_database(
+        args.target, args.count, args.seed, args.malformed, args.format,
+        args.reference
+        )
+    print('Written {} pokemons to {}'.format(args.count, args.target))
+    if malformed_rows:
+        print('Corrupted rows: {}'.format(
+            ', '.join(str(number) for number in malformed_rows)
+            ))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,178 @@
+from importlib import import_module
+from importlib.util import find_spec
+from typing import TYPE_CHECKING, Iterable
+from classes import BasePokemon
+from model_schema import POKEMON_TYPES, SPECIAL_STRENGTH_KEYS
+if TYPE_CHECKING:
+    import numpy
+
+
+# Columnar (struct-of-arrays) view of pokemon database, for vectorised
+# queries and simulations. Row i of every array describes i-th pokemon of
+# database's list. Types are saved as codes, which are indexes in
+# model_schema.POKEMON_TYPES (the same order as columns of weakness
+# matrix). Requires numpy, which is optional and imported on first table
+# build, so importing this module (and database) stays cheap.
+TYPE_CODES = {
+    pokemon_type: code for code, pokemon_type in enumerate(POKEMON_TYPES)
+}
+TYPE_CODE_NONE = -1
+TYPE_CODE_UNKNOWN = -2
+TABLE_AVAILABLE = find_spec('numpy') is not None
+
+
+def _import_numpy():
+    """ Returns numpy module, importing it on first call.
+
+    Raises:
+        ImportError: numpy is not installed.
+    """
+    if not TABLE_AVAILABLE:
+        raise ImportError('PokemonTable requires numpy')
+    return import_module('numpy')
+
+
+def get_type_code(pokemon_type: (str | None)) -> int:
+    """ Returns code of given pokemon type: it's index in POKEMON_TYPES,
+    TYPE_CODE_NONE for missing second type or TYPE_CODE_UNKNOWN for type
+    outside POKEMON_TYPES.
+
+    Args:
+        pokemon_type (str | None): Pokemon type, ex. 'fire'.
+
+    Returns:
+        int: Type code.
+    """
+    if pokemon_type is None:
+        return TYPE_CODE_NONE
+    return TYPE_CODES.get(pokemon_type, TYPE_CODE_UNKNOWN)
+
+
+class PokemonTable:
+    """ Read-only numpy arrays with values of every pokemon of database:
+        pokedex_number, hp, attack, defense, speed, generation (int64),
+        type1, type2 (int8 type codes) and weakness (float32 matrix with
+        one row per pokemon and one column per POKEMON_TYPES type).
+        Table keeps list of pokemons it was built from, so rows selected
+        in arrays always match pokemons (see get_pokemons).
+    """
+    def __init__(self, pokemons: Iterable[BasePokemon]) -> None:
+        """ Builds arrays from given pokemons, in given order.
+
+        Args:
+            pokemons (Iterable[BasePokemon]): Pokemons of database.
+
+        Raises:
+            ImportError: numpy is not installed.
+        """
+        numpy = _import_numpy()
+        pokemons = list(pokemons)
+        count = len(pokemons)
+        self._pokemons = pokemons
+
+        def column(values, dtype):
+            array = numpy.fromiter(values, dtype=dtype, count=count)
+            array.flags.writeable = False
+            return array
+
+        self.pokedex_number = column(
+            (pokemon.get_pokedex_number() for pokemon in pokemons),
+            numpy.int64
+            )
+        self.hp = column(
+            (pokemon.get_base_hp() for pokemon in pokemons), numpy.int64
+            )
+        self.attack = column(
+            (pokemon.get_base_attack() for pokemon in pokemons), numpy.int64
+            )
+        self.defense = column(
+            (pokemon.get_base_defense() for pokemon in pokemons), numpy.int64
+            )
+        self.speed = column(
+            (pokemon.get_base_speed() for pokemon in pokemons), numpy.int64
+            )
+        self.generation = column(
+            (pokemon.get_other_value('generation') for pokemon in pokemons),
+            numpy.int64
+            )
+        self.type1 = column(
+            (get_type_code(pokemon.get_types()[0]) for pokemon in pokemons),
+            numpy.int8
+            )
+        self.type2 = column(
+            (get_type_code(pokemon.get_types()[1]) for pokemon in pokemons),
+            numpy.int8
+            )
+        # Pokemons of one database share special strength dicts (see
+        # BasePokemon.share_values), so every distinct dict is converted
+        # to matrix row once.
+        strength_rows = {}
+        strength_dicts = []
+
+        def strength_row(special_strength):
+            row = strength_rows.get(id(special_strength))
+            if row is None:
+                row = strength_rows[id(special_strength)] = len(
+                    strength_dicts
+                    )
+                strength_dicts.append(special_strength)
+            return row
+
+        rows = numpy.fromiter(
+            (strength_row(pokemon.get_special_strength_dict())
+             for pokemon in pokemons),
+            dtype=numpy.intp, count=count
+            )
+        weakness = numpy.array([
+            [special_strength[key] for key in SPECIAL_STRENGTH_KEYS]
+            for special_strength in strength_dicts
+        ], dtype=numpy.float32).reshape(-1, len(POKEMON_TYPES))[rows]
+        weakness.flags.writeable = False
+        self.weakness = weakness
+
+    def __len__(self) -> int:
+        return len(self.pokedex_number)
+
+    def get_pokemons(self, rows: 'numpy.ndarray') -> list[BasePokemon]:
+        """ Returns pokemons of given rows, in order of rows.
+
+        Args:
+            rows (numpy.ndarray): Boolean mask with one value per pokemon
+            or array of row indexes.
+
+        Returns:
+            list: List of BasePokemon objects.
+        """
+        numpy = _import_numpy()
+        rows = numpy.asarray(rows)
+        if rows.dtype == numpy.bool_:
+            rows = numpy.flatnonzero(rows)
+        return [self._pokemons[row] for row in rows.tolist()]
+
+    def get_type_mask(self, pokemon_type: str) -> 'numpy.ndarray':
+        """ Returns boolean array, True for pokemons with given primary or
+        secondary type.
+
+        Args:
+            pokemon_type (str): Pokemon type, ex. 'fire'.
+
+        Returns:
+            numpy.ndarray: Boolean array with one value per pokemon.
+        """
+        code = get_type_code(pokemon_type)
+        return (self.type1 == code) | (self.type2 == code)
+
+    def get_weakness_column(self, pokemon_type: str) -> 'numpy.ndarray':
+        """ Returns special strength of every pokemon against given type
+        (column of weakness matrix).
+
+        Args:
+            pokemon_type (str): Type from POKEMON_TYPES, ex. 'fire'.
+
+        Raises:
+            KeyError: Given type is not in POKEMON_TYPES.
+
+        Returns:
+            numpy.ndarray: float32 array with one value per pokemon.
+        """
+        return self.weakness[:, TYPE_CODES[pokemon_type]]
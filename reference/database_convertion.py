@@ -1,31 +1,49 @@
+import argparse
 import csv
 import json
+import os
+from time import perf_counter
+from typing import Iterator
+from classes import MalformedPokemonDataError
+from model_convert import iter_from_reference_csv
+from model_csv import iter_reference_csv_rows
+from model_io import (
+    open_json_file,
+    io_return_valid_pokemon,
+    write_rows_to_json,
+    write_to_json_v2,
+    JSON_FORMAT_V1
+)
+from model_records import write_record_file
 
 
-class InvalidFileLineLeghthError(ValueError):
-    pass
+# Output formats of convert_reference_csv: pokemon.json with string
+# values (v1), typed pokemon.json v2 and binary record file (see
+# model_records).
+OUTPUT_FORMATS = ('v1', 'typed', 'binary')
 
 
-class MalformedPokemonDataError(Exception):
+class InvalidFileLineLeghthError(ValueError):
     pass
 
 
 def reformat_csv(file, new_file):
-    pokemon_list = []
-    file_handle = open(file, 'r', encoding='utf-8-sig')
-    pokemon_list.append(file_handle.readline())
-    for row in file_handle:
-        row = row.replace("[", "\"[", 1)
-        row = row.replace("]", "]\"", 1)
-        pokemon_list.append(row)
-    file_handle.close()
-    with open(new_file, 'w', encoding='utf-8-sig') as file_hantle:
-        file_hantle.writelines(pokemon_list)
+    with open(file, 'r', encoding='utf-8-sig') as file_handle, \
+            open(new_file, 'w', encoding='utf-8-sig') as file_hantle:
+        file_hantle.write(file_handle.readline())
+        for row in file_handle:
+            row = row.replace("[", "\"[", 1)
+            row = row.replace("]", "]\"", 1)
+            file_hantle.write(row)
 
 
 def read_from_csv(file):
+    with open(file, 'r', encoding='utf-8-sig') as file_handle:
+        return _read_from_csv(file_handle)
+
+
+def _read_from_csv(file_handle):
     pokemon_file = []
-    file_handle = open(file, 'r', encoding='utf-8-sig')
     reader = csv.DictReader(file_handle, delimiter=',')
     pokemon_file.append(["pokedex_number",
                          "abilities",
@@ -137,12 +155,15 @@ def read_from_csv(file):
             pokemon_file.append(pokemon)
     except csv.Error as e:
         raise MalformedPokemonDataError(str(e))
-    file_handle.close()
     return pokemon_file
 
 
 def write_to_csv(file, pokemon_list):
-    file_handle = open(file, 'w', encoding='utf-8-sig')
+    with open(file, 'w', encoding='utf-8-sig') as file_handle:
+        _write_to_csv(file_handle, pokemon_list)
+
+
+def _write_to_csv(file_handle, pokemon_list):
     writer = csv.DictWriter(file_handle, ["pokedex_number",
                                           "abilities",
                                           "name",
@@ -214,13 +235,17 @@ def write_to_csv(file, pokemon_list):
             "weight_kg": pokemon[31],
             "generation": pokemon[32]
         })
-    file_handle.close()
 
 
 def write_from_csv_to_json(json_file, csv_file):
+    with open(csv_file, 'r', encoding='utf-8-sig') as csv_file_handle:
+        data = _read_json_rows_from_csv(csv_file_handle)
+    with open(json_file, 'w', encoding='utf-8') as json_file_handle:
+        json.dump(data, json_file_handle, indent=4, ensure_ascii=False)
+
+
+def _read_json_rows_from_csv(csv_file_handle):
     data = []
-    json_file_handle = open(json_file, 'w', encoding='utf-8')
-    csv_file_handle = open(csv_file, 'r', encoding='utf-8-sig')
     reader = csv.DictReader(csv_file_handle, delimiter=',')
     for row in reader:
         if row['pokedex_number'] == 'pokedex_number':
@@ -302,4 +327,90 @@ def write_from_csv_to_json(json_file, csv_file):
             }
         }
         data.append(pokemon_data)
-    json.dump(data, json_file_handle, indent=4, ensure_ascii=False)
+    return data
+
+
+def iter_valid_reference_rows(file_handle) -> Iterator[dict]:
+    """ Reads reference csv file one line at a time, fixes it's bracketed
+    abilities column and checks every row, without intermediate files.
+
+    Args:
+        file_handle (io.TextIOWrapper): Reference csv file opened with
+        'utf-8-sig' encoding and newline=''.
+
+    Raises:
+        MalformedPokemonDataError: returns type of data corruption and
+        row where it was found.
+
+    Yields:
+        dict: Checked pokemon.json (v1) row, with string values.
+    """
+    for idx, item in enumerate(iter_reference_csv_rows(file_handle)):
+        # Validator converts values of nested dicts in place.
+        io_return_valid_pokemon({
+            key: dict(value) if isinstance(value, dict) else value
+            for key, value in item.items()
+        }, idx + 1, JSON_FORMAT_V1)
+        yield item
+
+
+def convert_reference_csv(source_path: str, target_path: str,
+                          output_format: str = 'v1') -> int:
+    """ Converts reference csv file in one pass: every row is read, checked
+    and written before the next one is read, so memory use does not grow
+    with file size (binary format keeps only table of unique strings).
+    Json target can be compressed (see model_io.open_json_file).
+
+    Args:
+        source_path (str): Path to reference csv file.
+        target_path (str): Path of new file.
+        output_format (str, optional): One of OUTPUT_FORMATS.
+        Defaults to 'v1'.
+
+    Raises:
+        ValueError: Given output format is not supported.
+        MalformedPokemonDataError: returns type of data corruption and
+        row where it was found. Rows before it are already written.
+
+    Returns:
+        int: Number of converted pokemons.
+    """
+    if output_format not in OUTPUT_FORMATS:
+        raise ValueError('Unsupported output format: {}'.format(output_format))
+    if output_format == 'binary':
+        return write_record_file(iter_from_reference_csv(source_path),
+                                 target_path)
+    with open_json_file(target_path, 'w') as file_hantle:
+        if output_format == 'typed':
+            return write_to_json_v2(iter_from_reference_csv(source_path),
+                                    file_hantle)
+        with open(source_path, 'r', encoding='utf-8-sig',
+                  newline='') as file_handle:
+            return write_rows_to_json(iter_valid_reference_rows(file_handle),
+                                      file_hantle, JSON_FORMAT_V1)
+
+
+def main():
+    # Run from repository root: python -m reference.database_convertion
+    parser = argparse.ArgumentParser(
+        description='Converts reference csv file into pokemon.json (v1), '
+                    'typed pokemon.json v2 or binary record file in one '
+                    'streaming pass.'
+        )
+    parser.add_argument('source', nargs='?', default='reference/pokemon.csv',
+                        help='reference csv file')
+    parser.add_argument('target', nargs='?', default='pokemon.json',
+                        help='path of new file')
+    parser.add_argument('--format', default='v1', choices=OUTPUT_FORMATS)
+    args = parser.parse_args()
+    start = perf_counter()
+    count = convert_reference_csv(args.source, args.target, args.format)
+    elapsed = perf_counter() - start
+    size = os.path.getsize(args.source)
+    print('Converted {} pokemons to {} in {:.2f} s ({:.0f} rows/s, '
+          '{:.1f} MiB/s)'.format(count, args.target, elapsed,
+                                 count / elapsed, size / 2 ** 20 / elapsed))
+
+
+if __name__ == '__main__':
+    main()
@@ -1,12 +1,18 @@
 # Placeholder tymczasowy
 # from main import *
 # from classes import *
+import json
 from reference.database_convertion import (
+    convert_reference_csv,
     write_from_csv_to_json,
     read_from_csv,
     reformat_csv,
     write_to_csv
 )
+from classes import MalformedPokemonDataError
+from model_io import read_from_json, pokemon_to_record
+from model_records import PokemonRecordFile
+from pytest import raises
 
 
 def test_creating_reformatted_file():
@@ -33,3 +39,54 @@ def test_writing_final_json_file():
     csv_file = 'reference/cleaned_pokemon.csv'
     write_from_csv_to_json(json_file, csv_file)
 
+
+def test_convert_reference_csv_v1_matches_pokemon_json(tmp_path):
+    path = str(tmp_path / 'pokemon.json')
+    assert convert_reference_csv('reference/pokemon.csv', path) == 801
+    with open(path, 'r', encoding='utf-8') as file_hantle, \
+            open('pokemon.json', 'r', encoding='utf-8') as pokemon_file:
+        assert json.load(file_hantle) == json.load(pokemon_file)
+
+
+def test_convert_reference_csv_typed_and_binary(tmp_path):
+    typed_path = str(tmp_path / 'pokemon_v2.json')
+    binary_path = str(tmp_path / 'pokemon.pkdb')
+    assert convert_reference_csv('reference/pokemon.csv', typed_path,
+                                 'typed') == 801
+    assert convert_reference_csv('reference/pokemon.csv', binary_path,
+                                 'binary') == 801
+    with open(typed_path, 'r', encoding='utf-8') as file_hantle:
+        pokemons = read_from_json(file_hantle)
+    record_file = PokemonRecordFile(binary_path)
+    assert pokemon_to_record(record_file.get_pokemon(25)) == (
+        pokemon_to_record(pokemons[24])
+        )
+    record_file.close()
+
+
+def test_convert_reference_csv_malformed_row(tmp_path):
+    source = tmp_path / 'pokemon.csv'
+    with open('reference/pokemon.csv', 'r', encoding='utf-8-sig',
+              newline='') as file_hantle:
+        header, first, second, *_ = file_hantle
+    source.write_text(header + first + second.replace(',grass,', ',,', 1),
+                      encoding='utf-8-sig', newline='')
+    with raises(MalformedPokemonDataError):
+        convert_reference_csv(str(source), str(tmp_path / 'pokemon.json'))
+
+
+def test_convert_reference_csv_unsupported_format(tmp_path):
+    with raises(ValueError):
+        convert_reference_csv('reference/pokemon.csv',
+                              str(tmp_path / 'pokemon.json'), 'xml')
+
+
+def test_read_from_csv_missing_columns(tmp_path):
+    source = tmp_path / 'reformatted_pokemon.csv'
+    with open('reference/reformatted_pokemon.csv', 'r',
+              encoding='utf-8-sig') as file_hantle:
+        header, first, *_ = file_hantle
+    source.write_text(header + first.split(',', 1)[0] + '\n',
+                      encoding='utf-8-sig')
+    with raises(MalformedPokemonDataError, match='Missing columns'):
+        read_from_csv(str(source))
@@ -1,5 +1,10 @@
 from pytest import raises
-from classes import BasePokemon, GamePokemon
+from classes import (
+    BasePokemon,
+    GamePokemon,
+    ReadOnlyDict,
+    SharedPokemonValues
+)
 from classes import (
                      PokemonDataDoesNotExistError,
                      BadConversionError,
@@ -7,6 +12,7 @@ from classes import (
                      #  MalformedPokemonDataError,
                     )
 import copy
+import pickle
 from database import PokemonDatabase
 from math import ceil
 
@@ -84,6 +90,13 @@ def test_base_pokemon_reading_values():
     assert pokemon.get_special_strength_value('bug') == 1.0
     assert pokemon.get_other_value('generation') == 1
 
+
+def test_base_pokemon_reading_classfication_and_experience_growth():
+    pokemon = BasePokemon(pokedex_number, name, abilities,
+                          stats, special_strength, other)
+    assert pokemon.get_classfication() == 'Seed Pokémon'
+    assert pokemon.get_experience_growth() == 1059860
+
 # Odpowiedzialność za brakujące/puste dane zrzucamy funkcję wczytującą
 # Jest to kluczowe w przypadku każdej zmiennej która ma str oraz list abilities
 # Liczby i tak zostają tu konwertowane dla wygody
@@ -165,6 +178,37 @@ def test_base_pokemon_empty_other_dict_vals_except_generation():
     assert base_pokemon.get_other_value('percentage_male') is None
 
 
+def test_read_only_dict():
+    values = ReadOnlyDict({'against_bug': 1.0})
+    with raises(TypeError):
+        values['against_bug'] = 2.0
+    with raises(TypeError):
+        values.update({'against_bug': 2.0})
+    assert copy.deepcopy(values) is values
+    assert pickle.loads(pickle.dumps(values)) == values
+
+
+def test_base_pokemon_share_values():
+    shared_values = SharedPokemonValues()
+    pokemons = [
+        BasePokemon(pokedex_number + idx, name, list(abilities),
+                    dict(stats), dict(special_strength), dict(other))
+        for idx in range(2)
+    ]
+    for pokemon in pokemons:
+        pokemon.share_values(shared_values)
+    first, second = pokemons
+    assert first.get_special_strength_dict() is (
+        second.get_special_strength_dict()
+        )
+    assert first.get_abilities() is second.get_abilities()
+    assert first.get_special_strength_value('fire') == 2.0
+    game_pokemon = GamePokemon(first)
+    assert game_pokemon.get_special_strength_dict() is (
+        first.get_special_strength_dict()
+        )
+
+
 def test_game_pokemon_init_typical():
     base_pokemon = BasePokemon(pokedex_number, name, abilities,
                                stats, special_strength, other)
@@ -1,9 +1,22 @@
 from database import PokemonDatabase
+import pytest
 from pytest import raises
+import database as database_module
+import json
+import os
+import shutil
+import subprocess
+import sys
+import time
+from model_io import open_json_file
+from model_records import write_record_file
+from model_sqlite import write_sqlite_file
+from model_shards import write_sharded_database
 from classes import (
     BadConversionError,
     PokemonDataDoesNotExistError,
     DataDoesNotExistError,
+    MalformedPokemonDataError,
     NotANumberError
 )
 
@@ -40,6 +53,442 @@ def test_database_load_from_json_path_is_a_directory():
         PokemonDatabase(path)
 
 
+def copy_database_file(tmp_path):
+    path = str(tmp_path / 'pokemon.json')
+    shutil.copy('pokemon.json', path)
+    return path
+
+
+def test_database_load_from_json_writes_snapshot(tmp_path):
+    path = copy_database_file(tmp_path)
+    PokemonDatabase(path)
+    assert os.path.exists(path + '.snapshot')
+
+
+def test_database_load_from_json_uses_snapshot(tmp_path, monkeypatch):
+    path = copy_database_file(tmp_path)
+    PokemonDatabase(path)
+
+    def fail_reading(file_hantle, *args, **kwargs):
+        raise AssertionError('JSON file should not be validated again')
+    monkeypatch.setattr(database_module, 'read_from_json', fail_reading)
+    monkeypatch.setattr(database_module, 'read_changed_from_json',
+                        fail_reading)
+    snapshots = []
+    read_snapshot = database_module.read_snapshot
+
+    def count_snapshots(*args):
+        pokemon_list = read_snapshot(*args)
+        snapshots.append(pokemon_list)
+        return pokemon_list
+    monkeypatch.setattr(database_module, 'read_snapshot', count_snapshots)
+    database = PokemonDatabase(path)
+    assert len(snapshots) == 1 and snapshots[0] is not None
+    assert database.get_pokemon_database_list() is snapshots[0]
+    assert len(database.get_pokemon_database_list()) == 801
+    assert database.get_pokemon_using_pokedex_number(25).get_name() == (
+        'Pikachu'
+        )
+
+
+def test_database_load_from_json_snapshot_invalidated(tmp_path):
+    path = copy_database_file(tmp_path)
+    PokemonDatabase(path)
+    with open(path, 'r') as file_hantle:
+        content = file_hantle.read()
+    with open(path, 'w') as file_hantle:
+        file_hantle.write(content.replace('"Bulbasaur"', '"Bulbasaurus"'))
+    database = PokemonDatabase(path)
+    assert database.get_pokemon_database_list()[0].get_name() == (
+        'Bulbasaurus'
+        )
+
+
+def test_database_load_from_json_without_snapshot(tmp_path):
+    path = copy_database_file(tmp_path)
+    PokemonDatabase(path, use_snapshot=False)
+    assert not os.path.exists(path + '.snapshot')
+
+
+def test_database_streaming_lookup_reads_only_needed_rows():
+    database = PokemonDatabase('pokemon.json', streaming=True)
+    pokemon = database.get_pokemon_using_pokedex_number(3)
+    assert pokemon.get_name() == 'Venusaur'
+    assert len(database._get_pokemon_source()._loaded_pokemons) == 3
+
+
+def test_database_streaming_full_list():
+    database = PokemonDatabase('pokemon.json', streaming=True)
+    assert database.search_database('Pik')[0].get_name() == 'Pikachu'
+    assert len(database.get_pokemon_database_list()) == 801
+
+
+def test_database_streaming_close_after_early_stop():
+    with PokemonDatabase('pokemon.json', streaming=True) as database:
+        source = database._get_pokemon_source()
+        assert database.get_pokemon_using_name('Ivysaur')
+        assert not source.is_closed()
+    assert source.is_closed()
+    assert database.get_pokemon_using_pokedex_number(2).get_name() == (
+        'Ivysaur'
+        )
+
+
+def test_database_streaming_closes_file_after_last_row():
+    database = PokemonDatabase('pokemon.json', streaming=True)
+    source = database._get_pokemon_source()
+    database.get_pokemon_database_list()
+    assert source.is_closed()
+
+
+def test_database_streaming_file_not_found():
+    path = 'DefinitywnieTenPlikNieIstnieje.json'
+    with raises(FileNotFoundError):
+        PokemonDatabase(path, streaming=True)
+
+
+def write_database_record_file(tmp_path):
+    path = str(tmp_path / 'pokemon.pkdb')
+    write_record_file(load_correct_database().get_pokemon_database_list(),
+                      path)
+    return path
+
+
+def test_database_record_file_lookup_is_lazy(tmp_path):
+    database = PokemonDatabase(write_database_record_file(tmp_path))
+    pokemon = database.get_pokemon_using_pokedex_number(25)
+    assert pokemon.get_name() == 'Pikachu'
+    assert database.get_pokemon_using_pokedex_number('25') is pokemon
+    assert database.get_pokemon_using_name('pikachu') is pokemon
+    assert len(database._get_pokemon_source()._pokemons) == 1
+    with raises(PokemonDataDoesNotExistError):
+        database.get_pokemon_using_pokedex_number(900)
+
+
+def test_database_record_file_full_list(tmp_path):
+    database = PokemonDatabase(write_database_record_file(tmp_path))
+    assert database.search_database('Pik')[0].get_name() == 'Pikachu'
+    assert len(database.get_pokemon_database_list()) == 801
+
+
+def test_database_record_file_not_found():
+    with raises(FileNotFoundError):
+        PokemonDatabase('DefinitywnieTenPlikNieIstnieje.pkdb')
+
+
+def test_database_shared_memory():
+    database = load_correct_database()
+    with database.publish_to_shared_memory() as shared:
+        shared_database = PokemonDatabase(shared.get_path())
+        pokemon = shared_database.get_pokemon_using_pokedex_number(25)
+        assert pokemon.get_name() == 'Pikachu'
+        assert shared_database.get_pokemon_using_name('pikachu') is pokemon
+        assert [
+            pokemon.get_name()
+            for pokemon in shared_database.get_pokemon_database_list()
+        ] == [
+            pokemon.get_name()
+            for pokemon in database.get_pokemon_database_list()
+        ]
+        shared_database._get_pokemon_source().close()
+
+
+def test_database_shared_memory_not_found():
+    with raises(FileNotFoundError):
+        PokemonDatabase('shm://DefinitywnieTenSegmentNieIstnieje')
+
+
+def write_database_sqlite_file(tmp_path):
+    path = str(tmp_path / 'pokemon.sqlite')
+    write_sqlite_file(load_correct_database().get_pokemon_database_list(),
+                      path)
+    return path
+
+
+def test_database_sqlite_lookups(tmp_path):
+    database = PokemonDatabase(write_database_sqlite_file(tmp_path))
+    assert database.get_pokemon_using_pokedex_number('25').get_name() == (
+        'Pikachu'
+        )
+    assert database.get_pokemon_using_name('pikachu').get_name() == 'Pikachu'
+    with raises(PokemonDataDoesNotExistError):
+        database.get_pokemon_using_name('PIKAPIKAPIKAPIKACHUUUUU')
+    assert not database._get_pokemon_snapshot().get_pokemon_list()
+
+
+def test_database_sqlite_search_same_as_json(tmp_path):
+    database = PokemonDatabase(write_database_sqlite_file(tmp_path))
+    json_database = load_correct_database()
+    for query in ('Cha', '56', 'zzz', 'Mr. '):
+        result = database.search_database(query)
+        json_result = json_database.search_database(query)
+        if json_result is None:
+            assert result is None
+        else:
+            assert [pokemon.get_name() for pokemon in result] == [
+                pokemon.get_name() for pokemon in json_result
+                ]
+
+
+def test_database_get_pokemons_using_type(tmp_path):
+    database = PokemonDatabase(write_database_sqlite_file(tmp_path))
+    json_database = load_correct_database()
+    result = database.get_pokemons_using_type('Dragon')
+    assert [pokemon.get_name() for pokemon in result] == [
+        pokemon.get_name()
+        for pokemon in json_database.get_pokemons_using_type('dragon')
+        ]
+    assert result[0].get_name() == 'Dratini'
+    with raises(BadConversionError):
+        database.get_pokemons_using_type(2)
+
+
+def test_database_shards_load_only_needed_shards(tmp_path):
+    path = str(tmp_path / 'pokemon.manifest.json')
+    write_sharded_database(
+        load_correct_database().get_pokemon_database_list(), path
+        )
+    database = PokemonDatabase(path)
+    source = database._get_pokemon_source()
+    assert source.get_loaded_generations() == []
+    assert database.get_pokemon_using_pokedex_number(25).get_name() == (
+        'Pikachu'
+        )
+    assert database.get_pokemon_using_name('Chikorita').get_name() == (
+        'Chikorita'
+        )
+    assert source.get_loaded_generations() == [1, 2]
+    assert database.search_database('Pikac')[0].get_name() == 'Pikachu'
+    assert source.get_loaded_generations() == [1, 2]
+
+
+def test_database_shards_search_same_as_json(tmp_path):
+    path = str(tmp_path / 'pokemon.manifest.json')
+    json_database = load_correct_database()
+    write_sharded_database(json_database.get_pokemon_database_list(), path)
+    database = PokemonDatabase(path)
+    for query in ('Cha', '56', 'zzz', ''):
+        result = database.search_database(query)
+        json_result = json_database.search_database(query)
+        if json_result is None:
+            assert result is None
+        else:
+            assert [pokemon.get_name() for pokemon in result] == [
+                pokemon.get_name() for pokemon in json_result
+                ]
+    assert len(database.get_pokemons_using_type('ice')) == len(
+        json_database.get_pokemons_using_type('ice')
+        )
+
+
+def change_database_file(path, old, new):
+    with open(path, 'r') as file_hantle:
+        content = file_hantle.read()
+    with open(path, 'w') as file_hantle:
+        file_hantle.write(content.replace(old, new))
+    stat = os.stat(path)
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+
+
+def test_database_reload_if_changed_checks_only_changed_rows(
+        tmp_path, monkeypatch):
+    path = copy_database_file(tmp_path)
+    database = PokemonDatabase(path, use_snapshot=False)
+    old_list = database.get_pokemon_database_list()
+    assert not database.reload_if_changed()
+    change_database_file(path, '"Bulbasaur"', '"Bulbasaurus"')
+    checked_rows = []
+    read_changed = database_module.read_changed_from_json
+
+    def count_checked_rows(file_hantle, *args):
+        result = read_changed(file_hantle, *args)
+        checked_rows.append(result[2])
+        return result
+    monkeypatch.setattr(database_module, 'read_changed_from_json',
+                        count_checked_rows)
+    assert database.reload_if_changed()
+    assert checked_rows == [1]
+    new_list = database.get_pokemon_database_list()
+    assert new_list[0].get_name() == 'Bulbasaurus'
+    assert new_list[1] is old_list[1]
+    assert old_list[0].get_name() == 'Bulbasaur'
+    assert PokemonDatabase(path).get_pokemon_database_list()[0].get_name() == (
+        'Bulbasaurus'
+        )
+
+
+def test_database_reload_malformed_keeps_old_list(tmp_path):
+    path = copy_database_file(tmp_path)
+    database = PokemonDatabase(path)
+    change_database_file(path, '"Bulbasaur"', '""')
+    with raises(MalformedPokemonDataError):
+        database.reload_if_changed()
+    assert database.get_pokemon_database_list()[0].get_name() == 'Bulbasaur'
+
+
+def test_database_search_keeps_view_during_reload(tmp_path):
+    path = copy_database_file(tmp_path)
+    database = PokemonDatabase(path)
+    pokemons = database._iter_pokemon_base()
+    first = next(pokemons)
+    change_database_file(path, '"Ivysaur"', '"Ivysaurus"')
+    database.reload_if_changed()
+    assert first.get_name() == 'Bulbasaur'
+    assert next(pokemons).get_name() == 'Ivysaur'
+    assert database.get_pokemon_using_pokedex_number(2).get_name() == (
+        'Ivysaurus'
+        )
+
+
+def test_database_reload_replaces_whole_snapshot(tmp_path):
+    path = copy_database_file(tmp_path)
+    database = PokemonDatabase(path, use_snapshot=False)
+    snapshot = database._get_pokemon_snapshot()
+    change_database_file(path, '"Bulbasaur"', '"Bulbasaurus"')
+    assert database.reload_if_changed()
+    new_snapshot = database._get_pokemon_snapshot()
+    assert new_snapshot is not snapshot
+    assert snapshot.get_index().get_pokemon_using_pokedex_number(1) is (
+        snapshot.get_pokemon_list()[0]
+        )
+    assert snapshot.get_pokemon_list()[0].get_name() == 'Bulbasaur'
+    assert new_snapshot.get_index().get_pokemon_using_pokedex_number(1) is (
+        new_snapshot.get_pokemon_list()[0]
+        )
+    assert database.get_pokemon_database_list() is (
+        new_snapshot.get_pokemon_list()
+        )
+
+
+def test_database_watching_reloads_file(tmp_path):
+    path = copy_database_file(tmp_path)
+    database = PokemonDatabase(path)
+    database.start_watching(interval=0.01)
+    try:
+        change_database_file(path, '"Bulbasaur"', '"Bulbasaurus"')
+        for _ in range(500):
+            if database.get_pokemon_database_list()[0].get_name() != (
+                        'Bulbasaur'
+                    ):
+                break
+            time.sleep(0.01)
+    finally:
+        database.stop_watching()
+    assert database.get_pokemon_database_list()[0].get_name() == (
+        'Bulbasaurus'
+        )
+    assert database.get_reload_error() is None
+
+
+def wait_for_reload(database, condition):
+    for _ in range(500):
+        if condition():
+            return
+        time.sleep(0.01)
+
+
+def test_database_watching_survives_missing_key(tmp_path):
+    path = copy_database_file(tmp_path)
+    database = PokemonDatabase(path)
+    database.start_watching(interval=0.01)
+    try:
+        with open(path, 'r') as file_hantle:
+            data = json.load(file_hantle)
+        del data[0]['other']
+        with open(path + '.tmp', 'w') as file_hantle:
+            json.dump(data, file_hantle)
+        os.replace(path + '.tmp', path)
+        wait_for_reload(
+            database, lambda: database.get_reload_error() is not None
+            )
+        assert isinstance(database.get_reload_error(),
+                          MalformedPokemonDataError)
+        assert database.get_pokemon_database_list()[0].get_name() == (
+            'Bulbasaur'
+            )
+        with open('pokemon.json', 'r') as file_hantle:
+            content = file_hantle.read()
+        with open(path + '.tmp', 'w') as file_hantle:
+            file_hantle.write(content.replace('"Bulbasaur"', '"Bulbasaurus"'))
+        os.replace(path + '.tmp', path)
+        wait_for_reload(database, lambda: database.get_reload_error() is None)
+    finally:
+        database.stop_watching()
+    assert database.get_reload_error() is None
+    assert database.get_pokemon_database_list()[0].get_name() == (
+        'Bulbasaurus'
+        )
+
+
+def test_database_reload_lazy_source():
+    database = PokemonDatabase('pokemon.json', streaming=True)
+    with raises(NotImplementedError):
+        database.reload_if_changed()
+
+
+def write_compressed_database_file(tmp_path, extension):
+    path = str(tmp_path / ('pokemon.json' + extension))
+    with open('pokemon.json', 'r') as source, open_json_file(path, 'w') as (
+                target
+            ):
+        shutil.copyfileobj(source, target)
+    return path
+
+
+def test_database_load_compressed_files(tmp_path):
+    for extension in ('.gz', '.bz2', '.xz'):
+        path = write_compressed_database_file(tmp_path, extension)
+        database = PokemonDatabase(path, use_snapshot=False)
+        assert len(database.get_pokemon_database_list()) == 801
+        database = PokemonDatabase(path, streaming=True)
+        assert database.get_pokemon_using_pokedex_number(25).get_name() == (
+            'Pikachu'
+            )
+
+
+def test_database_load_corrupted_compressed_file(tmp_path):
+    path = write_compressed_database_file(tmp_path, '.gz')
+    with open(path, 'rb') as file_hantle:
+        content = file_hantle.read()
+    with open(path, 'wb') as file_hantle:
+        file_hantle.write(content[:len(content) // 2])
+    with raises(MalformedPokemonDataError):
+        PokemonDatabase(path, use_snapshot=False)
+
+
+def test_database_load_reference_csv(tmp_path):
+    path = str(tmp_path / 'pokemon.csv')
+    shutil.copy('reference/pokemon.csv', path)
+    database = PokemonDatabase(path)
+    assert len(database.get_pokemon_database_list()) == 801
+    assert database.get_pokemon_using_name('Pikachu').get_base_hp() == 35
+    assert os.path.exists(path + '.snapshot')
+
+
+def test_database_parallel_load(tmp_path):
+    path = copy_database_file(tmp_path)
+    database = PokemonDatabase(path, use_snapshot=False, parallel=True)
+    assert len(database.get_pokemon_database_list()) == 801
+
+
+def test_database_import_does_not_import_pygame():
+    result = subprocess.run(
+        [sys.executable, '-c',
+         'import database, sys; print("pygame" in sys.modules)'],
+        capture_output=True, text=True, check=True
+        )
+    assert result.stdout.strip() == 'False'
+
+
+def test_database_import_does_not_import_numpy():
+    result = subprocess.run(
+        [sys.executable, '-c',
+         'import database, sys; print("numpy" in sys.modules)'],
+        capture_output=True, text=True, check=True
+        )
+    assert result.stdout.strip() == 'False'
+
+
 def test_database_search_name_typical():
     database = load_correct_database()
     substring = 'Cha'
@@ -56,6 +505,15 @@ def test_database_search_name_empty_text():
     assert len(search_result) == 0
 
 
+def test_database_search_name_plain_text():
+    database = load_correct_database()
+    assert [pokemon.get_name() for pokemon in database._search_name('.')] == [
+        'Mr. Mime', 'Mime Jr.'
+        ]
+    assert database._search_name('(') == []
+    assert database.search_database('[') is None
+
+
 def test_database_search_name_no_find():
     database = load_correct_database()
     substring = 'testowanko'
@@ -173,6 +631,146 @@ def test_database_search_database_query_invalid_datatype():
         database.search_database(number_tuple)
 
 
+def test_database_search_session_same_as_search_database():
+    database = load_correct_database()
+    session = database.create_search_session()
+    for query in ('p', 'pi', 'PIK', 'pika', 'pi', 'mime', 'mr. mime',
+                  '', '1', '15', '156', '5', '56', '562', '0', '10', 'x',
+                  '1', 100, 'zzz', 'zzzz', 'a', 'ab', 'abc'):
+        assert session.search(query) == database.search_database(query)
+
+
+def test_database_search_session_narrows_previous_result(monkeypatch):
+    database = load_correct_database()
+    session = database.create_search_session()
+    calls = []
+    search_positions = database._get_pokemon_snapshot().get_index(
+        ).search_name_positions
+
+    def count_searches(substring, candidates=None):
+        calls.append((substring, candidates is not None))
+        return search_positions(substring, candidates)
+    monkeypatch.setattr(database._get_pokemon_snapshot().get_index(),
+                        'search_name_positions', count_searches)
+    assert len(session.search('pi')) > 2
+    assert [pokemon.get_name() for pokemon in session.search('Pik')] == [
+        'Pikachu', 'Pikipek'
+        ]
+    assert session.search('Pikachu')[0].get_name() == 'Pikachu'
+    assert session.search('Pikachuu') is None
+    session.search('Pika')
+    assert calls == [('pi', False), ('pik', True), ('pikachu', True),
+                     ('pikachuu', True), ('pika', False)]
+
+
+@pytest.mark.parametrize('mode', ['streaming', 'lazy'])
+def test_database_search_session_narrows_source_result(mode, monkeypatch):
+    database = PokemonDatabase('pokemon.json', **{mode: True})
+    json_database = load_correct_database()
+    session = database.create_search_session()
+    calls = []
+    search_name = database._search_name
+
+    def count_searches(substring):
+        calls.append(substring)
+        return search_name(substring)
+    monkeypatch.setattr(database, '_search_name', count_searches)
+    for query in ('p', 'pi', 'pik', 'pi', '5', '56', '156', 'x'):
+        assert [
+            pokemon.get_pokedex_number()
+            for pokemon in session.search(query) or []
+        ] == [
+            pokemon.get_pokedex_number()
+            for pokemon in json_database.search_database(query) or []
+        ]
+    assert calls == ['p', 'pi', 'x']
+
+
+def test_database_search_session_number_after_zero():
+    database = load_correct_database()
+    session = database.create_search_session()
+    assert session.search('0') is None
+    assert session.search('10') == database.search_database('10')
+    assert session.search(79900) is None
+    assert session.search('799')[0].get_pokedex_number() == 799
+
+
+def test_database_search_session_after_reload(tmp_path):
+    path = copy_database_file(tmp_path)
+    database = PokemonDatabase(path)
+    session = database.create_search_session()
+    assert session.search('bulba')[0].get_name() == 'Bulbasaur'
+    change_database_file(path, '"Bulbasaur"', '"Bulbasaurus"')
+    assert database.reload_if_changed()
+    assert session.search('bulbasaurus')[0].get_name() == 'Bulbasaurus'
+
+
+def test_database_search_session_reload_during_search(
+        tmp_path, monkeypatch):
+    path = copy_database_file(tmp_path)
+    database = PokemonDatabase(path, use_snapshot=False)
+    session = database.create_search_session()
+    assert len(session.search('a')) > 10
+    with open(path, 'r') as file_hantle:
+        rows = json.load(file_hantle)
+    with open(path + '.tmp', 'w') as file_hantle:
+        json.dump(rows[:10], file_hantle)
+    os.replace(path + '.tmp', path)
+    get_loaded_snapshot = database._get_loaded_snapshot
+
+    def reload_after_read():
+        # Reload swaps snapshot right after search reads it.
+        snapshot = get_loaded_snapshot()
+        monkeypatch.setattr(database, '_get_loaded_snapshot',
+                            get_loaded_snapshot)
+        assert database.reload_if_changed()
+        return snapshot
+    monkeypatch.setattr(database, '_get_loaded_snapshot', reload_after_read)
+    names = [pokemon.get_name() for pokemon in session.search('ar')]
+    assert 'Charmander' in names and 'Arbok' in names
+    assert session.search('arb') is None
+    assert [pokemon.get_name() for pokemon in session.search('saur')] == [
+        'Bulbasaur', 'Ivysaur', 'Venusaur'
+        ]
+
+
+def test_database_search_session_invalid_datatype():
+    database = load_correct_database()
+    session = database.create_search_session()
+    with raises(BadConversionError):
+        session.search((55, 44, 22))
+
+
+def test_database_search_name_fuzzy_typical():
+    database = load_correct_database()
+    assert database.search_database('Charizrd') is None
+    search_result = database.search_name_fuzzy('Charizrd')
+    assert search_result[0].get_name() == 'Charizard'
+    assert database.search_name_fuzzy('PIKACHOO')[0].get_name() == 'Pikachu'
+
+
+def test_database_search_name_fuzzy_limits():
+    database = load_correct_database()
+    assert database.search_name_fuzzy('Pikachoo', max_distance=1) is None
+    assert len(database.search_name_fuzzy('Pichu', count=3)) == 3
+    assert database.search_name_fuzzy('testowanko') is None
+
+
+def test_database_search_name_fuzzy_lazy_source():
+    database = PokemonDatabase('pokemon.json', lazy=True)
+    assert database.search_name_fuzzy('Bulbasar')[0].get_name() == (
+        'Bulbasaur'
+        )
+
+
+def test_database_search_name_fuzzy_invalid():
+    database = load_correct_database()
+    with raises(BadConversionError):
+        database.search_name_fuzzy(25)
+    with raises(DataDoesNotExistError):
+        database.search_name_fuzzy('')
+
+
 def test_database_get_pokemon_using_name_typical():
     database = load_correct_database()
     name = 'Pikachu'
@@ -208,6 +806,52 @@ def test_database_get_pokemon_using_name_pokemon_does_not_exist():
         database.get_pokemon_using_name(name)
 
 
+def test_database_get_pokemon_using_name_exact_match():
+    database = load_correct_database()
+    assert database.get_pokemon_using_name('Porygon2').get_name() == (
+        'Porygon2'
+        )
+    assert database.get_pokemon_using_name('mr. mime').get_name() == (
+        'Mr. Mime'
+        )
+    assert database.get_pokemon_using_name("FARFETCH'D").get_name() == (
+        "Farfetch'd"
+        )
+    for name in ('Pikachu2', 'Mrx Mime', 'Pika', '(', '.*'):
+        with raises(PokemonDataDoesNotExistError):
+            database.get_pokemon_using_name(name)
+
+
+@pytest.mark.parametrize('mode', ['record', 'sqlite', 'shards', 'lazy',
+                                  'streaming'])
+def test_database_get_pokemon_using_name_exact_in_sources(tmp_path, mode):
+    pokemons = load_correct_database().get_pokemon_database_list()
+    kwargs = {}
+    if mode == 'record':
+        path = str(tmp_path / 'pokemon.pkdb')
+        write_record_file(pokemons, path)
+    elif mode == 'sqlite':
+        path = str(tmp_path / 'pokemon.sqlite')
+        write_sqlite_file(pokemons, path)
+    elif mode == 'shards':
+        path = str(tmp_path / 'pokemon.manifest.json')
+        write_sharded_database(pokemons, path)
+    else:
+        path = 'pokemon.json'
+        kwargs[mode] = True
+    database = PokemonDatabase(path, **kwargs)
+    assert database.get_pokemon_using_name('porygon2').get_name() == (
+        'Porygon2'
+        )
+    assert database.get_pokemon_using_name('MR. MIME').get_name() == (
+        'Mr. Mime'
+        )
+    with raises(PokemonDataDoesNotExistError):
+        database.get_pokemon_using_name('Mrx Mime')
+    assert not database._get_pokemon_snapshot().get_pokemon_list()
+    database._get_pokemon_source().close()
+
+
 def test_database_get_pokemon_using_pokedex_number_string_typical():
     database = load_correct_database()
     pokedex_number = '20'
@@ -321,3 +965,116 @@ def test_search_database_string_pokedex_number_invalid_datatype():
     no = 55.55
     with raises(BadConversionError):
         database.search_database(no)
+
+
+def test_database_json_backend_default():
+    database = PokemonDatabase('pokemon.json', use_snapshot=False)
+    assert database.get_json_backend_name() in ('orjson', 'ujson', 'json')
+
+
+def test_database_json_backend_given():
+    database = PokemonDatabase('pokemon.json', use_snapshot=False,
+                               json_backend='json')
+    assert database.get_json_backend_name() == 'json'
+    assert len(database.get_pokemon_database_list()) == 801
+
+
+def test_database_json_backend_unsupported():
+    with raises(KeyError):
+        PokemonDatabase('pokemon.json', json_backend='simplejson')
+
+
+def write_database_overlay(tmp_path, name, rows):
+    path = str(tmp_path / name)
+    with open(path, 'w') as file_hantle:
+        json.dump({'overlay_format_version': 1, 'pokemon': rows},
+                  file_hantle)
+    return path
+
+
+def test_database_apply_overlays(tmp_path):
+    database = load_correct_database()
+    first = write_database_overlay(tmp_path, 'first.overlay.json', [
+        {'pokedex_number': 25, 'stats': {'attack': 99, 'hp': 50}}
+        ])
+    second = write_database_overlay(tmp_path, 'second.overlay.json', [
+        {'pokedex_number': 25, 'stats': {'attack': 120}}
+        ])
+    variant = database.apply_overlays([first, second])
+    pikachu = variant.get_pokemon_using_pokedex_number(25)
+    assert pikachu.get_base_attack() == 120
+    assert pikachu.get_base_hp() == 50
+    assert database.get_pokemon_using_pokedex_number(25).get_base_attack() == (
+        55
+        )
+    assert variant.get_pokemon_using_pokedex_number(26) is (
+        database.get_pokemon_using_pokedex_number(26)
+        )
+    assert variant.get_overlay_paths() == [first, second]
+    assert database.get_overlay_paths() == []
+    with raises(NotImplementedError):
+        variant.reload_if_changed()
+
+
+def test_database_lazy_lookup_converts_only_needed_rows():
+    database = PokemonDatabase('pokemon.json', lazy=True)
+    assert database.get_pokemon_using_pokedex_number(25).get_name() == (
+        'Pikachu'
+        )
+    assert database._get_pokemon_source().get_loaded_count() == 1
+
+
+def test_database_lazy_validate_all(tmp_path):
+    path = copy_database_file(tmp_path)
+    database = PokemonDatabase(path, lazy=True)
+    pikachu = database.get_pokemon_using_name('Pikachu')
+    database.validate_all()
+    assert len(database._get_pokemon_snapshot().get_pokemon_list()) == 801
+    assert database.get_pokemon_using_name('Pikachu') is pikachu
+    assert not os.path.exists(path + '.snapshot')
+
+
+def test_database_lazy_validate_all_malformed(tmp_path):
+    path = copy_database_file(tmp_path)
+    with open(path, 'r') as file_hantle:
+        content = file_hantle.read()
+    with open(path, 'w') as file_hantle:
+        file_hantle.write(content.replace('"Raichu"', '""'))
+    database = PokemonDatabase(path, lazy=True)
+    assert database.get_pokemon_using_pokedex_number(25).get_name() == (
+        'Pikachu'
+        )
+    with raises(MalformedPokemonDataError, match='row 26'):
+        database.validate_all()
+
+
+def test_database_pokemon_table_follows_list(tmp_path):
+    pytest.importorskip('numpy')
+    path = copy_database_file(tmp_path)
+    database = PokemonDatabase(path, use_snapshot=False)
+    assert database._get_pokemon_snapshot()._pokemon_table is None
+    table = database.get_pokemon_table()
+    assert database.get_pokemon_table() is table
+    assert table.get_pokemons([24])[0] is (
+        database.get_pokemon_using_pokedex_number(25)
+        )
+    overlay = write_database_overlay(tmp_path, 'attack.overlay.json', [
+        {'pokedex_number': 25, 'stats': {'attack': 99}}
+        ])
+    assert database.apply_overlays([overlay]).get_pokemon_table().attack[
+        24] == 99
+    assert table.attack[24] == 55
+    with open(path, 'r') as file_hantle:
+        rows = json.load(file_hantle)
+    rows[24]['stats']['hp'] = '36'
+    time.sleep(0.01)
+    with open(path, 'w') as file_hantle:
+        json.dump(rows, file_hantle)
+    assert database.reload_if_changed()
+    assert database.get_pokemon_table().hp[24] == 36
+
+
+def test_database_pokemon_table_lazy():
+    pytest.importorskip('numpy')
+    database = PokemonDatabase('pokemon.json', lazy=True)
+    assert len(database.get_pokemon_table()) == 801
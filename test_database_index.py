@@ -0,0 +1,191 @@
+from database_index import (
+    NameBKTree,
+    NameSubstringIndex,
+    PokemonIndex,
+    fold_name,
+    get_edit_distance
+)
+from model_io import read_from_json
+
+
+def load_pokemons():
+    with open('pokemon.json', 'r') as file_hantle:
+        return read_from_json(file_hantle)
+
+
+def test_database_index_lookups():
+    pokemons = load_pokemons()
+    index = PokemonIndex(pokemons)
+    assert index.get_pokemon_using_pokedex_number(25) is pokemons[24]
+    assert index.get_pokemon_using_pokedex_number(900) is None
+    assert index.get_pokemon_using_name('PIKACHU') is pokemons[24]
+    assert index.get_pokemon_using_name('Mr. Mime').get_name() == 'Mr. Mime'
+    assert index.get_pokemon_using_name('Mr..Mime') is None
+
+
+def test_database_index_keeps_first_repeated_pokemon():
+    pokemons = load_pokemons()
+    index = PokemonIndex([pokemons[0], pokemons[1], pokemons[0]])
+    assert index.get_pokemon_using_pokedex_number(1) is pokemons[0]
+    assert index.get_pokemon_using_name('bulbasaur') is pokemons[0]
+
+
+def test_database_index_empty():
+    index = PokemonIndex()
+    assert index.get_pokemon_using_pokedex_number(1) is None
+    assert index.get_pokemon_using_name('Pikachu') is None
+    assert index.search_pokedex_number(1) == []
+    assert index.search_name_fuzzy('Pikachu') == []
+
+
+def test_database_index_fold_name():
+    assert fold_name('Straße') == fold_name('STRASSE')
+
+
+def test_database_index_search_name_same_as_scan():
+    pokemons = load_pokemons()
+    index = PokemonIndex(pokemons)
+    for query in ('Cha', 'cha', 'a', 'ch', 'saur', 'CHU', 'mr. ', 'zzz',
+                  'Pikachu', 'é', 'eon', 'ime j'):
+        assert index.search_name(query) == [
+            pokemon for pokemon in pokemons
+            if query.casefold() in pokemon.get_name().casefold()
+            ]
+
+
+def test_database_index_search_name_plain_text():
+    index = PokemonIndex(load_pokemons())
+    assert [pokemon.get_name() for pokemon in index.search_name('.')] == [
+        'Mr. Mime', 'Mime Jr.'
+        ]
+    assert index.search_name('(') == []
+    assert index.search_name('^pi') == []
+    assert index.search_name('pi.a') == []
+
+
+def test_database_index_name_substring_index():
+    index = NameSubstringIndex(['Aaaa', 'aaab', 'Baaa', 'xyz'])
+    assert len(index) == 4
+    assert index.search('aaa') == [0, 1, 2]
+    assert index.search('AAAA') == [0]
+    assert index.search('aab') == [1]
+    assert index.search('ab') == [1]
+    assert index.search('aaaaa') == []
+
+
+def test_database_index_builds_name_substring_index_on_first_search():
+    pokemons = load_pokemons()
+    index = PokemonIndex(pokemons)
+    assert index._name_substrings is None
+    assert index.get_pokemon_using_name('Pikachu') is pokemons[24]
+    assert index._name_substrings is None
+    assert index.search_name('kachu') == [pokemons[24]]
+    name_substrings = index._name_substrings
+    assert len(name_substrings) == 801
+    index.search_name('chu')
+    assert index._name_substrings is name_substrings
+
+
+def test_database_index_builds_number_indexes_on_first_search():
+    pokemons = load_pokemons()
+    index = PokemonIndex(pokemons)
+    assert index._number_indexes is None
+    assert index.get_pokemon_using_pokedex_number(25) is pokemons[24]
+    assert index._number_indexes is None
+    assert index.search_pokedex_number(725)[0] is pokemons[724]
+    number_indexes = index._number_indexes
+    assert number_indexes is not None
+    index.search_pokedex_number(72)
+    assert index._number_indexes is number_indexes
+
+
+def test_database_index_search_pokedex_number():
+    pokemons = load_pokemons()
+    index = PokemonIndex(pokemons)
+    numbers = [
+        pokemon.get_pokedex_number()
+        for pokemon in index.search_pokedex_number(56)
+    ]
+    assert numbers[0] == 56
+    assert numbers[1:] == sorted(
+        number for number in range(1, 802)
+        if number != 56 and '56' in str(number)
+        )
+    assert index.search_pokedex_number(900) == []
+
+
+def test_database_index_search_pokedex_number_same_as_scan():
+    pokemons = load_pokemons()
+    index = PokemonIndex(pokemons)
+    for number in (1, 5, 10, 25, 100, 801):
+        digits = str(number)
+        expected = [
+            pokemon for pokemon in pokemons
+            if str(pokemon.get_pokedex_number()) == digits
+        ] + [
+            pokemon for pokemon in pokemons
+            if digits in str(pokemon.get_pokedex_number())
+            and str(pokemon.get_pokedex_number()) != digits
+        ]
+        assert index.search_pokedex_number(number) == expected
+
+
+def test_database_index_search_pokedex_number_repeated():
+    pokemons = load_pokemons()
+    index = PokemonIndex([pokemons[10], pokemons[0], pokemons[1], pokemons[0]])
+    assert index.search_pokedex_number(1) == [
+        pokemons[0], pokemons[0], pokemons[10]
+        ]
+
+
+def test_database_index_name_substring_index_candidates():
+    index = NameSubstringIndex(['Aaaa', 'aaab', 'Baaa', 'xyz', 'aab'])
+    assert index.search('aab', [1, 3]) == [1]
+    assert index.search('ab', [0, 1, 4]) == [1, 4]
+    assert index.search('aaa', range(5)) == [0, 1, 2]
+    assert index.search('zzz', [3]) == []
+
+
+def test_database_index_get_edit_distance():
+    assert get_edit_distance('pikachoo', 'pikachu') == 2
+    assert get_edit_distance('charizrd', 'charizard') == 1
+    assert get_edit_distance('', 'abc') == 3
+    assert get_edit_distance('abc', '') == 3
+    assert get_edit_distance('kitten', 'sitting') == 3
+    assert get_edit_distance('same', 'same') == 0
+
+
+def test_database_index_name_bk_tree():
+    tree = NameBKTree(['Pikachu', 'Raichu', 'pikachu', 'Pichu', 'Mew'])
+    assert len(tree) == 4
+    assert tree.search('PIKACHOO') == [0, 2]
+    assert tree.search('pichu', count=2) == [3, 0, 2]
+    assert tree.search('pichu', count=2, max_distance=1) == [3]
+    assert tree.search('Mewtwo') == []
+    assert tree.search('Mewtwo', max_distance=3) == [4]
+    assert tree.search('Mew', count=0) == []
+    assert NameBKTree([]).search('Mew') == []
+
+
+def test_database_index_name_bk_tree_same_as_scan():
+    pokemons = load_pokemons()
+    names = [fold_name(pokemon.get_name()) for pokemon in pokemons]
+    tree = NameBKTree(names)
+    for query in ('charizrd', 'bulbasar', 'mr mime', 'pika', 'zzz'):
+        distances = sorted(
+            (get_edit_distance(query, name), position)
+            for position, name in enumerate(names)
+        )
+        expected = [
+            position for distance, position in distances[:3]
+            if distance <= 2
+        ]
+        assert tree.search(query, count=3) == expected
+
+
+def test_database_index_search_name_fuzzy():
+    pokemons = load_pokemons()
+    index = PokemonIndex(pokemons)
+    assert index.search_name_fuzzy('Pikachoo') == [pokemons[24]]
+    assert index.search_name_fuzzy('Charizrd')[0].get_name() == 'Charizard'
+    assert index.search_name_fuzzy('xyzzy') == []
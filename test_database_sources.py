@@ -0,0 +1,81 @@
+from database_sources import StreamingPokemonSource, LazyRowsPokemonSource
+from classes import MalformedPokemonDataError
+from io import StringIO
+from pytest import raises
+import json
+
+
+def make_rows_json(count, malformed_row=None):
+    with open('pokemon.json', 'r') as file_hantle:
+        data = json.load(file_hantle)[:count]
+    if malformed_row:
+        data[malformed_row - 1]['name'] = ''
+    return json.dumps(data)
+
+
+def test_streaming_source_iterates_twice():
+    source = StreamingPokemonSource(StringIO(make_rows_json(5)), 32)
+    first = [pokemon.get_name() for pokemon in source]
+    second = [pokemon.get_name() for pokemon in source]
+    assert first == second
+    assert len(first) == 5
+
+
+def test_streaming_source_closes_file_after_last_row():
+    file_hantle = StringIO(make_rows_json(2))
+    source = StreamingPokemonSource(file_hantle)
+    list(source)
+    assert file_hantle.closed
+
+
+def test_streaming_source_error_is_repeated():
+    source = StreamingPokemonSource(StringIO(make_rows_json(4, 3)))
+    with raises(MalformedPokemonDataError, match='row 3'):
+        list(source)
+    with raises(MalformedPokemonDataError, match='row 3'):
+        list(source)
+
+
+def make_lazy_source(count, malformed_row=None):
+    return LazyRowsPokemonSource(json.loads(make_rows_json(count,
+                                                           malformed_row)))
+
+
+def test_lazy_source_converts_only_accessed_rows():
+    source = make_lazy_source(50)
+    pokemon = source.get_pokemon_using_pokedex_number(25)
+    assert pokemon.get_name() == 'Pikachu'
+    assert source.get_pokemon_using_pokedex_number(25) is pokemon
+    assert source.get_pokemon_using_name('pikachu') is pokemon
+    assert [found.get_name() for found in source.search_name('saur')] == [
+        'Bulbasaur', 'Ivysaur', 'Venusaur'
+        ]
+    assert source.get_loaded_count() == 4
+    assert source.get_pokemon_using_pokedex_number(900) is None
+
+
+def test_lazy_source_malformed_row_on_access():
+    source = make_lazy_source(10, 3)
+    assert source.get_pokemon_using_pokedex_number(5).get_name() == (
+        'Charmeleon'
+        )
+    with raises(MalformedPokemonDataError, match='row 3'):
+        source.get_pokemon_using_name('Charmeleon')
+    with raises(MalformedPokemonDataError, match='row 3'):
+        source.validate_all()
+
+
+def test_lazy_source_validate_all_keeps_loaded_pokemons():
+    source = make_lazy_source(30)
+    pokemon = source.get_pokemon_using_pokedex_number(7)
+    pokemons = source.validate_all(parallel=True, workers=2,
+                                   parallel_threshold=0)
+    assert len(pokemons) == 30
+    assert pokemons[6] is pokemon
+    assert source.get_loaded_count() == 30
+
+
+def test_lazy_source_validate_all_parallel_lowest_malformed_row():
+    source = make_lazy_source(30, 12)
+    with raises(MalformedPokemonDataError, match='row 12'):
+        source.validate_all(parallel=True, workers=3, parallel_threshold=0)
@@ -0,0 +1,57 @@
+from model_convert import (
+    convert_to_v2,
+    convert_to_record_file,
+    convert_to_sqlite,
+    iter_from_reference_csv
+)
+from model_records import PokemonRecordFile
+from model_sqlite import PokemonSqliteFile
+from model_io import read_from_json, pokemon_to_record, open_json_file
+import json
+
+
+def test_model_convert_json_to_v2(tmp_path):
+    path = str(tmp_path / 'pokemon_v2.json')
+    assert convert_to_v2('pokemon.json', path) == 801
+    with open(path, 'r', encoding='utf-8') as file_hantle:
+        assert json.load(file_hantle)['format_version'] == 2
+
+
+def test_model_convert_csv_and_json_give_same_file(tmp_path):
+    json_path = str(tmp_path / 'from_json.json')
+    csv_path = str(tmp_path / 'from_csv.json')
+    convert_to_v2('pokemon.json', json_path)
+    convert_to_v2('reference/pokemon.csv', csv_path)
+    with open(json_path, 'rb') as json_file, open(csv_path, 'rb') as csv_file:
+        assert json_file.read() == csv_file.read()
+
+
+def test_model_convert_iter_from_reference_csv():
+    with open('pokemon.json', 'r') as file_hantle:
+        data = read_from_json(file_hantle)
+    csv_data = list(iter_from_reference_csv('reference/pokemon.csv'))
+    assert len(csv_data) == 801
+    assert pokemon_to_record(csv_data[24]) == pokemon_to_record(data[24])
+
+
+def test_model_convert_to_record_file(tmp_path):
+    path = str(tmp_path / 'pokemon.pkdb')
+    assert convert_to_record_file('reference/pokemon.csv', path) == 801
+    record_file = PokemonRecordFile(path)
+    assert record_file.get_pokemon(25).get_name() == 'Pikachu'
+    record_file.close()
+
+
+def test_model_convert_to_sqlite(tmp_path):
+    path = str(tmp_path / 'pokemon.sqlite')
+    assert convert_to_sqlite('pokemon.json', path) == 801
+    sqlite_file = PokemonSqliteFile(path)
+    assert sqlite_file.get_pokemon(25).get_name() == 'Pikachu'
+    sqlite_file.close()
+
+
+def test_model_convert_to_compressed_v2(tmp_path):
+    path = str(tmp_path / 'pokemon_v2.json.xz')
+    assert convert_to_v2('pokemon.json', path) == 801
+    with open_json_file(path) as file_hantle:
+        assert len(read_from_json(file_hantle)) == 801
@@ -0,0 +1,87 @@
+from model_csv import iter_reference_csv_rows, read_from_reference_csv
+from model_io import read_from_json, pokemon_to_record
+from classes import MalformedPokemonDataError
+from io import StringIO
+from pytest import raises
+import json
+import math
+
+
+def test_model_csv_rows_same_as_pokemon_json():
+    with open('reference/pokemon.csv', 'r', encoding='utf-8-sig') as file:
+        rows = list(iter_reference_csv_rows(file))
+    with open('pokemon.json', 'r') as file_hantle:
+        assert rows == json.load(file_hantle)
+
+
+def test_model_csv_abilities_column_with_commas():
+    with open('reference/pokemon.csv', 'r', encoding='utf-8-sig') as file:
+        row = next(iter_reference_csv_rows(file))
+    assert row['abilities'] == "['Overgrow', 'Chlorophyll']"
+    assert row['special_strength']['against_fighting'] == '0.5'
+
+
+def test_model_csv_missing_columns():
+    with open('reference/pokemon.csv', 'r', encoding='utf-8-sig') as file:
+        lines = file.readlines()[:3]
+    lines[2] = lines[2].rsplit(',', 3)[0] + '\n'
+    with raises(MalformedPokemonDataError, match='row 2'):
+        list(iter_reference_csv_rows(StringIO(''.join(lines))))
+
+
+def replace_csv_value(line, idx, value):
+    end = line.index(']') + 1
+    values = line[end:].split(',')
+    values[idx] = value
+    return line[:end] + ','.join(values)
+
+
+def read_csv_content(content):
+    return read_from_reference_csv(StringIO(content, newline=''))
+
+
+def load_csv_content():
+    with open('reference/pokemon.csv', 'r', encoding='utf-8-sig',
+              newline='') as file_hantle:
+        return file_hantle.read()
+
+
+def test_model_csv_read_from_reference_csv_same_as_json():
+    pokemons = read_csv_content(load_csv_content())
+    with open('pokemon.json', 'r') as file_hantle:
+        json_pokemons = read_from_json(file_hantle)
+    assert [pokemon_to_record(pokemon) for pokemon in pokemons] == [
+        pokemon_to_record(pokemon) for pokemon in json_pokemons
+        ]
+
+
+def test_model_csv_read_from_reference_csv_same_errors_as_json():
+    lines = load_csv_content().split('\n')
+    for column, value in (('hp', '-5'), ('name', ''), ('attack', 'x'),
+                          ('against_fire', '-1'), ('generation', '')):
+        idx = lines[0].split(',').index(column)
+        broken_lines = list(lines)
+        broken_lines[30] = replace_csv_value(broken_lines[30], idx, value)
+        content = '\n'.join(broken_lines)
+        with raises(MalformedPokemonDataError) as csv_error:
+            read_csv_content(content)
+        rows = list(iter_reference_csv_rows(StringIO(content, newline='')))
+        with raises(MalformedPokemonDataError) as json_error:
+            read_from_json(StringIO(json.dumps(rows)))
+        assert str(csv_error.value) == str(json_error.value)
+        assert 'row 30' in str(csv_error.value)
+
+
+def test_model_csv_read_from_reference_csv_accepts_what_rows_accept():
+    lines = load_csv_content().split('\n')
+    idx = lines[0].split(',').index('against_fire')
+    lines[1] = replace_csv_value(lines[1], idx, 'nan')
+    pokemons = read_csv_content('\n'.join(lines))
+    assert math.isnan(pokemons[0].get_special_strength_value('fire'))
+
+
+def test_model_csv_read_from_reference_csv_wrong_size():
+    lines = load_csv_content().split('\n')
+    lines[5] = lines[5] + ',1'
+    with raises(MalformedPokemonDataError):
+        read_csv_content('\n'.join(lines))
@@ -1,5 +1,10 @@
 from model_io import (
+    open_json_file,
     read_from_json,
+    read_changed_from_json,
+    iter_from_json,
+    write_to_json_v2,
+    pokemon_to_record,
     io_return_if_valid_string,
     io_return_if_positive,
     io_return_if_not_negative,
@@ -9,7 +14,7 @@ from model_io import (
     io_return_valid_other_dict
 )
 from classes import (
-    # MalformedPokemonDataError,
+    MalformedPokemonDataError,
     InvalidDataLineLeghthError,
     PokemonDataDoesNotExistError,
     NotANumberError,
@@ -17,6 +22,8 @@ from classes import (
     RedundantKeyError
 )
 from io import StringIO
+import model_io
+import json
 # from classes import BasePokemon
 import copy
 from pytest import raises
@@ -349,3 +356,239 @@ def test_model_io_read_from_json_check_full_data():
     assert len(data) == 801
     assert data[0].get_base_hp() == 45
     assert data[799].get_name() == 'Necrozma'
+
+
+def test_model_io_iter_from_json_check_full_data():
+    file_hantle = open('pokemon.json', 'r')
+    data = list(iter_from_json(file_hantle, chunk_size=100))
+    file_hantle.close()
+    assert len(data) == 801
+    assert data[0].get_base_hp() == 45
+    assert data[799].get_name() == 'Necrozma'
+
+
+def test_model_io_iter_from_json_is_lazy():
+    file_hantle = open('pokemon.json', 'r')
+    pokemon_iterator = iter_from_json(file_hantle, chunk_size=1000)
+    assert next(pokemon_iterator).get_name() == 'Bulbasaur'
+    assert file_hantle.tell() < 10000
+    file_hantle.close()
+
+
+def test_model_io_iter_from_json_empty_array():
+    assert list(iter_from_json(StringIO(' [ ] '))) == []
+
+
+def test_model_io_iter_from_json_malformed_row_number():
+    with open('pokemon.json', 'r') as file_hantle:
+        data = json.load(file_hantle)[:3]
+    data[2]['stats']['hp'] = '-5'
+    pokemon_iterator = iter_from_json(StringIO(json.dumps(data)), 16)
+    assert next(pokemon_iterator).get_name() == 'Bulbasaur'
+    assert next(pokemon_iterator).get_name() == 'Ivysaur'
+    with raises(MalformedPokemonDataError, match='row 3'):
+        next(pokemon_iterator)
+
+
+def test_model_io_iter_from_json_not_a_pokemon_database():
+    with raises(MalformedPokemonDataError):
+        list(iter_from_json(StringIO('{"name": "Bulbasaur"}')))
+
+
+def test_model_io_iter_from_json_truncated_file():
+    with open('pokemon.json', 'r') as file_hantle:
+        content = file_hantle.read()
+    with raises(json.JSONDecodeError):
+        list(iter_from_json(StringIO(content[:-100]), 64))
+
+
+def load_rows_with_malformed(rows):
+    with open('pokemon.json', 'r') as file_hantle:
+        data = json.load(file_hantle)
+    for row in rows:
+        data[row - 1]['abilities'] = ''
+    return json.dumps(data)
+
+
+def test_model_io_read_from_json_parallel_same_order():
+    with open('pokemon.json', 'r') as file_hantle:
+        data = read_from_json(
+            file_hantle, parallel=True, workers=2, parallel_threshold=0
+            )
+    assert len(data) == 801
+    assert [pokemon.get_pokedex_number() for pokemon in data] == list(
+        range(1, 802)
+        )
+
+
+def test_model_io_read_from_json_parallel_lowest_malformed_row():
+    content = load_rows_with_malformed([700, 350, 20])
+    with raises(MalformedPokemonDataError, match='row 20:'):
+        read_from_json(
+            StringIO(content), parallel=True, workers=2, parallel_threshold=0
+            )
+
+
+def test_model_io_read_from_json_parallel_same_error_as_serial():
+    content = load_rows_with_malformed([600])
+    with raises(MalformedPokemonDataError) as serial_error:
+        read_from_json(StringIO(content))
+    with raises(MalformedPokemonDataError) as parallel_error:
+        read_from_json(
+            StringIO(content), parallel=True, workers=3, parallel_threshold=0
+            )
+    assert str(serial_error.value) == str(parallel_error.value)
+
+
+def test_model_io_read_from_json_broken_row_structure():
+    with open('pokemon.json', 'r') as file_hantle:
+        data = json.load(file_hantle)
+    missing_key = copy.deepcopy(data)
+    del missing_key[2]['other']
+    wrong_section = copy.deepcopy(data)
+    wrong_section[2]['stats'] = None
+    string_section = copy.deepcopy(data)
+    string_section[2]['special_strength'] = 'x' * 18
+    list_section = copy.deepcopy(data)
+    list_section[2]['stats'] = list(list_section[2]['stats'])
+    for broken in (missing_key, wrong_section, string_section, list_section,
+                   data[:2] + [[1, 2]]):
+        with raises(MalformedPokemonDataError, match='row 3'):
+            read_from_json(StringIO(json.dumps(broken)))
+    v2_content = load_v2_content(3)
+    v2_data = json.loads(v2_content)
+    del v2_data['pokemon'][2]['other']
+    with raises(MalformedPokemonDataError, match='row 3'):
+        read_from_json(StringIO(json.dumps(v2_data)))
+
+
+def test_model_io_read_from_json_parallel_one_cpu_is_serial(monkeypatch):
+
+    def fail_parallel(*args):
+        raise AssertionError('process pool started')
+    monkeypatch.setattr(model_io.os, 'cpu_count', lambda: 1)
+    monkeypatch.setattr(model_io, 'io_return_valid_pokemons_parallel',
+                        fail_parallel)
+    assert model_io.get_worker_count() == 1
+    assert model_io.get_worker_count(4) == 4
+    with open('pokemon.json', 'r') as file_hantle:
+        data = read_from_json(file_hantle, parallel=True, parallel_threshold=0)
+    assert len(data) == 801
+
+
+def load_v2_content(count=None):
+    with open('pokemon.json', 'r') as file_hantle:
+        data = read_from_json(file_hantle)[:count]
+    file_hantle = StringIO()
+    write_to_json_v2(data, file_hantle)
+    return file_hantle.getvalue()
+
+
+def test_model_io_write_to_json_v2_typed_values():
+    data = json.loads(load_v2_content(1))
+    assert data['format_version'] == 2
+    row = data['pokemon'][0]
+    assert row['pokedex_number'] == 1
+    assert row['abilities'] == ['Overgrow', 'Chlorophyll']
+    assert row['stats']['hp'] == 45
+    assert row['special_strength']['against_grass'] == 0.25
+
+
+def test_model_io_read_from_json_v2_same_as_v1():
+    with open('pokemon.json', 'r') as file_hantle:
+        data_v1 = read_from_json(file_hantle)
+    data_v2 = read_from_json(StringIO(load_v2_content()))
+    assert len(data_v2) == 801
+    for pokemon_v1, pokemon_v2 in zip(data_v1, data_v2):
+        assert pokemon_to_record(pokemon_v1) == pokemon_to_record(pokemon_v2)
+
+
+def test_model_io_iter_from_json_v2():
+    data = list(iter_from_json(StringIO(load_v2_content()), 100))
+    assert len(data) == 801
+    assert data[799].get_name() == 'Necrozma'
+
+
+def test_model_io_read_from_json_v2_null_values():
+    data = json.loads(load_v2_content(1))
+    data['pokemon'][0]['stats']['type2'] = None
+    data['pokemon'][0]['other']['height_m'] = None
+    pokemon = read_from_json(StringIO(json.dumps(data)))[0]
+    assert pokemon.get_types() == ('grass', None)
+    assert pokemon.get_other_value('height_m') is None
+
+
+def test_model_io_read_from_json_v2_number_as_string():
+    data = json.loads(load_v2_content(2))
+    data['pokemon'][1]['stats']['hp'] = '45'
+    with raises(MalformedPokemonDataError, match='non-numeric data in row 2'):
+        read_from_json(StringIO(json.dumps(data)))
+
+
+def test_model_io_read_from_json_v2_abilities_as_string():
+    data = json.loads(load_v2_content(1))
+    data['pokemon'][0]['abilities'] = "['Overgrow']"
+    with raises(MalformedPokemonDataError, match='non_convertable'):
+        list(iter_from_json(StringIO(json.dumps(data))))
+
+
+def test_model_io_v2_rows_before_format_version(tmp_path):
+    data = json.loads(load_v2_content(3))
+    content = json.dumps({'pokemon': data['pokemon'], 'format_version': 2})
+    names = [pokemon.get_name() for pokemon in read_from_json(
+        StringIO(content)
+        )]
+    assert names == ['Bulbasaur', 'Ivysaur', 'Venusaur']
+    assert [pokemon.get_name() for pokemon in iter_from_json(
+        StringIO(content), 16
+        )] == names
+    path = str(tmp_path / 'pokemon.json.gz')
+    with open_json_file(path, 'w') as file_hantle:
+        file_hantle.write(content)
+    with open_json_file(path) as file_hantle:
+        assert [pokemon.get_name() for pokemon in read_from_json(
+            file_hantle
+            )] == names
+    for content in (
+            json.dumps({'pokemon': data['pokemon'], 'format_version': 3}),
+            json.dumps({'pokemon': data['pokemon']}),
+            json.dumps({'format_version': 2, 'pokemon': {}})):
+        with raises(MalformedPokemonDataError, match='Unsupported'):
+            read_from_json(StringIO(content))
+        with raises(MalformedPokemonDataError, match='Unsupported'):
+            list(iter_from_json(StringIO(content)))
+
+
+def test_model_io_read_from_json_unsupported_version():
+    content = json.dumps({'format_version': 3, 'pokemon': []})
+    with raises(MalformedPokemonDataError):
+        read_from_json(StringIO(content))
+    with raises(MalformedPokemonDataError):
+        list(iter_from_json(StringIO(content)))
+
+
+def test_model_io_read_changed_from_json():
+    with open('pokemon.json', 'r') as file_hantle:
+        pokemons, known_rows, checked_rows = read_changed_from_json(
+            file_hantle
+            )
+    assert checked_rows == 801
+    with open('pokemon.json', 'r') as file_hantle:
+        data = json.load(file_hantle)
+    data[0]['name'] = 'Bulbasaurus'
+    file_hantle = StringIO(json.dumps(data))
+    new_pokemons, _, checked_rows = read_changed_from_json(
+        file_hantle, known_rows
+        )
+    assert checked_rows == 1
+    assert new_pokemons[0].get_name() == 'Bulbasaurus'
+    assert new_pokemons[1:] == pokemons[1:]
+
+
+def test_model_io_read_from_json_shares_values():
+    with open('pokemon.json', 'r') as file_hantle:
+        data = read_from_json(file_hantle)
+    assert data[0].get_special_strength_dict() is (
+        data[1].get_special_strength_dict()
+        )
+    assert data[0].get_types()[0] is data[1].get_types()[0]
@@ -0,0 +1,74 @@
+from model_json import (
+    get_json_backend,
+    get_available_json_backends,
+    JSON_BACKEND_NAMES
+)
+from model_io import read_from_json, pokemon_to_record
+from classes import RedundantKeyError
+from io import BytesIO, StringIO
+from pytest import raises
+import json
+
+
+def test_model_json_get_json_backend_stdlib():
+    backend = get_json_backend('json')
+    assert backend.get_name() == 'json'
+    assert get_json_backend('json') is backend
+
+
+def test_model_json_get_json_backend_default_is_fastest_available():
+    backends = get_available_json_backends()
+    assert backends[-1].get_name() == 'json'
+    assert get_json_backend() is backends[0]
+    assert [backend.get_name() for backend in backends] == [
+        name for name in JSON_BACKEND_NAMES
+        if name in {backend.get_name() for backend in backends}
+    ]
+
+
+def test_model_json_get_json_backend_unsupported():
+    with raises(RedundantKeyError):
+        get_json_backend('simplejson')
+
+
+def test_model_json_backends_parse_bytes_and_text():
+    document = '{"name": "Flabébé", "numbers": [1, 2.5, null, true]}'
+    for backend in get_available_json_backends():
+        assert backend.loads(document) == json.loads(document)
+        assert backend.loads(document.encode('utf-8')) == json.loads(document)
+        assert backend.load(StringIO(document)) == json.loads(document)
+        assert backend.load(
+            BytesIO(document.encode('utf-8'))
+            ) == json.loads(document)
+
+
+def test_model_json_backends_invalid_json():
+    for backend in get_available_json_backends():
+        with raises(json.JSONDecodeError):
+            backend.loads(b'[{"name": "Bulbasaur"')
+        with raises(json.JSONDecodeError):
+            backend.loads(b'["\xff"]')
+
+
+def test_model_json_backends_read_same_pokemons():
+    expected = None
+    for backend in get_available_json_backends():
+        with open('pokemon.json', 'r') as file_hantle:
+            pokemons = read_from_json(file_hantle, json_backend=backend)
+        records = [pokemon_to_record(pokemon) for pokemon in pokemons]
+        expected = expected or records
+        assert records == expected
+
+
+def test_model_json_backends_dumps_sorted():
+    for backend in get_available_json_backends():
+        value = {'a': {'c': 'é', 'd': None}, 'b': [1, 2.5]}
+        first = backend.dumps_sorted(value)
+        second = backend.dumps_sorted(
+            {'b': [1, 2.5], 'a': {'d': None, 'c': 'é'}}
+            )
+        assert first == second
+        assert json.loads(first) == value
+        assert backend.dumps_sorted({'number': 2 ** 70}) != (
+            backend.dumps_sorted({'number': 2 ** 70 + 1})
+            )
@@ -0,0 +1,136 @@
+from model_overlay import (
+    read_overlay,
+    apply_overlay,
+    diff_databases,
+    write_overlay
+)
+from model_io import read_from_json, pokemon_to_record
+from classes import DataDoesNotExistError, MalformedPokemonDataError
+from io import StringIO
+from pytest import raises
+import json
+
+
+def load_pokemons():
+    with open('pokemon.json', 'r') as file_hantle:
+        return read_from_json(file_hantle)
+
+
+def write_overlay_string(rows):
+    file_hantle = StringIO()
+    write_overlay(rows, file_hantle)
+    return file_hantle.getvalue()
+
+
+def test_model_overlay_read_overlay():
+    rows = [{'pokedex_number': 25, 'stats': {'attack': 99}}]
+    assert read_overlay(StringIO(write_overlay_string(rows))) == rows
+
+
+def test_model_overlay_read_overlay_unsupported():
+    with raises(MalformedPokemonDataError):
+        read_overlay(StringIO('[]'))
+    with raises(MalformedPokemonDataError):
+        read_overlay(StringIO(json.dumps({
+            'overlay_format_version': 1, 'pokemon': [{'name': 'Pikachu'}]
+            })))
+
+
+def test_model_overlay_apply_overlay_patch():
+    pokemons = load_pokemons()
+    new_list = apply_overlay(pokemons, [
+        {'pokedex_number': 25, 'stats': {'attack': 99}, 'name': 'Pikachu2'}
+        ])
+    pikachu = new_list[24]
+    assert pikachu.get_base_attack() == 99
+    assert pikachu.get_name() == 'Pikachu2'
+    assert pikachu.get_base_hp() == pokemons[24].get_base_hp()
+    assert pokemons[24].get_base_attack() == 55
+    assert all(
+        new is old
+        for idx, (new, old) in enumerate(zip(new_list, pokemons))
+        if idx != 24
+        )
+
+
+def test_model_overlay_apply_overlay_add():
+    pokemons = load_pokemons()
+    record = pokemon_to_record(pokemons[0])
+    record['pokedex_number'] = 1000
+    record['name'] = 'Bulbasaurus'
+    new_list = apply_overlay(pokemons, [
+        record, {'pokedex_number': 1000, 'stats': {'hp': 1}}
+        ])
+    assert len(new_list) == 802
+    assert new_list[-1].get_name() == 'Bulbasaurus'
+    assert new_list[-1].get_base_hp() == 1
+    assert len(pokemons) == 801
+
+
+def test_model_overlay_apply_overlay_malformed():
+    pokemons = load_pokemons()
+    with raises(MalformedPokemonDataError) as error:
+        apply_overlay(pokemons, [
+            {'pokedex_number': 1, 'stats': {'hp': 1}},
+            {'pokedex_number': 2, 'stats': {'hp': -5}}
+            ])
+    assert 'row 2' in str(error.value)
+    with raises(MalformedPokemonDataError):
+        apply_overlay(pokemons, [{'pokedex_number': 1000, 'name': 'New'}])
+    with raises(MalformedPokemonDataError):
+        apply_overlay(pokemons, [{'pokedex_number': 1, 'color': 'red'}])
+
+
+def test_model_overlay_diff_databases(tmp_path):
+    with open('pokemon.json', 'r') as file_hantle:
+        rows = json.load(file_hantle)
+    rows[3]['stats']['speed'] = '70'
+    rows[3]['special_strength']['against_fire'] = '4'
+    added = dict(rows[0], pokedex_number='900', name='Newmon')
+    rows.append(added)
+    target_path = str(tmp_path / 'target.json')
+    with open(target_path, 'w') as file_hantle:
+        json.dump(rows, file_hantle)
+    overlay_rows = diff_databases('pokemon.json', target_path)
+    assert overlay_rows[0] == {
+        'pokedex_number': 4,
+        'stats': {'speed': 70},
+        'special_strength': {'against_fire': 4.0}
+    }
+    assert overlay_rows[1]['name'] == 'Newmon'
+    assert len(overlay_rows) == 2
+    new_list = apply_overlay(load_pokemons(), overlay_rows)
+    with open(target_path, 'r') as file_hantle:
+        assert [pokemon_to_record(pokemon) for pokemon in new_list] == [
+            pokemon_to_record(pokemon)
+            for pokemon in read_from_json(file_hantle)
+            ]
+
+
+def test_model_overlay_diff_databases_malformed_base_row(tmp_path):
+    with open('pokemon.json', 'r') as file_hantle:
+        rows = json.load(file_hantle)
+    rows[4]['name'] = ''
+    base_path = str(tmp_path / 'base.json')
+    with open(base_path, 'w') as file_hantle:
+        json.dump(rows, file_hantle)
+    rows[4]['name'] = 'Charmeleon'
+    target_path = str(tmp_path / 'target.json')
+    with open(target_path, 'w') as file_hantle:
+        json.dump(rows[4:5] + rows[:4] + rows[5:], file_hantle)
+    with raises(MalformedPokemonDataError, match='row 5:'):
+        diff_databases(base_path, target_path)
+
+
+def test_model_overlay_diff_databases_same_file():
+    assert diff_databases('pokemon.json', 'pokemon.json') == []
+
+
+def test_model_overlay_diff_databases_removed(tmp_path):
+    with open('pokemon.json', 'r') as file_hantle:
+        rows = json.load(file_hantle)
+    target_path = str(tmp_path / 'target.json')
+    with open(target_path, 'w') as file_hantle:
+        json.dump(rows[:-1], file_hantle)
+    with raises(DataDoesNotExistError):
+        diff_databases('pokemon.json', target_path)
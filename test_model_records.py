@@ -0,0 +1,100 @@
+from model_records import (
+    MAX_RECORD_POKEDEX_NUMBER,
+    write_record_file,
+    PokemonRecordFile
+)
+from model_io import (
+    JSON_FORMAT_V2,
+    io_return_valid_pokemon,
+    read_from_json,
+    pokemon_to_record
+)
+from classes import MalformedPokemonDataError
+from pytest import raises
+
+
+def load_pokemons():
+    with open('pokemon.json', 'r') as file_hantle:
+        return read_from_json(file_hantle)
+
+
+def write_correct_record_file(tmp_path, pokemons=None):
+    path = str(tmp_path / 'pokemon.pkdb')
+    write_record_file(pokemons or load_pokemons(), path)
+    return path
+
+
+def test_model_records_write_and_read_all(tmp_path):
+    pokemons = load_pokemons()
+    path = write_correct_record_file(tmp_path, pokemons)
+    record_file = PokemonRecordFile(path)
+    assert len(record_file) == 801
+    for pokemon, record_pokemon in zip(pokemons, record_file):
+        assert pokemon_to_record(record_pokemon) == pokemon_to_record(pokemon)
+    record_file.close()
+
+
+def test_model_records_get_pokemon(tmp_path):
+    record_file = PokemonRecordFile(write_correct_record_file(tmp_path))
+    pokemon = record_file.get_pokemon(25)
+    assert pokemon.get_name() == 'Pikachu'
+    assert pokemon.get_types() == ('electric', None)
+    assert record_file.get_pokemon(0) is None
+    assert record_file.get_pokemon(802) is None
+    record_file.close()
+
+
+def test_model_records_gaps_and_none_values(tmp_path):
+    pokemons = load_pokemons()
+    path = write_correct_record_file(tmp_path, [pokemons[0], pokemons[131]])
+    record_file = PokemonRecordFile(path)
+    assert len(record_file) == 2
+    assert record_file.get_pokemon(2) is None
+    ditto = record_file.get_pokemon(132)
+    assert ditto.get_other_dict()['percentage_male'] is None
+    assert list(record_file.iter_names()) == [(1, 'Bulbasaur'), (132, 'Ditto')]
+    record_file.close()
+
+
+def test_model_records_not_sorted(tmp_path):
+    pokemons = load_pokemons()
+    with raises(MalformedPokemonDataError):
+        write_correct_record_file(tmp_path, [pokemons[1], pokemons[0]])
+
+
+def renumber_pokemon(pokemon, pokedex_number):
+    record = pokemon_to_record(pokemon)
+    record['pokedex_number'] = pokedex_number
+    return io_return_valid_pokemon(record, 1, JSON_FORMAT_V2)
+
+
+def test_model_records_large_gap(tmp_path):
+    pokemons = load_pokemons()
+    path = write_correct_record_file(
+        tmp_path, [pokemons[0], renumber_pokemon(pokemons[1], 10000)]
+        )
+    record_file = PokemonRecordFile(path)
+    assert list(record_file.iter_names()) == [
+        (1, 'Bulbasaur'), (10000, 'Ivysaur')
+        ]
+    assert record_file.get_pokemon(9999) is None
+    record_file.close()
+
+
+def test_model_records_pokedex_number_too_large(tmp_path):
+    pokemons = load_pokemons()
+    too_large = renumber_pokemon(pokemons[1], MAX_RECORD_POKEDEX_NUMBER + 1)
+    with raises(MalformedPokemonDataError):
+        write_correct_record_file(tmp_path, [pokemons[0], too_large])
+
+
+def test_model_records_not_a_record_file():
+    with raises(MalformedPokemonDataError):
+        PokemonRecordFile('pokemon.json')
+
+
+def test_model_records_empty_file(tmp_path):
+    path = tmp_path / 'empty.pkdb'
+    path.write_bytes(b'')
+    with raises(MalformedPokemonDataError):
+        PokemonRecordFile(str(path))
@@ -0,0 +1,215 @@
+from model_schema import (
+    compile_pokemon_validator,
+    compile_section_validator,
+    SchemaSection,
+    POKEMON_SCHEMA
+)
+from model_io import (
+    io_convert_to_int,
+    io_return_if_positive,
+    io_return_if_valid_string,
+    io_return_if_valid_abilities_as_list,
+    io_return_valid_stats_dict,
+    io_return_valid_special_strength_dict,
+    io_return_valid_other_dict
+)
+from classes import (
+    RedundantKeyError,
+    InvalidDataLineLeghthError,
+    PokemonDataDoesNotExistError
+)
+from pytest import raises
+import copy
+import json
+import random
+
+
+def get_field(item, key):
+    # io_* chain throws bare KeyError for missing top-level field, compiled
+    # validator throws PokemonDataDoesNotExistError at the same point.
+    try:
+        return item[key]
+    except KeyError:
+        raise PokemonDataDoesNotExistError(
+            'Given row has no key: {!r}'.format(key)
+            )
+
+
+def validate_with_io_functions(item):
+    return (
+        io_return_if_positive(
+            io_convert_to_int(get_field(item, 'pokedex_number'))
+            ),
+        io_return_if_valid_string(get_field(item, 'name')),
+        io_return_if_valid_abilities_as_list(get_field(item, 'abilities')),
+        io_return_valid_stats_dict(get_field(item, 'stats')),
+        io_return_valid_special_strength_dict(
+            get_field(item, 'special_strength')
+            ),
+        io_return_valid_other_dict(get_field(item, 'other'))
+    )
+
+
+def get_result_or_error(validate, item):
+    try:
+        return validate(copy.deepcopy(item))
+    except Exception as e:
+        return (type(e), str(e))
+
+
+def load_first_row():
+    with open('pokemon.json', 'r') as file_hantle:
+        return json.load(file_hantle)[0]
+
+
+def make_corrupted_rows():
+    corruptions = [
+        ('pokedex_number', None, '1.5'),
+        ('pokedex_number', None, 'ala'),
+        ('pokedex_number', None, '-3'),
+        ('pokedex_number', None, '4.0'),
+        ('name', None, ''),
+        ('name', None, 15),
+        ('abilities', None, ''),
+        ('abilities', None, '[]'),
+        ('abilities', None, "['Overgrow', '']"),
+        ('abilities', None, "('Overgrow',)"),
+        ('abilities', None, 'Overgrow'),
+        ('stats', 'hp', '0'),
+        ('stats', 'speed', '12.5'),
+        ('stats', 'type1', ''),
+        ('stats', 'type2', ''),
+        ('stats', 'type2', 7),
+        ('stats', 'experience_growth', 'fast'),
+        ('special_strength', 'against_fire', '-1'),
+        ('special_strength', 'against_bug', 'x'),
+        ('other', 'percentage_male', ''),
+        ('other', 'weight_kg', '0'),
+        ('other', 'height_m', 'tall'),
+        ('other', 'generation', ''),
+        ('other', 'generation', '-1'),
+    ]
+    first_row = load_first_row()
+    rows = [first_row]
+    for section, key, value in corruptions:
+        row = copy.deepcopy(first_row)
+        if key is None:
+            row[section] = value
+        else:
+            row[section][key] = value
+        rows.append(row)
+    for section in ('stats', 'special_strength', 'other'):
+        row = copy.deepcopy(first_row)
+        row[section]['pipr_jest_spoko'] = '1'
+        rows.append(row)
+        row = copy.deepcopy(row)
+        row[section].pop(next(iter(row[section])))
+        rows.append(row)
+    row = copy.deepcopy(first_row)
+    row['special_strength'] = {
+        'against_fire': 'x', 'pipr': '1', **row['special_strength']
+        }
+    row['special_strength'].pop('against_bug')
+    row['special_strength'].pop('against_dark')
+    rows.append(row)
+    return rows
+
+
+def test_model_schema_same_results_as_io_functions():
+    validate = compile_pokemon_validator()
+    for row in make_corrupted_rows():
+        assert get_result_or_error(validate, row) == get_result_or_error(
+            validate_with_io_functions, row
+            )
+
+
+def test_model_schema_full_database_same_as_io_functions():
+    validate = compile_pokemon_validator()
+    with open('pokemon.json', 'r') as file_hantle:
+        data = json.load(file_hantle)
+    for row in data:
+        assert get_result_or_error(validate, row) == get_result_or_error(
+            validate_with_io_functions, row
+            )
+
+
+MUTATED_VALUES = (
+    None, True, 0, -1, 7, 1.5, '', '0', '-1', '1.5', 'x', 'abc', '7',
+    "['Overgrow']", [], ['x'], {}, {'x': 1}
+)
+
+
+def make_mutated_row(rng, first_row):
+    row = copy.deepcopy(first_row)
+    for _ in range(rng.randint(1, 3)):
+        key = rng.choice(list(first_row))
+        mutation = rng.choice(('delete', 'replace', 'section'))
+        if mutation == 'delete':
+            row.pop(key, None)
+        elif mutation == 'replace' or not isinstance(row.get(key), dict):
+            row[key] = rng.choice(MUTATED_VALUES)
+        else:
+            section = row[key]
+            section_key = rng.choice(list(first_row[key]))
+            section_mutation = rng.choice(('delete', 'replace', 'add'))
+            if section_mutation == 'delete':
+                section.pop(section_key, None)
+            elif section_mutation == 'replace':
+                section[section_key] = rng.choice(MUTATED_VALUES)
+            else:
+                section['pipr'] = rng.choice(MUTATED_VALUES)
+    return row
+
+
+def test_model_schema_mutated_rows_same_as_io_functions():
+    validate = compile_pokemon_validator()
+    rng = random.Random(0)
+    first_row = load_first_row()
+    for _ in range(3000):
+        row = make_mutated_row(rng, first_row)
+        assert get_result_or_error(validate, row) == get_result_or_error(
+            validate_with_io_functions, row
+            )
+
+
+def test_model_schema_missing_key_after_malformed_field():
+    validate = compile_pokemon_validator()
+    row = load_first_row()
+    row['name'] = ''
+    del row['other']
+    assert get_result_or_error(validate, row) == (
+        PokemonDataDoesNotExistError, 'Given value is empty'
+        )
+    del row['name']
+    assert get_result_or_error(validate, row) == (
+        PokemonDataDoesNotExistError, "Given row has no key: 'name'"
+        )
+
+
+def test_model_schema_non_dict_sections_same_as_io_functions():
+    validate = compile_pokemon_validator()
+    first_row = load_first_row()
+    for section in ('stats', 'special_strength', 'other'):
+        size = len(first_row[section])
+        keys = list(first_row[section])
+        for value in (None, 7, 1.5, True, '', 'x' * size, 'x' * (size + 1),
+                      [], keys, keys[::-1], [[1]] * size, [{}] + keys[1:],
+                      keys[:-1] + [None]):
+            row = copy.deepcopy(first_row)
+            row[section] = value
+            error = get_result_or_error(validate, row)
+            assert error == get_result_or_error(
+                validate_with_io_functions, row
+                )
+            assert isinstance(error[0], type)
+
+
+def test_model_schema_section_wrong_size():
+    validate = compile_section_validator(POKEMON_SCHEMA['other'])
+    with raises(InvalidDataLineLeghthError, match='not equal 4'):
+        validate({'generation': '1'})
+
+
+def test_model_schema_unknown_value_kind():
+    with raises(RedundantKeyError):
+        compile_section_validator(SchemaSection({'hp': 'complex_number'}))
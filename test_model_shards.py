@@ -0,0 +1,59 @@
+from model_shards import (
+    write_sharded_database,
+    read_manifest,
+    read_shard,
+    get_shard_file_name
+)
+from model_io import read_from_json, pokemon_to_record
+from classes import MalformedPokemonDataError
+from pytest import raises
+import json
+
+
+def load_pokemons():
+    with open('pokemon.json', 'r') as file_hantle:
+        return read_from_json(file_hantle)
+
+
+def write_correct_shards(tmp_path):
+    path = str(tmp_path / 'pokemon.manifest.json')
+    write_sharded_database(load_pokemons(), path)
+    return path
+
+
+def test_model_shards_get_shard_file_name():
+    assert get_shard_file_name('data/pokemon.manifest.json', 3) == (
+        'pokemon.gen3.json'
+        )
+
+
+def test_model_shards_write_and_read(tmp_path):
+    pokemons = load_pokemons()
+    path = write_correct_shards(tmp_path)
+    shards = read_manifest(path)
+    assert [shard['generation'] for shard in shards] == list(range(1, 8))
+    assert shards[0]['names'][24] == 'Pikachu'
+    assert 'fire' in shards[0]['types']
+    read_pokemons = [
+        pokemon for shard in shards for pokemon in read_shard(path, shard)
+        ]
+    assert [pokemon_to_record(pokemon) for pokemon in read_pokemons] == [
+        pokemon_to_record(pokemon) for pokemon in pokemons
+        ]
+
+
+def test_model_shards_shard_does_not_match_manifest(tmp_path):
+    path = write_correct_shards(tmp_path)
+    shards = read_manifest(path)
+    with raises(MalformedPokemonDataError):
+        read_shard(path, dict(shards[0], pokedex_numbers=[1]))
+
+
+def test_model_shards_malformed_manifest(tmp_path):
+    path = tmp_path / 'bad.manifest.json'
+    path.write_text(json.dumps({'format_version': 1, 'shards': [{}]}))
+    with raises(MalformedPokemonDataError):
+        read_manifest(str(path))
+    path.write_text('[1, 2')
+    with raises(MalformedPokemonDataError):
+        read_manifest(str(path))
@@ -0,0 +1,107 @@
+from multiprocessing import get_context
+from multiprocessing.shared_memory import SharedMemory
+from model_shared import (
+    SharedPokemonDatabase,
+    attach_shared_memory,
+    get_shared_memory_name,
+    get_shared_memory_path,
+    is_shared_memory_path
+)
+from model_records import PokemonRecordFile
+from model_io import read_from_json, pokemon_to_record
+from classes import MalformedPokemonDataError
+from database_sources import SharedMemoryPokemonSource
+from pytest import raises
+
+
+def load_pokemons():
+    with open('pokemon.json', 'r') as file_hantle:
+        return read_from_json(file_hantle)
+
+
+def test_model_shared_paths():
+    path = get_shared_memory_path('psm_test')
+    assert path == 'shm://psm_test'
+    assert is_shared_memory_path(path)
+    assert not is_shared_memory_path('pokemon.json')
+    assert get_shared_memory_name(path) == 'psm_test'
+
+
+def test_model_shared_publish_and_read():
+    pokemons = load_pokemons()
+    with SharedPokemonDatabase(pokemons) as shared:
+        assert len(shared) == 801
+        assert shared.get_path() == get_shared_memory_path(shared.get_name())
+        segment = attach_shared_memory(shared.get_name())
+        record_file = PokemonRecordFile(buffer=segment.buf)
+        assert len(record_file) == 801
+        assert record_file.get_pokemon(25).get_name() == 'Pikachu'
+        for pokemon, shared_pokemon in zip(pokemons, record_file):
+            assert pokemon_to_record(shared_pokemon) == (
+                pokemon_to_record(pokemon)
+                )
+        record_file.close()
+        segment.close()
+
+
+def test_model_shared_close_unlinks_segment():
+    shared = SharedPokemonDatabase(load_pokemons()[:10])
+    name = shared.get_name()
+    assert not shared.is_closed()
+    shared.close()
+    assert shared.is_closed()
+    shared.close()
+    with raises(FileNotFoundError):
+        SharedMemory(name=name)
+
+
+def test_model_shared_garbage_collected_owner_unlinks_segment():
+    shared = SharedPokemonDatabase(load_pokemons()[:10])
+    name = shared.get_name()
+    del shared
+    with raises(FileNotFoundError):
+        attach_shared_memory(name)
+
+
+def test_model_shared_unsorted_pokemons():
+    pokemons = load_pokemons()
+    with raises(MalformedPokemonDataError):
+        SharedPokemonDatabase([pokemons[1], pokemons[0]])
+
+
+def test_model_shared_source_survives_owner_close():
+    shared = SharedPokemonDatabase(load_pokemons())
+    source = SharedMemoryPokemonSource(shared.get_name())
+    shared.close()
+    assert source.get_pokemon_using_pokedex_number(6).get_name() == (
+        'Charizard'
+        )
+    source.close()
+
+
+def read_shared_pokemon(args):
+    path, pokedex_number = args
+    from database import PokemonDatabase
+    database = PokemonDatabase(path)
+    pokemon = database.get_pokemon_using_pokedex_number(pokedex_number)
+    result = (pokemon.get_name(), pokemon.get_base_attack())
+    database._get_pokemon_source().close()
+    return result
+
+
+def test_model_shared_process_pool_workers():
+    pokemons = load_pokemons()
+    with SharedPokemonDatabase(pokemons) as shared:
+        # Workers are spawned, forking pytest process with running
+        # threads of other tests could deadlock.
+        with get_context('spawn').Pool(2) as pool:
+            results = pool.map(read_shared_pokemon, [
+                (shared.get_path(), number) for number in (1, 25, 801)
+            ])
+        assert results == [
+            (pokemons[number - 1].get_name(),
+             pokemons[number - 1].get_base_attack())
+            for number in (1, 25, 801)
+        ]
+        segment = attach_shared_memory(shared.get_name())
+        segment.close()
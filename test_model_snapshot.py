@@ -0,0 +1,68 @@
+from model_snapshot import (
+    get_snapshot_path,
+    get_source_file_key,
+    read_snapshot,
+    write_snapshot,
+    SNAPSHOT_MAGIC
+)
+from model_io import read_from_json
+import os
+import shutil
+
+
+def load_test_pokemon_list():
+    with open('pokemon.json', 'r') as file_hantle:
+        return read_from_json(file_hantle)[:3]
+
+
+def test_model_snapshot_get_snapshot_path():
+    assert get_snapshot_path('pokemon.json') == 'pokemon.json.snapshot'
+
+
+def test_model_snapshot_get_source_file_key_changes_with_content(tmp_path):
+    path = str(tmp_path / 'pokemon.json')
+    shutil.copy('pokemon.json', path)
+    key = get_source_file_key(path)
+    with open(path, 'a') as file_hantle:
+        file_hantle.write(' ')
+    assert get_source_file_key(path) != key
+
+
+def test_model_snapshot_write_and_read_typical(tmp_path):
+    path = str(tmp_path / 'pokemon.json.snapshot')
+    key = (10, 20, 'hash')
+    write_snapshot(path, key, load_test_pokemon_list())
+    pokemon_list = read_snapshot(path, key)
+    assert len(pokemon_list) == 3
+    assert pokemon_list[0].get_name() == 'Bulbasaur'
+    assert pokemon_list[0].get_special_strength_value('fire') == 2.0
+
+
+def test_model_snapshot_read_not_existing_file(tmp_path):
+    path = str(tmp_path / 'pokemon.json.snapshot')
+    assert read_snapshot(path, (10, 20, 'hash')) is None
+
+
+def test_model_snapshot_read_different_key_removes_file(tmp_path):
+    path = str(tmp_path / 'pokemon.json.snapshot')
+    write_snapshot(path, (10, 20, 'hash'), load_test_pokemon_list())
+    assert read_snapshot(path, (10, 20, 'other_hash')) is None
+    assert not os.path.exists(path)
+
+
+def test_model_snapshot_read_different_version_removes_file(tmp_path):
+    path = str(tmp_path / 'pokemon.json.snapshot')
+    write_snapshot(path, (10, 20, 'hash'), load_test_pokemon_list())
+    with open(path, 'r+b') as file_hantle:
+        file_hantle.seek(len(SNAPSHOT_MAGIC))
+        file_hantle.write(b'\xff\xff')
+    assert read_snapshot(path, (10, 20, 'hash')) is None
+    assert not os.path.exists(path)
+
+
+def test_model_snapshot_read_corrupted_file_removes_file(tmp_path):
+    path = str(tmp_path / 'pokemon.json.snapshot')
+    with open(path, 'wb') as file_hantle:
+        file_hantle.write(b'definitely not a snapshot')
+    assert read_snapshot(path, (10, 20, 'hash')) is None
+    assert not os.path.exists(path)
@@ -0,0 +1,90 @@
+from model_sqlite import write_sqlite_file, PokemonSqliteFile
+from model_io import read_from_json, pokemon_to_record
+from classes import MalformedPokemonDataError
+from pytest import raises
+import sqlite3
+
+
+def load_pokemons():
+    with open('pokemon.json', 'r') as file_hantle:
+        return read_from_json(file_hantle)
+
+
+def write_correct_sqlite_file(tmp_path, pokemons=None):
+    path = str(tmp_path / 'pokemon.sqlite')
+    write_sqlite_file(pokemons or load_pokemons(), path)
+    return path
+
+
+def test_model_sqlite_write_and_read_all(tmp_path):
+    pokemons = load_pokemons()
+    sqlite_file = PokemonSqliteFile(write_correct_sqlite_file(tmp_path))
+    assert len(sqlite_file) == 801
+    for pokemon, sqlite_pokemon in zip(pokemons, sqlite_file):
+        assert pokemon_to_record(sqlite_pokemon) == pokemon_to_record(pokemon)
+    sqlite_file.close()
+
+
+def test_model_sqlite_lookups(tmp_path):
+    sqlite_file = PokemonSqliteFile(write_correct_sqlite_file(tmp_path))
+    assert sqlite_file.get_pokemon(25).get_name() == 'Pikachu'
+    assert sqlite_file.get_pokemon(900) is None
+    assert sqlite_file.get_pokemon_using_name('PIKACHU').get_name() == (
+        'Pikachu'
+        )
+    assert sqlite_file.get_pokemon_using_name('Porygon2').get_name() == (
+        'Porygon2'
+        )
+    assert sqlite_file.get_pokemon_using_name('Nothing') is None
+    sqlite_file.close()
+
+
+def test_model_sqlite_searches_match_list(tmp_path):
+    pokemons = load_pokemons()
+    sqlite_file = PokemonSqliteFile(write_correct_sqlite_file(tmp_path))
+    names = [pokemon.get_name() for pokemon in sqlite_file.search_name('cha')]
+    assert names == [
+        pokemon.get_name() for pokemon in pokemons
+        if 'cha' in pokemon.get_name().lower()
+        ]
+    names = [pokemon.get_name() for pokemon in sqlite_file.search_name('. ')]
+    assert names == ['Mr. Mime']
+    assert sqlite_file.search_name('^pi') == []
+    numbers = [pokemon.get_pokedex_number()
+               for pokemon in sqlite_file.search_pokedex_number(56)]
+    assert numbers[0] == 56
+    assert numbers[1:] == [156, 256, 356, 456, 556, 560, 561, 562, 563, 564,
+                           565, 566, 567, 568, 569, 656, 756]
+    fire = sqlite_file.search_type('fire')
+    assert fire == sorted(fire, key=lambda pokemon: (
+        pokemon.get_pokedex_number()
+        ))
+    assert len(fire) == len([
+        pokemon for pokemon in pokemons if 'fire' in pokemon.get_types()
+        ])
+    sqlite_file.close()
+
+
+def test_model_sqlite_import_is_one_transaction(tmp_path):
+    path = write_correct_sqlite_file(tmp_path)
+
+    def broken_pokemons():
+        yield from load_pokemons()[:10]
+        raise MalformedPokemonDataError('Broken row')
+    with raises(MalformedPokemonDataError):
+        write_sqlite_file(broken_pokemons(), path)
+    sqlite_file = PokemonSqliteFile(path)
+    assert len(sqlite_file) == 801
+    sqlite_file.close()
+
+
+def test_model_sqlite_not_a_pokemon_database(tmp_path):
+    path = str(tmp_path / 'other.sqlite')
+    sqlite3.connect(path).close()
+    with raises(MalformedPokemonDataError):
+        PokemonSqliteFile(path)
+
+
+def test_model_sqlite_file_not_found(tmp_path):
+    with raises(FileNotFoundError):
+        PokemonSqliteFile(str(tmp_path / 'missing.sqlite'))
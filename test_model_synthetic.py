@@ -0,0 +1,101 @@
+from model_synthetic import (
+    read_reference_rows,
+    iter_synthetic_rows,
+    iter_synthetic_names,
+    write_synthetic_database,
+    MALFORMATIONS
+)
+from model_io import (
+    open_json_file,
+    read_from_json,
+    write_rows_to_json,
+    JSON_FORMAT_V1,
+    JSON_FORMAT_V2
+)
+from database import PokemonDatabase
+from classes import MalformedPokemonDataError
+from io import StringIO
+from pytest import raises
+
+
+reference = read_reference_rows()
+
+
+def test_model_synthetic_same_seed_same_rows():
+    rows = list(iter_synthetic_rows(reference, 200, seed=7))
+    assert rows == list(iter_synthetic_rows(reference, 200, seed=7))
+    assert rows != list(iter_synthetic_rows(reference, 200, seed=8))
+
+
+def test_model_synthetic_names():
+    reference_names = [item['name'] for item in reference[0]]
+    names = list(iter_synthetic_names(reference_names, 2000, seed=3))
+    assert names == list(iter_synthetic_names(reference_names, 2000, seed=3))
+    assert len({name.casefold() for name in names}) == 2000
+    assert all(name for name in names)
+
+
+def test_model_synthetic_rows_are_valid():
+    for format_version in (JSON_FORMAT_V1, JSON_FORMAT_V2):
+        file_hantle = StringIO()
+        write_rows_to_json(
+            iter_synthetic_rows(reference, 2000, seed=1,
+                                format_version=format_version),
+            file_hantle, format_version
+            )
+        pokemons = read_from_json(StringIO(file_hantle.getvalue()))
+        assert [pokemon.get_pokedex_number() for pokemon in pokemons] == (
+            list(range(1, 2001))
+            )
+        names = {pokemon.get_name().casefold() for pokemon in pokemons}
+        assert len(names) == 2000
+
+
+def test_model_synthetic_weaknesses_match_types():
+    real_weaknesses = {}
+    for record in reference[1]:
+        types = (record['stats']['type1'], record['stats']['type2'])
+        real_weaknesses.setdefault(types, []).append(
+            record['special_strength']
+            )
+    for item in iter_synthetic_rows(reference, 500, seed=3,
+                                    format_version=JSON_FORMAT_V2):
+        types = (item['stats']['type1'], item['stats']['type2'])
+        assert item['special_strength'] in real_weaknesses[types]
+
+
+def test_model_synthetic_malformed_rows():
+    for name, malform in MALFORMATIONS.items():
+        rows = list(iter_synthetic_rows(reference, 20, seed=2))
+        malform(rows[11])
+        file_hantle = StringIO()
+        write_rows_to_json(rows, file_hantle, JSON_FORMAT_V1)
+        with raises(MalformedPokemonDataError) as error:
+            read_from_json(StringIO(file_hantle.getvalue()))
+        assert 'row 12:' in str(error.value)
+
+
+def test_model_synthetic_write_database(tmp_path):
+    path = str(tmp_path / 'synthetic.json.gz')
+    assert write_synthetic_database(path, 3000, seed=5,
+                                    format_version=JSON_FORMAT_V2) == []
+    database = PokemonDatabase(path, use_snapshot=False)
+    assert len(database.get_pokemon_database_list()) == 3000
+
+
+def test_model_synthetic_write_database_malformed(tmp_path):
+    path = str(tmp_path / 'synthetic.json')
+    malformed_rows = write_synthetic_database(path, 100, seed=5,
+                                              malformed_count=3)
+    assert len(malformed_rows) == 3
+    assert malformed_rows == sorted(malformed_rows)
+    with open_json_file(path) as file_hantle:
+        with raises(MalformedPokemonDataError) as error:
+            read_from_json(file_hantle)
+    assert 'row {}:'.format(malformed_rows[0]) in str(error.value)
+
+
+def test_model_synthetic_write_database_too_many_malformed(tmp_path):
+    with raises(ValueError):
+        write_synthetic_database(str(tmp_path / 'synthetic.json'), 10,
+                                 malformed_count=11)
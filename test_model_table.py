@@ -0,0 +1,81 @@
+import json
+import pytest
+from io import StringIO
+from model_table import (
+    PokemonTable,
+    get_type_code,
+    TYPE_CODE_NONE,
+    TYPE_CODE_UNKNOWN
+)
+from model_schema import POKEMON_TYPES
+from model_io import read_from_json
+
+numpy = pytest.importorskip('numpy')
+
+
+def load_pokemons():
+    with open('pokemon.json', 'r') as file_hantle:
+        return read_from_json(file_hantle)
+
+
+def test_model_table_get_type_code():
+    assert get_type_code('bug') == 0
+    assert get_type_code('water') == len(POKEMON_TYPES) - 1
+    assert get_type_code(None) == TYPE_CODE_NONE
+    assert get_type_code('sound') == TYPE_CODE_UNKNOWN
+
+
+def test_model_table_columns_match_pokemons():
+    pokemons = load_pokemons()
+    table = PokemonTable(pokemons)
+    assert len(table) == 801
+    assert table.weakness.shape == (801, 18)
+    assert table.weakness.dtype == numpy.float32
+    bulbasaur = pokemons[0]
+    assert table.pokedex_number[0] == 1
+    assert table.hp[0] == bulbasaur.get_base_hp()
+    assert table.attack[0] == bulbasaur.get_base_attack()
+    assert table.defense[0] == bulbasaur.get_base_defense()
+    assert table.speed[0] == bulbasaur.get_base_speed()
+    assert table.generation[0] == 1
+    assert table.type1[0] == get_type_code('grass')
+    assert table.type2[0] == get_type_code('poison')
+    assert table.weakness[0, get_type_code('fire')] == 2.0
+    assert table.weakness[0, get_type_code('grass')] == 0.25
+
+
+def test_model_table_is_read_only():
+    table = PokemonTable(load_pokemons())
+    with pytest.raises(ValueError):
+        table.hp[0] = 1
+    with pytest.raises(ValueError):
+        table.weakness[0, 0] = 1
+
+
+def test_model_table_vectorised_queries():
+    pokemons = load_pokemons()
+    table = PokemonTable(pokemons)
+    mask = table.get_type_mask('dragon')
+    assert table.get_pokemons(mask) == [
+        pokemon for pokemon in pokemons if 'dragon' in pokemon.get_types()
+        ]
+    weak_to_fire = table.get_weakness_column('fire') > 1
+    assert [pokemon.get_name() for pokemon in table.get_pokemons(
+        numpy.flatnonzero(weak_to_fire)[:2]
+        )] == ['Bulbasaur', 'Ivysaur']
+
+
+def test_model_table_empty():
+    table = PokemonTable([])
+    assert len(table) == 0
+    assert table.weakness.shape == (0, 18)
+
+
+def test_model_table_large_values_do_not_overflow():
+    with open('pokemon.json', 'r') as file_hantle:
+        rows = json.load(file_hantle)[:1]
+    rows[0]['pokedex_number'] = 2 ** 40
+    rows[0]['stats']['hp'] = 2 ** 33
+    table = PokemonTable(read_from_json(StringIO(json.dumps(rows))))
+    assert table.pokedex_number[0] == 2 ** 40
+    assert table.hp[0] == 2 ** 33
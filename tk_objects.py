@@ -31,6 +31,7 @@ class TkPokemonSelectWindow:
             from JSON file and row where it was found.
         """
         self._database = PokemonDatabase(DATABASE_PATH)
+        self._search_session = self._database.create_search_session()
         self._database_values = self.get_full_database()
         self._database_tree_view = None
         self._window = None
@@ -188,8 +189,7 @@ class TkPokemonSelectWindow:
             database_tree (ttk.Treeview): Active widget with database
         """
         self.set_selected_pokemon(None)
-        for elem in database_tree.get_children():
-            database_tree.delete(elem)
+        database_tree.delete(*database_tree.get_children())
         data = self.get_database_values()
         if data:
             for elem in data:
@@ -226,13 +226,21 @@ class TkPokemonSelectWindow:
         self.terminate_window()
 
     def search_database(self, query: str, database_tree: ttk.Treeview):
-        """Searches database using given query and updates TreeView
+        """Searches database using given query and updates TreeView.
+        Search session filters previous results when query is extended,
+        so it can be called after every typed character. When no name
+        contains query, pokemons with the closest names are shown.
 
         Args:
             query (str): Any search input
             database_tree (ttk.Treeview): ttk.Treeview with database vals
         """
-        data = self._database.search_database(query)
+        data = self._search_session.search(query)
+        if data is None and query.strip() and not query.strip().isdigit():
+            # Name may be misspelled, closest names are shown instead
+            data = self._database.search_name_fuzzy(query)
+        if data is self.get_database_values():
+            return
         self._set_database_values(data)
         self._change_values_in_listbox(database_tree)
 
@@ -258,6 +266,7 @@ class TkPokemonSelectWindow:
         functions inside this class.
         """
         self._set_chosen_pokemon(None)
+        self._search_session.reset()
         self._set_database_values(self.get_full_database())
 
         win = tk.Tk()
@@ -312,6 +321,9 @@ class TkPokemonSelectWindow:
             row=0, column=0, sticky=tk.W
             )
         query_input = tk.StringVar()
+        # List is filtered live, after every change of query
+        query_input.trace_add('write', lambda *args: self.search_database(
+            query_input.get(), self._get_tree_view()))
         search = tk.Entry(search_frame, textvariable=query_input, width=30)
         search_button = tk.Button(
             search_frame, text="Search",